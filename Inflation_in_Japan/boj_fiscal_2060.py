@@ -10,6 +10,8 @@ from matplotlib.patches import FancyBboxPatch
 import warnings
 warnings.filterwarnings('ignore')
 
+from scenario_cube import HIST, HIST_YEARS, PATHS, PROJ_YEARS, build_cube
+
 # Japanese font for Windows
 import platform
 if platform.system() == 'Windows':
@@ -22,40 +24,30 @@ else:
 plt.rcParams['axes.unicode_minus'] = False
 
 # =============================================================================
-# Historical Data (1990-2025)
-# =============================================================================
-hist_years = np.array([1990, 1995, 2000, 2005, 2010, 2015, 2020, 2025])
-jgb_hist = np.array([166, 225, 368, 527, 637, 807, 945, 1080])  # 兆円
-boj_hist = np.array([25, 38, 55, 90, 75, 282, 500, 576])  # 兆円
-rate_hist = np.array([6.9, 4.8, 2.9, 1.6, 1.3, 1.0, 0.8, 0.9])  # %
-tax_hist = np.array([60.1, 52.1, 50.7, 49.1, 41.5, 56.3, 60.8, 75.2])  # 兆円
-usdjpy_hist = np.array([145, 94, 108, 110, 88, 121, 107, 157])  # 円/ドル
-
-# =============================================================================
-# Projections (2025-2060)
+# Historical Data (1990-2025) / Projections (2025-2060) - scenario_cube に一本化
 # =============================================================================
-proj_years = np.arange(2025, 2065, 5)
-
-# JGB projections
-jgb_proj = np.array([1080, 1150, 1220, 1280, 1330, 1370, 1400, 1420])
-
-# BOJ Holdings - 3 scenarios
-boj_exit = np.array([576, 500, 400, 320, 260, 220, 200, 180])  # 正常化
-boj_hold = np.array([576, 600, 620, 640, 660, 680, 700, 720])  # 現状維持
-boj_expand = np.array([576, 650, 750, 850, 950, 1050, 1100, 1150])  # 拡大
-
-# Interest rate scenarios
-rate_normal = np.array([0.9, 1.5, 2.0, 2.3, 2.5, 2.5, 2.5, 2.5])  # 正常化
-rate_low = np.array([0.9, 1.0, 1.2, 1.3, 1.5, 1.5, 1.5, 1.5])  # 低金利継続
-
-# Tax revenue projection
-tax_proj = np.array([75.2, 82, 90, 98, 105, 112, 118, 124])
+hist_years = HIST_YEARS
+jgb_hist, boj_hist, rate_hist = HIST['jgb'], HIST['boj'], HIST['rate']  # 兆円, 兆円, %
+tax_hist, usdjpy_hist = HIST['tax'], HIST['usdjpy']  # 兆円, 円/ドル
+
+proj_years = PROJ_YEARS
+
+# 日銀保有 × 金利（税収は中位パス、名目3%成長）
+cube = build_cube({
+    'exit': {'boj': 'exit', 'rate': 'normal', 'tax': 'moderate'},     # 正常化
+    'hold': {'boj': 'hold', 'rate': 'low', 'tax': 'moderate'},        # 現状維持
+    'expand': {'boj': 'expand', 'rate': 'normal', 'tax': 'moderate'},  # 拡大
+})
+jgb_proj = PATHS['jgb']['base']
+boj_exit, boj_hold, boj_expand = (PATHS['boj'][k] for k in ('exit', 'hold', 'expand'))
+rate_normal, rate_low = PATHS['rate']['normal'], PATHS['rate']['low']
+tax_proj = PATHS['tax']['moderate']
 
 # USD/JPY scenarios
-usdjpy_strong = np.array([157, 145, 135, 130, 125, 120, 118, 115])  # 円高
-usdjpy_base = np.array([157, 150, 145, 140, 138, 135, 133, 130])  # 正常化
-usdjpy_weak = np.array([157, 165, 175, 185, 195, 200, 200, 200])  # 円安継続
-usdjpy_crisis = np.array([157, 180, 200, 220, 240, 250, 250, 250])  # 危機
+usdjpy_strong = PATHS['usdjpy']['strong']  # 円高
+usdjpy_base = PATHS['usdjpy']['base']  # 正常化
+usdjpy_weak = PATHS['usdjpy']['weak']  # 円安継続
+usdjpy_crisis = PATHS['usdjpy']['crisis']  # 危機
 
 C = {'good': '#27ae60', 'bad': '#e74c3c', 'warn': '#f39c12', 'blue': '#3498db', 
      'purple': '#9b59b6', 'panel': '#16213e'}
@@ -63,9 +55,8 @@ C = {'good': '#27ae60', 'bad': '#e74c3c', 'warn': '#f39c12', 'blue': '#3498db',
 # =============================================================================
 # GDP projection for Debt/GDP ratio
 # =============================================================================
-gdp_2025 = 600  # 兆円
-gdp_proj = gdp_2025 * (1.03) ** (np.arange(8) * 5)  # 名目3%成長（統合ダッシュボードと統一）
-debt_gdp = jgb_proj / gdp_proj * 100
+gdp_proj = cube.view('gdp', 'exit')  # 名目3%成長（統合ダッシュボードと統一）
+debt_gdp = cube.view('debt_gdp', 'exit')
 
 # =============================================================================
 # Figure: 6-Panel Dashboard
@@ -179,8 +170,8 @@ ax4.set_title('④ 利払い費シナリオ', color='white', fontsize=15, fontwe
 
 # Calculate interest payments
 int_hist = jgb_hist * rate_hist / 100
-int_normal = jgb_proj * rate_normal / 100
-int_low = jgb_proj * rate_low / 100
+int_normal = cube.view('interest', 'exit')
+int_low = cube.view('interest', 'hold')
 
 ax4.bar(hist_years, int_hist, width=4, color=C['warn'], alpha=0.7, label='実績')
 ax4.bar(proj_years[1:], int_normal[1:], width=4, color=C['bad'], alpha=0.4, hatch='//', label='正常化(2.5%)')
@@ -207,8 +198,8 @@ ax5 = fig.add_axes([0.37, 0.08, 0.28, 0.32], facecolor=C['panel'])
 ax5.set_title('⑤ 利払い費 / 税収 比率', color='white', fontsize=15, fontweight='bold')
 
 int_tax_hist = int_hist / tax_hist * 100
-int_tax_normal = int_normal / tax_proj * 100
-int_tax_low = int_low / tax_proj * 100
+int_tax_normal = cube.view('interest_tax_ratio', 'exit')
+int_tax_low = cube.view('interest_tax_ratio', 'hold')
 
 ax5.plot(hist_years, int_tax_hist, 'o-', color='white', lw=3, markersize=6, label='実績')
 ax5.plot(proj_years, int_tax_normal, 's--', color=C['bad'], lw=2.5, markersize=5, label='正常化シナリオ')
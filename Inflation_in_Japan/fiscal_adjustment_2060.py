@@ -10,6 +10,8 @@ from matplotlib import font_manager
 import warnings
 warnings.filterwarnings('ignore')
 
+from scenario_cube import build_cube
+
 # Japanese font for Windows
 import platform
 if platform.system() == 'Windows':
@@ -24,39 +26,40 @@ plt.rcParams['axes.unicode_minus'] = False
 # =============================================================================
 # 2060年シナリオ別データ（統合ダッシュボードと同じ前提）
 # =============================================================================
+cube = build_cube({
+    'optimistic': {'tax': 'optimistic', 'other_expenditure': 'settled'},  # 楽観：名目成長3%（賃金追随込み）
+    'baseline': {'tax': 'baseline', 'other_expenditure': 'settled'},      # 中央：現状維持（名目成長1%）
+    'pessimistic': {'tax': 'pessimistic', 'other_expenditure': 'settled'},  # 悲観：デフレ回帰
+})
+y2060 = cube.at(2060)
+
 # 税収予測
-tax_optimistic = 175  # 楽観：名目成長3%（賃金追随込み）
-tax_baseline = 92     # 中央：現状維持（名目成長1%）
-tax_pessimistic = 50  # 悲観：デフレ回帰
+tax_optimistic, tax_baseline, tax_pessimistic = y2060['tax']  # 175 / 92 / 50
 
 # PB対象歳出（利払い除き）- FY2024決算ベースから推計
-expenditure = 124  # 社会保障62 + その他62（決算ベース115兆からの推計）
+expenditure = y2060.at['optimistic', 'expenditure']  # 社会保障62 + その他62（決算ベース115兆からの推計）
 
 # 利払い（ストレス試算: 1420兆円 × 2.5%）
-jgb_2060 = 1420  # 兆円
-rate = 2.5  # %
-interest = jgb_2060 * rate / 100  # 35.5兆円
+jgb_2060 = y2060.at['optimistic', 'jgb']  # 兆円
+rate = y2060.at['optimistic', 'rate']  # %
+interest = y2060.at['optimistic', 'interest']  # 35.5兆円
 
 # =============================================================================
 # 財政調整必要額の計算
 # =============================================================================
 # PB（基礎的財政収支）ベース
-pb_opt = tax_optimistic - expenditure  # +53
-pb_base = tax_baseline - expenditure    # -30
-pb_pess = tax_pessimistic - expenditure # -72
+pb_opt, pb_base, pb_pess = y2060['primary_balance']  # +51 / -32 / -74
 
 # PB均衡に必要な調整額（楽観シナリオとの差）
-pb_adjustment_base = abs(pb_base)  # 30兆円
-pb_adjustment_pess = abs(pb_pess)  # 72兆円
+pb_adjustment_base = abs(pb_base)  # 32兆円
+pb_adjustment_pess = abs(pb_pess)  # 74兆円
 
 # 利払い込み収支
-total_opt = pb_opt - interest     # +17.5
-total_base = pb_base - interest   # -65.5
-total_pess = pb_pess - interest   # -107.5
+total_opt, total_base, total_pess = y2060['fiscal_balance']  # +15.5 / -67.5 / -109.5
 
 # 利払い込み均衡に必要な調整額
-total_adjustment_base = abs(total_base)  # 65.5兆円
-total_adjustment_pess = abs(total_pess)  # 107.5兆円
+total_adjustment_base = abs(total_base)  # 67.5兆円
+total_adjustment_pess = abs(total_pess)  # 109.5兆円
 
 C = {'good': '#27ae60', 'bad': '#e74c3c', 'warn': '#f39c12', 'blue': '#3498db', 'panel': '#16213e'}
 
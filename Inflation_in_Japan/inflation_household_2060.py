@@ -1,6 +1,9 @@
 #!/usr/bin/env python3
 """
 年2%インフレが年収500万円の人に与える影響（〜2060年版）+ USD/JPY
+
+全国の世帯数は人口エンジンの世帯推計（japan_households_projection_2100_v3.csv、
+世帯主の年齢区分別）から読み、1世帯あたりの購買力の目減りを全国の合計に換算する
 """
 
 import matplotlib.pyplot as plt
@@ -9,6 +12,8 @@ from matplotlib import font_manager
 import warnings
 warnings.filterwarnings('ignore')
 
+from scenario_cube import household_counts
+
 # Japanese font for Windows
 import platform
 if platform.system() == 'Windows':
@@ -37,6 +42,16 @@ income_flat = np.full(35, float(initial_income))  # 賃金据置
 real_up = (income_up / price) / (initial_income / 100) * 100
 real_flat = (income_flat / price) / (initial_income / 100) * 100
 
+# 全国換算（世帯主の年齢区分別、万世帯）
+# 全世帯が年収500万円の家計と同じ目減りを受けるとした概算（2026年の円建て）
+households = (household_counts().groupby(['Year', 'Householder_Age'])['Households'].sum()
+              .unstack().loc[start_year + years])                     # (年, 年齢区分)
+loss_per_household_flat = income_flat * (1 - real_flat / 100)          # 万円/世帯・年
+national_loss_flat = households.mul(loss_per_household_flat, axis=0) / 1e4  # 兆円/年
+print("賃金据置の場合の実質購買力の目減り（全国、兆円/年・2026年の円建て、世帯主の年齢別）:")
+print(national_loss_flat.loc[[2030, 2040, 2050, 2060]].assign(計=national_loss_flat.sum(axis=1))
+      .round(1).to_string())
+
 # USD/JPY projection (base case: gradual normalization from 157 to 130)
 usdjpy_2026 = 157
 usdjpy_2060_base = 130
@@ -79,6 +94,7 @@ assumptions = """【前提・定義】
 • 賃金連動: 賃金もインフレ率と同率で上昇
 • 賃金据置: 名目賃金が固定（実質減少）
 • 為替: 楽観130円/危機200円（シナリオ仮置き）
+• 全国換算: 世帯数推計（人口エンジン）×1世帯の目減り
 • ※金利差縮小・経常黒字で円高、
   財政不安・金融緩和継続で円安"""
 fig.text(0.70, 0.93, assumptions, fontsize=11, color='white', va='top',
@@ -119,6 +135,11 @@ ax2.tick_params(colors='white', labelsize=11); ax2.grid(alpha=0.2)
 ax2.legend(loc='lower left', facecolor=C['panel'], labelcolor='white', fontsize=11)
 ax2.text(0.97, 0.95, '34年後\n購買力51%', transform=ax2.transAxes, va='top', ha='right',
          color='white', fontsize=12, bbox=dict(facecolor=C['bad'], alpha=0.4, boxstyle='round'))
+ax2.text(0.97, 0.78, f'全国{households.loc[2060].sum():,.0f}万世帯では\n'
+         f'2060年に計{national_loss_flat.loc[2060].sum():.0f}兆円/年の目減り\n'
+         f'（うち世帯主65歳以上 {national_loss_flat.loc[2060, ["65-74歳", "75歳以上"]].sum():.0f}兆円）',
+         transform=ax2.transAxes, va='top', ha='right', color='white', fontsize=11,
+         bbox=dict(facecolor=C['panel'], alpha=0.8, boxstyle='round', edgecolor=C['bad']))
 
 # Panel 3: USD/JPY予測
 ax3 = fig.add_axes([0.69, 0.48, 0.28, 0.32], facecolor=C['panel'])
@@ -11,6 +11,8 @@ from matplotlib.patches import FancyBboxPatch
 import warnings
 warnings.filterwarnings('ignore')
 
+from scenario_cube import HIST, HIST_YEARS, PATHS, PROJ_YEARS, WORKING_AGE_PROJ, build_cube
+
 # Japanese font for Windows
 import platform
 if platform.system() == 'Windows':
@@ -27,25 +29,28 @@ plt.rcParams['axes.unicode_minus'] = False
 # =============================================================================
 
 # Historical years
-hist_years = np.array([1990, 1995, 2000, 2005, 2010, 2015, 2020, 2025])
+hist_years = HIST_YEARS
 
 # JGB/Fiscal historical data
-jgb_outstanding_hist = np.array([166, 225, 368, 527, 637, 807, 945, 1080])  # 兆円
-boj_holdings_hist = np.array([25, 38, 55, 90, 75, 282, 500, 576])  # 兆円
+jgb_outstanding_hist = HIST['jgb']  # 兆円
+boj_holdings_hist = HIST['boj']  # 兆円
 boj_share_hist = np.array([15.1, 16.9, 14.9, 17.1, 11.8, 34.9, 52.9, 53.3])  # %
-avg_interest_rate_hist = np.array([6.9, 4.8, 2.9, 1.6, 1.3, 1.0, 0.8, 0.9])  # %
-tax_revenue_hist = np.array([60.1, 52.1, 50.7, 49.1, 41.5, 56.3, 60.8, 75.2])  # 兆円
+avg_interest_rate_hist = HIST['rate']  # %
+tax_revenue_hist = HIST['tax']  # 兆円
 
 # USD/JPY historical (annual average)
-usdjpy_hist = np.array([145, 94, 108, 110, 88, 121, 107, 157])  # 円/ドル
+usdjpy_hist = HIST['usdjpy']  # 円/ドル
 
 # Working-age population ratio (15-64歳比率) - IPSS 2023年推計に基づく
-working_age_hist = np.array([69.5, 69.4, 67.9, 65.8, 63.7, 60.6, 59.2, 59.3])  # %
+working_age_hist = HIST['working_age']  # %
 
 # =============================================================================
 # Projection Years (2025-2060)
 # =============================================================================
-proj_years = np.arange(2025, 2061, 5)  # 5年刻み
+proj_years = PROJ_YEARS  # 5年刻み
+
+# 日銀出口・金利正常化・税収中位（インフレ分）、名目3%成長
+cube = build_cube({'base': {'boj': 'exit', 'rate': 'normal', 'tax': 'moderate', 'gdp_growth': 'nominal3'}})
 
 # Scenario assumptions for projections:
 # - 2% inflation target achieved
@@ -53,25 +58,23 @@ proj_years = np.arange(2025, 2061, 5)  # 5年刻み
 # - Demographic decline continues per IPSS projections
 
 # GDP projection (nominal, assuming 2% inflation + 1% real growth = 3% nominal)
-gdp_2025 = 600  # 兆円
-gdp_growth_rate = 0.03  # 3% nominal（統合ダッシュボードと統一）
-gdp_proj = gdp_2025 * (1 + gdp_growth_rate) ** (proj_years - 2025)
+gdp_proj = cube.view('gdp', 'base')  # 3% nominal（統合ダッシュボードと統一）
 
 # JGB Outstanding projection (assuming primary deficit continues, slower growth)
-jgb_proj = np.array([1080, 1150, 1220, 1280, 1330, 1370, 1400, 1420])  # 兆円
+jgb_proj = PATHS['jgb']['base']  # 兆円
 
 # BOJ Holdings projection (gradual reduction scenario - exit success)
-boj_holdings_proj = np.array([576, 500, 400, 320, 260, 220, 200, 180])  # 兆円（他図と統一）
-boj_share_proj = boj_holdings_proj / jgb_proj * 100
+boj_holdings_proj = PATHS['boj']['exit']  # 兆円（他図と統一）
+boj_share_proj = cube.view('boj_share', 'base')
 
 # Interest rate projection (gradual normalization)
-interest_rate_proj = np.array([0.9, 1.5, 2.0, 2.3, 2.5, 2.5, 2.5, 2.5])  # %
+interest_rate_proj = PATHS['rate']['normal']  # %
 
 # Tax revenue projection (with inflation)
-tax_proj = np.array([75.2, 82, 90, 98, 105, 112, 118, 124])  # 兆円
+tax_proj = PATHS['tax']['moderate']  # 兆円
 
 # Working-age population projection (15-64歳比率) - IPSS 2023年推計(出生中位×死亡中位)
-working_age_proj = np.array([59.3, 58.5, 56.9, 55.4, 54.1, 53.5, 53.1, 52.8])  # %
+working_age_proj = WORKING_AGE_PROJ  # %
 
 # USD/JPY Projection Scenarios
 # Base case: gradual weakening due to interest rate differential narrowing
@@ -79,9 +82,9 @@ working_age_proj = np.array([59.3, 58.5, 56.9, 55.4, 54.1, 53.5, 53.1, 52.8])  #
 # Scenario B: Stagflation - JPY continues weakening to 180-200
 # Scenario C: Crisis - JPY collapse to 200+
 
-usdjpy_base = np.array([157, 150, 145, 140, 138, 135, 133, 130])  # Base (normalization)
-usdjpy_weak = np.array([157, 165, 175, 185, 190, 195, 200, 200])  # Weak JPY (stagflation)
-usdjpy_crisis = np.array([157, 180, 200, 220, 230, 240, 250, 250])  # Crisis scenario
+usdjpy_base = PATHS['usdjpy']['base']  # Base (normalization)
+usdjpy_weak = PATHS['usdjpy']['weak_gradual']  # Weak JPY (stagflation)
+usdjpy_crisis = PATHS['usdjpy']['crisis_gradual']  # Crisis scenario
 
 # =============================================================================
 # Combined arrays for plotting
@@ -103,9 +106,7 @@ C = {
 # =============================================================================
 # GDP projection for Debt/GDP ratio
 # =============================================================================
-gdp_2025 = 600  # 兆円
-gdp_proj_for_debt = gdp_2025 * (1.03) ** (np.arange(8) * 5)  # 名目3%成長（統合ダッシュボードと統一）
-debt_gdp = jgb_proj / gdp_proj_for_debt * 100
+debt_gdp = cube.view('debt_gdp', 'base')  # 名目3%成長（統合ダッシュボードと統一）
 
 # =============================================================================
 # Figure 1: Comprehensive Dashboard to 2060
@@ -213,7 +214,7 @@ ax3.set_title('③ 金利と利払い費の長期予測', fontsize=17, fontweigh
 
 # Calculate interest payments
 interest_payment_hist = jgb_outstanding_hist * avg_interest_rate_hist / 100
-interest_payment_proj = jgb_proj * interest_rate_proj / 100
+interest_payment_proj = cube.view('interest', 'base')
 
 ax3b = ax3.twinx()
 
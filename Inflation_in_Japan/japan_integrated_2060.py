@@ -10,6 +10,8 @@ from matplotlib import font_manager
 import warnings
 warnings.filterwarnings('ignore')
 
+from scenario_cube import HIST, HIST_YEARS, PATHS, PROJ_YEARS, WORKING_AGE_PROJ, build_cube
+
 # Japanese font for Windows
 import platform
 if platform.system() == 'Windows':
@@ -24,42 +26,49 @@ plt.rcParams['axes.unicode_minus'] = False
 # =============================================================================
 # Data
 # =============================================================================
-hist_years = np.array([1990, 1995, 2000, 2005, 2010, 2015, 2020, 2025])
-proj_years = np.arange(2025, 2065, 5)
+hist_years = HIST_YEARS
+proj_years = PROJ_YEARS
+
+# 税収3シナリオ（名目成長 3% / 1% / 0%）× 日銀出口・金利正常化、歳出は決算ベース
+cube = build_cube({
+    'optimistic': {'tax': 'optimistic', 'gdp_growth': 'nominal3', 'other_expenditure': 'settled'},
+    'baseline': {'tax': 'baseline', 'gdp_growth': 'nominal1', 'other_expenditure': 'settled'},
+    'pessimistic': {'tax': 'pessimistic', 'gdp_growth': 'zero', 'other_expenditure': 'settled'},
+})
 
 # JGB & BOJ
-jgb_hist = np.array([166, 225, 368, 527, 637, 807, 945, 1080])
-boj_hist = np.array([25, 38, 55, 90, 75, 282, 500, 576])
-jgb_proj = np.array([1080, 1150, 1220, 1280, 1330, 1370, 1400, 1420])
-boj_exit = np.array([576, 500, 400, 320, 260, 220, 200, 180])
+jgb_hist = HIST['jgb']
+boj_hist = HIST['boj']
+jgb_proj = PATHS['jgb']['base']
+boj_exit = PATHS['boj']['exit']
 
 # Interest rates
-rate_hist = np.array([6.9, 4.8, 2.9, 1.6, 1.3, 1.0, 0.8, 0.9])
-rate_proj = np.array([0.9, 1.5, 2.0, 2.3, 2.5, 2.5, 2.5, 2.5])
+rate_hist = HIST['rate']
+rate_proj = PATHS['rate']['normal']
 
 # Tax Revenue
-tax_hist = np.array([60.1, 52.1, 50.7, 49.1, 41.5, 56.3, 60.8, 75.2])
-tax_optimistic = np.array([75.2, 87, 100, 115, 130, 145, 160, 175])
-tax_baseline = np.array([75.2, 80, 85, 88, 90, 91, 92, 92])
-tax_pessimistic = np.array([75.2, 73, 70, 66, 62, 58, 54, 50])
+tax_hist = HIST['tax']
+tax_optimistic = PATHS['tax']['optimistic']
+tax_baseline = PATHS['tax']['baseline']
+tax_pessimistic = PATHS['tax']['pessimistic']
 
 # Expenditure (PB対象歳出 = 決算歳出総額123兆 - 利払費等7.9兆 ≈ 115兆)
-social_security_proj = np.array([38.0, 42, 47, 52, 56, 59, 61, 62])
-other_exp = np.array([77.0, 75, 73, 71, 69, 67, 64, 62])  # 決算ベースに修正
-expenditure_proj = social_security_proj + other_exp  # 2025: 115兆, 2060: 124兆
+social_security_proj = PATHS['social_security']['aging']
+other_exp = PATHS['other_expenditure']['settled']  # 決算ベースに修正
+expenditure_proj = cube.view('expenditure', 'optimistic')  # 2025: 115兆, 2060: 124兆
 
 # Interest payments
 interest_hist = jgb_hist * rate_hist / 100
-interest_proj = jgb_proj * rate_proj / 100
+interest_proj = cube.view('interest', 'optimistic')
 
 # USD/JPY
-usdjpy_hist = np.array([145, 94, 108, 110, 88, 121, 107, 157])
-usdjpy_base = np.array([157, 150, 145, 140, 138, 135, 133, 130])
-usdjpy_weak = np.array([157, 165, 175, 185, 195, 200, 200, 200])
+usdjpy_hist = HIST['usdjpy']
+usdjpy_base = PATHS['usdjpy']['base']
+usdjpy_weak = PATHS['usdjpy']['weak']
 
 # Working-age population (15-64歳比率) - IPSS 2023年推計に基づく
-working_age_hist = np.array([69.5, 69.4, 67.9, 65.8, 63.7, 60.6, 59.2, 59.3])
-working_age_proj = np.array([59.3, 58.5, 56.9, 55.4, 54.1, 53.5, 53.1, 52.8])
+working_age_hist = HIST['working_age']
+working_age_proj = WORKING_AGE_PROJ
 
 C = {'good': '#27ae60', 'bad': '#e74c3c', 'warn': '#f39c12', 'blue': '#3498db', 
      'purple': '#9b59b6', 'panel': '#16213e'}
@@ -67,11 +76,10 @@ C = {'good': '#27ae60', 'bad': '#e74c3c', 'warn': '#f39c12', 'blue': '#3498db',
 # =============================================================================
 # GDP projection for Debt/GDP ratio
 # =============================================================================
-gdp_2025 = 600  # 兆円
-gdp_proj_opt = gdp_2025 * (1.03) ** (np.arange(8) * 5)  # 楽観: 名目3%成長
-gdp_proj_base = gdp_2025 * (1.01) ** (np.arange(8) * 5)  # 現状維持: 名目1%成長
-debt_gdp_opt = jgb_proj / gdp_proj_opt * 100
-debt_gdp_base = jgb_proj / gdp_proj_base * 100
+gdp_proj_opt = cube.view('gdp', 'optimistic')  # 楽観: 名目3%成長
+gdp_proj_base = cube.view('gdp', 'baseline')  # 現状維持: 名目1%成長
+debt_gdp_opt = cube.view('debt_gdp', 'optimistic')
+debt_gdp_base = cube.view('debt_gdp', 'baseline')
 
 # =============================================================================
 # Figure 1: 8-Panel Comprehensive Dashboard
@@ -239,9 +247,7 @@ ax6 = fig.add_axes(panels[5], facecolor=C['panel'])
 ax6.set_title('⑥ 利払い費 / 税収 比率', color='white', fontsize=14, fontweight='bold')
 
 int_tax_hist = interest_hist / tax_hist * 100
-int_tax_opt = interest_proj / tax_optimistic * 100
-int_tax_base = interest_proj / tax_baseline * 100
-int_tax_pess = interest_proj / tax_pessimistic * 100
+int_tax_opt, int_tax_base, int_tax_pess = cube.view('interest_tax_ratio')
 
 ax6.plot(hist_years, int_tax_hist, 'o-', color='white', lw=2, markersize=4, label='実績')
 ax6.plot(proj_years, int_tax_opt, 's--', color=C['good'], lw=2, markersize=3, label='楽観')
@@ -269,9 +275,7 @@ ax6.text(2058, int_tax_pess[-1]+3, f'{int_tax_pess[-1]:.0f}%', color=C['bad'], f
 ax7 = fig.add_axes(panels[6], facecolor=C['panel'])
 ax7.set_title('⑦ 基礎的財政収支（PB）', color='white', fontsize=14, fontweight='bold')
 
-fb_opt = tax_optimistic - expenditure_proj
-fb_base = tax_baseline - expenditure_proj
-fb_pess = tax_pessimistic - expenditure_proj
+fb_opt, fb_base, fb_pess = cube.view('primary_balance')
 
 ax7.axhline(0, color='white', ls='-', lw=1, alpha=0.5)
 ax7.fill_between(proj_years, 0, fb_opt, where=fb_opt>0, color=C['good'], alpha=0.3)
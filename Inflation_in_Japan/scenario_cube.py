@@ -0,0 +1,507 @@
+#!/usr/bin/env python3
+"""
+2060年シナリオの入力パスと派生指標を (シナリオ × 年 × 変数) の配列で一括計算するエンジン
+Scenario cube engine for the 2060 fiscal dashboards
+
+- 各スクリプトが個別に持っていた予測パス（国債残高・日銀保有・金利・税収・為替・歳出）を
+  ここに一本化し、シナリオは「軸ごとのパス名」の組で指定する
+- 入力を cube (S, Y, V_in) に積み、利払い費・日銀保有比率・PB・債務/GDP などの派生指標を
+  broadcast の1パスで全シナリオ同時に計算する（数千シナリオでも同じ計算量の配列演算）
+- ダッシュボードには読み取り専用のビューを返す（図の側で値を書き換えられない）
+- 税収・名目GDPの基盤は人口エンジンの労働力推計（japan_population_projection/labour_force.py）
+  から作る就業者数の指数（labour 軸）で、生産年齢人口比率の代わりに使う
+- 軸ごとのパスの全組み合わせ（直積）は ScenarioGrid で遅延評価し、2060年の
+  利払い/税収・PB・債務/GDP で上位 k 組を argpartition で選ぶ
+  為替（usdjpy）はどの派生指標にも入らず、日銀保有（boj）は日銀保有比率にしか入らないため、
+  ランキングの3指標はこの2軸によらない（指標に効かない軸）。各指標は効く軸だけで順位を付け、
+  効かない軸は CSV の axes 列で '*'（どのパスでも同じ値）と明記する。各行が表す直積の組数と
+  同値の組数も書く（python scenario_cube.py → 13_summary_2060_top_*.csv）
+"""
+
+from __future__ import annotations
+import argparse
+import importlib
+import sys
+from dataclasses import dataclass, field
+from pathlib import Path
+import numpy as np
+import pandas as pd
+
+# =============================================================================
+# Historical Data (1990-2025)
+# =============================================================================
+HIST_YEARS = np.array([1990, 1995, 2000, 2005, 2010, 2015, 2020, 2025])
+HIST = {
+    'jgb': np.array([166, 225, 368, 527, 637, 807, 945, 1080]),            # 兆円
+    'boj': np.array([25, 38, 55, 90, 75, 282, 500, 576]),                  # 兆円
+    'rate': np.array([6.9, 4.8, 2.9, 1.6, 1.3, 1.0, 0.8, 0.9]),            # %
+    'tax': np.array([60.1, 52.1, 50.7, 49.1, 41.5, 56.3, 60.8, 75.2]),     # 兆円
+    'usdjpy': np.array([145, 94, 108, 110, 88, 121, 107, 157]),            # 円/ドル
+    'working_age': np.array([69.5, 69.4, 67.9, 65.8, 63.7, 60.6, 59.2, 59.3]),  # %
+}
+
+# =============================================================================
+# Projection Paths (2025-2060, 5年刻み)
+# =============================================================================
+PROJ_YEARS = np.arange(2025, 2065, 5)
+GDP_2025 = 600  # 兆円
+
+# 生産年齢人口比率（15-64歳、%）- IPSS 2023年推計（出生中位×死亡中位）。図の表示用
+WORKING_AGE_PROJ = np.array([59.3, 58.5, 56.9, 55.4, 54.1, 53.5, 53.1, 52.8])
+
+# =============================================================================
+# Labour Force (japan_population_projection)
+# =============================================================================
+POPULATION_DIR = Path(__file__).resolve().parent.parent / 'japan_population_projection'
+POPULATION_OUTDIR = POPULATION_DIR / 'output_demographics_v3'
+
+# labour 軸のパス名 → 労働力推計の参加シナリオ（labour_force.PARTICIPATION_SCENARIOS）
+LABOUR_SCENARIOS = {'status_quo': '現状維持', 'gradual': '労働参加漸進', 'advanced': '労働参加進展'}
+
+
+def population_module(name: str):
+    """japan_population_projection のモジュールを import する（初回に sys.path へ追加）"""
+    if str(POPULATION_DIR) not in sys.path:
+        sys.path.append(str(POPULATION_DIR))
+    return importlib.import_module(name)
+
+
+def population_output(filename: str, module: str, builder: str) -> pd.DataFrame:
+    """
+    人口スクリプトが書き出した CSV（japan_population_projection で実行したときの
+    output_demographics_v3/filename）を読む。まだ書き出されていなければ
+    同じ表を返す module.builder()（キャッシュ付き）から作る
+    """
+    path = POPULATION_OUTDIR / filename
+    if path.exists():
+        return pd.read_csv(path, encoding='utf-8-sig')
+    return getattr(population_module(module), builder)()
+
+
+def labour_force_table() -> pd.DataFrame:
+    """労働力推計（Scenario, Year, Employment, …）"""
+    return population_output('japan_labour_force_projection_2100_v3.csv',
+                             'labour_force', 'labour_force_projection')
+
+
+def household_counts() -> pd.DataFrame:
+    """世帯数推計（Year, Type, Householder_Age, Households（万世帯））"""
+    return population_output('japan_households_projection_2100_v3.csv',
+                             'household_projection', 'household_projection')
+
+
+def tax_base_index(years: np.ndarray = PROJ_YEARS) -> dict[str, np.ndarray]:
+    """
+    labour 軸のパス: 税収基盤指数 = 参加シナリオの就業者数 / 現状維持の就業者数
+
+    税収・名目GDPのパスは現状の労働力率のままの就業者数の推移（人口減の影響）を織り込んだ
+    水準とみなし、労働参加が進んで就業者数が増える分だけ比例して増やす（2025年は全シナリオ 1）
+    """
+    df = labour_force_table()
+    employment = df.pivot(index='Year', columns='Scenario', values='Employment').loc[years]
+    base = employment[LABOUR_SCENARIOS['status_quo']].to_numpy()
+    return {name: employment[scenario].to_numpy() / base for name, scenario in LABOUR_SCENARIOS.items()}
+
+
+# 軸 → {パス名: 年次パス}（gdp_growth のみ名目成長率のスカラー）
+PATHS = {
+    'jgb': {
+        'base': np.array([1080, 1150, 1220, 1280, 1330, 1370, 1400, 1420]),
+    },
+    'boj': {
+        'exit': np.array([576, 500, 400, 320, 260, 220, 200, 180]),        # 正常化
+        'hold': np.array([576, 600, 620, 640, 660, 680, 700, 720]),        # 現状維持
+        'expand': np.array([576, 650, 750, 850, 950, 1050, 1100, 1150]),   # 拡大
+    },
+    'rate': {
+        'normal': np.array([0.9, 1.5, 2.0, 2.3, 2.5, 2.5, 2.5, 2.5]),      # 正常化
+        'low': np.array([0.9, 1.0, 1.2, 1.3, 1.5, 1.5, 1.5, 1.5]),         # 低金利継続
+    },
+    'tax': {
+        'optimistic': np.array([75.2, 87, 100, 115, 130, 145, 160, 175]),  # 名目成長3%（賃金追随込み）
+        'baseline': np.array([75.2, 80, 85, 88, 90, 91, 92, 92]),          # 現状維持（名目成長1%）
+        'pessimistic': np.array([75.2, 73, 70, 66, 62, 58, 54, 50]),       # デフレ回帰
+        'moderate': np.array([75.2, 82, 90, 98, 105, 112, 118, 124]),      # インフレ分の増収のみ
+    },
+    'usdjpy': {
+        'strong': np.array([157, 145, 135, 130, 125, 120, 118, 115]),      # 円高
+        'base': np.array([157, 150, 145, 140, 138, 135, 133, 130]),        # 正常化
+        'weak': np.array([157, 165, 175, 185, 195, 200, 200, 200]),        # 円安継続
+        'crisis': np.array([157, 180, 200, 220, 240, 250, 250, 250]),      # 危機
+        'weak_gradual': np.array([157, 165, 175, 185, 190, 195, 200, 200]),
+        'crisis_gradual': np.array([157, 180, 200, 220, 230, 240, 250, 250]),
+    },
+    'gdp_growth': {
+        'nominal3': 0.03,   # インフレ2% + 実質1%
+        'nominal1': 0.01,
+        'zero': 0.0,
+    },
+    'labour': tax_base_index(),                                            # 税収基盤指数（就業者数）
+    'social_security': {
+        'aging': np.array([38.0, 42, 47, 52, 56, 59, 61, 62]),             # 高齢化で増加
+    },
+    'other_expenditure': {
+        'restrained': np.array([74.0, 72, 70, 68, 66, 64, 62, 60]),        # その他は抑制
+        'settled': np.array([77.0, 75, 73, 71, 69, 67, 64, 62]),           # 決算ベース（2025: 115兆）
+    },
+}
+
+# 軸ごとの既定のパス（シナリオ指定で省略した軸に使う）
+DEFAULT_SPEC = {
+    'jgb': 'base', 'boj': 'exit', 'rate': 'normal', 'tax': 'baseline', 'usdjpy': 'base',
+    'gdp_growth': 'nominal3', 'labour': 'status_quo', 'social_security': 'aging',
+    'other_expenditure': 'restrained',
+}
+
+# 2060年サマリー（13_summary_2060_scenarios.csv）の3シナリオ
+SCENARIOS = {
+    'optimistic_normalization': {'boj': 'exit', 'rate': 'normal', 'tax': 'optimistic',
+                                 'usdjpy': 'strong', 'gdp_growth': 'nominal3'},
+    'baseline_status_quo': {'boj': 'hold', 'rate': 'low', 'tax': 'baseline',
+                            'usdjpy': 'weak', 'gdp_growth': 'nominal1'},
+    'pessimistic_crisis': {'boj': 'expand', 'rate': 'normal', 'tax': 'pessimistic',
+                           'usdjpy': 'crisis', 'gdp_growth': 'zero'},
+}
+
+# 直積評価の既定の軸（3 BOJ × 2 金利 × 4 為替 × 3 税収 × 3 名目成長 × 3 労働参加 = 648通り）
+# 派生指標に為替は入らず、日銀保有は日銀保有比率にしか入らない（ランキングの3指標には効かない）。
+# ランキングでは指標ごとに効く軸だけの直積に縮約する
+# （利払い/税収: 金利 × 税収 × 労働参加、PB: 税収 × 労働参加、債務/GDP: 名目成長 × 労働参加）
+CARTESIAN_AXES = {
+    'boj': ('exit', 'hold', 'expand'),
+    'rate': ('normal', 'low'),
+    'usdjpy': ('strong', 'base', 'weak', 'crisis'),
+    'tax': ('optimistic', 'baseline', 'pessimistic'),
+    'gdp_growth': ('nominal3', 'nominal1', 'zero'),
+    'labour': ('status_quo', 'gradual', 'advanced'),
+}
+
+for _arr in [*HIST.values(), WORKING_AGE_PROJ, *(p for paths in PATHS.values() for p in paths.values())]:
+    if isinstance(_arr, np.ndarray):
+        _arr.flags.writeable = False
+
+# =============================================================================
+# Variables
+# =============================================================================
+INPUTS = ('jgb', 'boj', 'rate', 'tax', 'usdjpy', 'gdp', 'labour', 'social_security', 'other_expenditure')
+DERIVED = ('interest', 'boj_share', 'market_holdings', 'expenditure', 'primary_balance',
+           'fiscal_balance', 'interest_tax_ratio', 'debt_gdp')
+VARIABLES = INPUTS + DERIVED
+
+# 入力変数 → パスの軸（それ以外は同名）
+INPUT_AXIS = {'gdp': 'gdp_growth'}
+
+# ランキング指標 → 良い方向（'min' = 小さいほど良い）
+RANK_METRICS = {'interest_tax_ratio': 'min', 'primary_balance': 'max', 'debt_gdp': 'min'}
+
+# 13_summary_2060_scenarios.csv の列 ← 変数（fiscal_balance 列は既存の行と同じく PB）
+# 末尾の debt_gdp_pct は債務/GDP のランキングで並べ替えの指標を示すために追加
+SUMMARY_COLUMNS = {
+    'jgb_trillion': 'jgb',
+    'boj_holdings_trillion': 'boj',
+    'boj_share_pct': 'boj_share',
+    'interest_rate_pct': 'rate',
+    'interest_payment_trillion': 'interest',
+    'tax_revenue_trillion': 'tax',
+    'fiscal_balance_trillion': 'primary_balance',
+    'interest_tax_ratio_pct': 'interest_tax_ratio',
+    'usdjpy': 'usdjpy',
+    'debt_gdp_pct': 'debt_gdp',
+}
+
+# シナリオ名に使う軸の短い名前（例: low_rate_optimistic_tax。ない軸は軸名のまま）
+SCENARIO_AXIS_LABELS = {
+    'boj': 'boj', 'rate': 'rate', 'usdjpy': 'yen', 'tax': 'tax', 'gdp_growth': 'growth',
+    'labour': 'participation', 'jgb': 'jgb', 'social_security': 'social_security',
+    'other_expenditure': 'other_expenditure',
+}
+
+
+def gdp_path(growth, years: np.ndarray = PROJ_YEARS) -> np.ndarray:
+    """名目GDP（兆円）= GDP_2025 × (1 + g)^(年 − 2025)。growth (...,) → (..., Y)"""
+    growth = np.asarray(growth, dtype=float)
+    return GDP_2025 * (1 + growth[..., None]) ** (years - years[0])
+
+
+def resolve(axis: str, value) -> np.ndarray:
+    """パス名または配列 → 入力パス (Y,)（gdp_growth は名目GDPのパスに変換）"""
+    path = PATHS[axis][value] if isinstance(value, str) else value
+    if axis == 'gdp_growth':
+        return gdp_path(path)
+    return np.broadcast_to(np.asarray(path, dtype=float), PROJ_YEARS.shape)
+
+
+def scale_tax_base(inputs: dict[str, np.ndarray]) -> dict[str, np.ndarray]:
+    """税収・名目GDPのパスに税収基盤指数（labour）を掛けた入力（互いに broadcast 可）"""
+    return {**inputs, 'tax': inputs['tax'] * inputs['labour'], 'gdp': inputs['gdp'] * inputs['labour']}
+
+
+def derive_variables(jgb, boj, rate, tax, usdjpy, gdp, labour, social_security,
+                     other_expenditure) -> tuple[np.ndarray, ...]:
+    """
+    入力（互いに broadcast 可、tax・gdp は scale_tax_base() 済み）→ 派生指標（DERIVED の順）
+
+    interest:           利払い費 = 国債残高 × 金利（ストレス試算: 全残高に同じ金利）
+    primary_balance:    PB = 税収 − PB対象歳出（利払い除き）
+    fiscal_balance:     財政収支 = PB − 利払い費
+    interest_tax_ratio: 利払い費 / 税収（%）
+    debt_gdp:           国債残高 / 名目GDP（%）
+    """
+    interest = jgb * rate / 100
+    expenditure = social_security + other_expenditure
+    primary = tax - expenditure
+    return (
+        interest,
+        boj / jgb * 100,
+        jgb - boj,
+        expenditure,
+        primary,
+        primary - interest,
+        interest / tax * 100,
+        jgb / gdp * 100,
+    )
+
+
+def derive(inputs: np.ndarray) -> np.ndarray:
+    """入力 (..., Y, len(INPUTS)) → 派生指標 (..., Y, len(DERIVED))"""
+    return np.stack(derive_variables(*np.moveaxis(inputs, -1, 0)), axis=-1)
+
+
+@dataclass(frozen=True)
+class ScenarioCube:
+    """
+    シナリオ × 年 × 変数の配列（読み取り専用）
+
+    values: (S, Y, len(VARIABLES))  変数の順序は VARIABLES
+    """
+    names: tuple[str, ...]
+    years: np.ndarray
+    values: np.ndarray
+
+    def view(self, variable: str, scenario: str | None = None) -> np.ndarray:
+        """変数の読み取り専用ビュー: (S, Y)、scenario を指定すれば (Y,)"""
+        out = self.values[..., VARIABLES.index(variable)]
+        return out if scenario is None else out[self.names.index(scenario)]
+
+    def scenario(self, name: str) -> dict[str, np.ndarray]:
+        """1シナリオの全変数（読み取り専用の (Y,) ビュー）"""
+        s = self.names.index(name)
+        return {v: self.values[s, :, i] for i, v in enumerate(VARIABLES)}
+
+    def at(self, year: int) -> pd.DataFrame:
+        """指定年の全シナリオ × 全変数"""
+        y = int(np.flatnonzero(self.years == year)[0])
+        return pd.DataFrame(self.values[:, y], index=list(self.names), columns=list(VARIABLES))
+
+    def frame(self) -> pd.DataFrame:
+        """縦持ち（scenario, year, 変数…）"""
+        s, y = np.meshgrid(np.arange(len(self.names)), np.arange(len(self.years)), indexing='ij')
+        df = pd.DataFrame(self.values.reshape(-1, len(VARIABLES)), columns=list(VARIABLES))
+        df.insert(0, 'year', self.years[y.ravel()])
+        df.insert(0, 'scenario', np.asarray(self.names)[s.ravel()])
+        return df
+
+
+def build_cube(scenarios: dict[str, dict] = SCENARIOS) -> ScenarioCube:
+    """
+    シナリオ指定 {名前: {軸: パス名 or 配列}} から cube を作る（省略した軸は DEFAULT_SPEC）
+
+    入力を (S, Y, len(INPUTS)) に積み、派生指標は derive() の1回の呼び出しで全シナリオ分を計算
+    """
+    rows = []
+    for spec in scenarios.values():
+        spec = {**DEFAULT_SPEC, **spec}
+        inputs = scale_tax_base({v: resolve(INPUT_AXIS.get(v, v), spec[INPUT_AXIS.get(v, v)])
+                                 for v in INPUTS})
+        rows.append(np.stack([inputs[v] for v in INPUTS], axis=-1))
+    inputs = np.stack(rows)                                         # (S, Y, V_in)
+    values = np.concatenate([inputs, derive(inputs)], axis=-1)
+    values.flags.writeable = False
+    return ScenarioCube(names=tuple(scenarios), years=PROJ_YEARS.copy(), values=values)
+
+
+# =============================================================================
+# Cartesian Evaluation
+# =============================================================================
+@dataclass(frozen=True)
+class ScenarioGrid:
+    """
+    軸ごとのパスの直積（組み合わせを展開しない）
+
+    axes: {軸: パス名のタプル}（順序 = グリッドの次元）、spec: それ以外の軸のパス名
+    invariant: reduce() で既定のパス1本に縮めた軸 → 元のパス名（その指標はどのパスでも同じ値）
+    入力は軸ごとのパス (n_軸, Y) を np.ix_ の開いた添字グリッドで引いた
+    (1, …, n_軸, …, 1) の配列のまま持ち、派生指標を計算するときに初めて
+    グリッド全体の形 shape に broadcast される
+    """
+    axes: dict[str, tuple[str, ...]]
+    spec: dict[str, str]
+    invariant: dict[str, tuple[str, ...]] = field(default_factory=dict)
+
+    @property
+    def shape(self) -> tuple[int, ...]:
+        return tuple(len(names) for names in self.axes.values())
+
+    @property
+    def size(self) -> int:
+        return int(np.prod(self.shape))
+
+    def inputs(self, year: int) -> dict[str, np.ndarray]:
+        """指定年の入力変数（グリッドの軸は長さ n_軸、それ以外の次元は長さ1。tax・gdp は scale_tax_base() 済み）"""
+        y = int(np.flatnonzero(PROJ_YEARS == year)[0])
+        index = dict(zip(self.axes, np.ix_(*(np.arange(n) for n in self.shape))))
+        out = {}
+        for v in INPUTS:
+            axis = INPUT_AXIS.get(v, v)
+            if axis in self.axes:
+                paths = np.stack([resolve(axis, name)[y] for name in self.axes[axis]])
+                out[v] = paths[index[axis]]
+            else:
+                out[v] = np.broadcast_to(resolve(axis, self.spec[axis])[y], (1,) * len(self.shape))
+        return scale_tax_base(out)
+
+    def evaluate(self, year: int = 2060) -> dict[str, np.ndarray]:
+        """指定年の全変数（派生指標は shape、入力は broadcast 前の形）"""
+        inputs = self.inputs(year)
+        derived = derive_variables(*(inputs[v] for v in INPUTS))
+        return {**inputs, **dict(zip(DERIVED, derived))}
+
+    def effective_axes(self, metric: str, year: int = 2060) -> tuple[str, ...]:
+        """metric の値がパスによって変わる軸（他の軸をどこに固定しても同じ値になる軸は除く）"""
+        value = self.evaluate(year)[metric]
+        return tuple(axis for d, axis in enumerate(self.axes)
+                     if value.shape[d] > 1 and np.ptp(value, axis=d).max() > 0)
+
+    def reduce(self, metric: str, year: int = 2060) -> 'ScenarioGrid':
+        """metric に効かない軸を spec（既定のパス）1本に縮めた直積（軸の順序・次元は保つ）"""
+        keep = self.effective_axes(metric, year)
+        return ScenarioGrid(
+            axes={a: names if a in keep else (self.spec[a],) for a, names in self.axes.items()},
+            spec=self.spec,
+            invariant={**self.invariant, **{a: names for a, names in self.axes.items() if a not in keep}},
+        )
+
+    @property
+    def multiplicity(self) -> int:
+        """1つの組が表す元の直積の組数（縮めた軸のパス数の積）"""
+        return int(np.prod([len(names) for names in self.invariant.values()]))
+
+    def scenario_names(self, flat_index) -> list[str]:
+        """平坦化した位置 → シナリオ名（13_summary_2060_scenarios.csv と同じ snake_case、例: low_rate_optimistic_tax）"""
+        pos = np.unravel_index(np.atleast_1d(flat_index), self.shape)
+        return ['_'.join(f'{names[i[j]]}_{SCENARIO_AXIS_LABELS.get(axis, axis)}'
+                         for (axis, names), i in zip(self.axes.items(), pos) if axis not in self.invariant)
+                for j in range(len(pos[0]))]
+
+    def axis_labels(self, flat_index) -> list[str]:
+        """平坦化した位置 → 'boj=*, rate=low, …'（全軸のパス名、縮めた軸は '*' = どのパスでも同じ値）"""
+        pos = np.unravel_index(np.atleast_1d(flat_index), self.shape)
+        return [', '.join(f'{axis}={"*" if axis in self.invariant else names[i[j]]}'
+                          for (axis, names), i in zip(self.axes.items(), pos))
+                for j in range(len(pos[0]))]
+
+    def top(self, metric: str, k: int = 10, year: int = 2060) -> pd.DataFrame:
+        """
+        metric の良い順に上位 k 組（argpartition で k 番目の値を求め、それ以上の組だけ並べ替え）
+
+        同値の組は同順位（rank = 1 + より良い組の数）。k 番目と同値の組はすべて含めるので
+        k 行を超えることがある。metric に効かない軸は先に reduce() で縮めておく
+        列: rank, scenario, axes（全軸のパス名、縮めた軸は '*'）,
+            combinations（その行が表す元の直積の組数）, tied_combinations（同順位の元の組数）, 全変数の値
+        """
+        values = self.evaluate(year)
+        score = np.broadcast_to(values[metric], self.shape).ravel()
+        score = score if RANK_METRICS.get(metric, 'min') == 'min' else -score
+        k = min(k, self.size)
+        kth = score[np.argpartition(score, k - 1)[k - 1]]
+        part = np.flatnonzero(score <= kth)
+        order = part[np.argsort(score[part], kind='stable')]
+        ranks = 1 + np.searchsorted(score[order], score[order], side='left')
+
+        df = pd.DataFrame({v: np.broadcast_to(values[v], self.shape).ravel()[order] for v in VARIABLES})
+        df.insert(0, 'tied_combinations',
+                  pd.Series(ranks).map(pd.Series(ranks).value_counts()).to_numpy() * self.multiplicity)
+        df.insert(0, 'combinations', self.multiplicity)
+        df.insert(0, 'axes', self.axis_labels(order))
+        df.insert(0, 'scenario', self.scenario_names(order))
+        df.insert(0, 'rank', ranks)
+        return df
+
+
+def cartesian_grid(axes: dict[str, tuple[str, ...] | None] = CARTESIAN_AXES,
+                   **spec: str) -> ScenarioGrid:
+    """
+    軸ごとのパスの直積
+
+    axes: {軸: パス名のタプル}。None なら PATHS のその軸の全パス（PATHS に追加したパスも含む）
+    spec: 直積に含めない軸のパス名（省略した軸は DEFAULT_SPEC）
+    """
+    axes = {axis: tuple(PATHS[axis]) if names is None else tuple(names) for axis, names in axes.items()}
+    for axis, names in axes.items():
+        missing = [n for n in names if n not in PATHS[axis]]
+        if missing:
+            raise KeyError(f"PATHS['{axis}'] にないパス: {missing}")
+    return ScenarioGrid(axes=axes, spec={**DEFAULT_SPEC, **spec})
+
+
+def summary_frame(combos: pd.DataFrame, blank: tuple[str, ...] = ()) -> pd.DataFrame:
+    """
+    top() の結果 → 13_summary_2060_scenarios.csv の列（値は小数1桁）
+    + 末尾に rank（同値は同順位）, axes, combinations, tied_combinations
+
+    blank: 空欄にする変数（縮めた軸によって値が変わり、1つの値では表せないもの）
+    """
+    df = pd.DataFrame({col: np.nan if v in blank else combos[v].to_numpy()
+                       for col, v in SUMMARY_COLUMNS.items()}).round(1)
+    df.insert(0, 'scenario', combos['scenario'].to_numpy())
+    for col in ('rank', 'axes', 'combinations', 'tied_combinations'):
+        df[col] = combos[col].to_numpy()
+    return df
+
+
+def write_summary(df: pd.DataFrame, path: Path, title: str) -> Path:
+    """先頭にコメント行 '# title' を付けて書き出す（13_summary_2060_scenarios.csv と同じ形式）"""
+    with open(path, 'w', encoding='utf-8', newline='') as f:
+        f.write(f'# {title}\n')
+        df.to_csv(f, index=False, float_format='%g')
+    return path
+
+
+def rank_scenarios(grid: ScenarioGrid | None = None, k: int = 10, year: int = 2060,
+                   outdir: Path | None = None) -> dict[str, Path]:
+    """
+    RANK_METRICS ごとの上位 k 組を 13_summary_{year}_top_{指標}.csv に書き出す
+
+    指標ごとに効かない軸を既定のパス1本に縮めてから順位を付ける。見出し行と axes 列（'*'）に
+    効かない軸を明記し、その軸によって値が変わる列（例: 日銀保有比率）は空欄にする
+    """
+    grid = cartesian_grid() if grid is None else grid
+    outdir = Path(__file__).resolve().parent if outdir is None else Path(outdir)
+    outdir.mkdir(parents=True, exist_ok=True)
+    out = {}
+    for metric, direction in RANK_METRICS.items():
+        reduced = grid.reduce(metric, year)
+        combos = reduced.top(metric, k=k, year=year)
+        shape = ' × '.join(f'{axis}{len(names)}' for axis, names in reduced.axes.items()
+                           if axis not in reduced.invariant)
+        invariant = ', '.join(reduced.invariant)
+        blank = tuple(v for v in SUMMARY_COLUMNS.values()
+                      if set(grid.effective_axes(v, year)) & set(reduced.invariant))
+        title = (f'{year}年シナリオ: {metric} の{"小さい" if direction == "min" else "大きい"}順 '
+                 f'上位{k}（同値は同順位）／効く軸の直積 {shape} = {reduced.size}通り'
+                 f'（{grid.size}通り中、1行 = {reduced.multiplicity}通り）／'
+                 f'{metric} に効かない軸（どのパスでも同じ値、axes 列の *）: {invariant or "なし"}'
+                 f'／それらの軸で値が変わる列は空欄')
+        out[metric] = write_summary(summary_frame(combos, blank),
+                                    outdir / f'13_summary_{year}_top_{metric}.csv', title)
+    return out
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='2060年シナリオの全組み合わせの評価とランキング')
+    parser.add_argument('--k', type=int, default=10, help='指標ごとに書き出す上位の組数')
+    parser.add_argument('--year', type=int, default=2060)
+    parser.add_argument('--outdir', type=Path, default=None)
+    args = parser.parse_args()
+    for metric, path in rank_scenarios(k=args.k, year=args.year, outdir=args.outdir).items():
+        print(f'{metric}: {path}')
@@ -11,6 +11,8 @@ from matplotlib.patches import FancyBboxPatch
 import warnings
 warnings.filterwarnings('ignore')
 
+from scenario_cube import HIST, HIST_YEARS, PATHS, PROJ_YEARS, build_cube
+
 # Japanese font for Windows
 import platform
 if platform.system() == 'Windows':
@@ -25,11 +27,11 @@ plt.rcParams['axes.unicode_minus'] = False
 # =============================================================================
 # Historical Data (1990-2025)
 # =============================================================================
-hist_years = np.array([1990, 1995, 2000, 2005, 2010, 2015, 2020, 2025])
+hist_years = HIST_YEARS
 
 # Tax Revenue (一般会計税収) - 兆円
 # 2025(FY2024)は令和6年度決算概要に基づく
-tax_hist = np.array([60.1, 52.1, 50.7, 49.1, 41.5, 56.3, 60.8, 75.2])
+tax_hist = HIST['tax']
 
 # Tax breakdown - 2025(FY2024)は令和6年度決算の公式値
 # 消費税25.0/所得税21.2/法人税17.9/その他11.0(兆円)
@@ -46,23 +48,33 @@ expenditure_hist = np.array([69.3, 75.9, 89.3, 82.2, 92.3, 96.3, 147.6, 123.0])
 social_security_hist = np.array([11.6, 14.5, 16.8, 20.4, 27.3, 31.5, 35.9, 38.0])
 
 # JGB data
-jgb_hist = np.array([166, 225, 368, 527, 637, 807, 945, 1080])  # 兆円
-interest_rate_hist = np.array([6.9, 4.8, 2.9, 1.6, 1.3, 1.0, 0.8, 0.9])  # %
+jgb_hist = HIST['jgb']  # 兆円
+interest_rate_hist = HIST['rate']  # %
 interest_payment_hist = jgb_hist * interest_rate_hist / 100
 
 # =============================================================================
 # Projections (2025-2060) - 3 Scenarios
 # =============================================================================
-proj_years = np.arange(2025, 2065, 5)
-
-# Working-age population ratio (affects tax base)
-working_age_proj = np.array([58.5, 57.0, 55.2, 53.5, 52.0, 50.8, 49.8, 49.0])  # %
-working_age_decline = working_age_proj / working_age_proj[0]  # Relative to 2025
+proj_years = PROJ_YEARS
+
+# 税収3シナリオ × 金利正常化（歳出: 社会保障は高齢化で増加、その他は抑制）
+cube = build_cube({
+    'optimistic': {'tax': 'optimistic', 'rate': 'normal', 'other_expenditure': 'restrained'},
+    'baseline': {'tax': 'baseline', 'rate': 'normal', 'other_expenditure': 'restrained'},
+    'pessimistic': {'tax': 'pessimistic', 'rate': 'normal', 'other_expenditure': 'restrained'},
+})
+
+# Tax base (affects tax revenue)
+# 人口エンジンの労働力推計（japan_labour_force_projection_2100_v3.csv）の就業者数を
+# 現状の労働力率のままの推移 = 1 とした指数。労働参加が進むと税収はこの比率で増える
+participation = build_cube({'baseline': {'tax': 'baseline', 'labour': 'advanced'}})
+tax_base_participation = participation.view('labour', 'baseline')
+tax_baseline_participation = participation.view('tax', 'baseline')
 
 # Scenario 1: Optimistic (インフレ達成 + 成長)
 # - 2% inflation + 1% real growth = 3% nominal growth
 # - Tax revenue grows with nominal GDP
-tax_optimistic = np.array([75.2, 87, 100, 115, 130, 145, 160, 175])
+tax_optimistic = PATHS['tax']['optimistic']
 consumption_tax_opt = np.array([23.5, 28, 33, 38, 43, 48, 53, 58])  # 消費税増収
 income_tax_opt = np.array([22.5, 26, 30, 35, 40, 45, 50, 55])
 corp_tax_opt = np.array([15.0, 17, 19, 21, 23, 25, 27, 29])
@@ -71,7 +83,7 @@ other_tax_opt = tax_optimistic - consumption_tax_opt - income_tax_opt - corp_tax
 # Scenario 2: Baseline (現状継続)
 # - 1% nominal growth (low inflation)
 # - Demographic headwind
-tax_baseline = np.array([75.2, 80, 85, 88, 90, 91, 92, 92])
+tax_baseline = PATHS['tax']['baseline']
 consumption_tax_base = np.array([23.5, 26, 28, 30, 31, 32, 32, 32])
 income_tax_base = np.array([22.5, 23, 24, 24, 24, 24, 24, 24])
 corp_tax_base = np.array([15.0, 15, 15, 15, 15, 15, 15, 15])
@@ -80,33 +92,16 @@ other_tax_base = tax_baseline - consumption_tax_base - income_tax_base - corp_ta
 # Scenario 3: Pessimistic (デフレ回帰 + 人口減加速)
 # - 0% nominal growth
 # - Tax base shrinks with working-age population
-tax_pessimistic = np.array([75.2, 73, 70, 66, 62, 58, 54, 50])
-
-# Expenditure projections
-social_security_proj = np.array([38.0, 42, 47, 52, 56, 59, 61, 62])  # 高齢化で増加
-other_expenditure = np.array([74.0, 72, 70, 68, 66, 64, 62, 60])  # その他は抑制
-expenditure_proj = social_security_proj + other_expenditure
-
-# Interest rate scenarios
-rate_normal = np.array([0.9, 1.5, 2.0, 2.3, 2.5, 2.5, 2.5, 2.5])
-rate_low = np.array([0.9, 1.0, 1.2, 1.3, 1.5, 1.5, 1.5, 1.5])
-
-# JGB projection
-jgb_proj = np.array([1080, 1150, 1220, 1280, 1330, 1370, 1400, 1420])
+tax_pessimistic = PATHS['tax']['pessimistic']
 
-# Interest payments
-interest_normal = jgb_proj * rate_normal / 100
-interest_low = jgb_proj * rate_low / 100
+# Expenditure projections（社会保障は高齢化で増加、その他は抑制）
+expenditure_proj = cube.view('expenditure', 'optimistic')
 
-# Primary balance (税収 - 歳出 + 利払い)
-pb_optimistic = tax_optimistic - (expenditure_proj - interest_normal)
-pb_baseline = tax_baseline - (expenditure_proj - interest_normal)
-pb_pessimistic = tax_pessimistic - (expenditure_proj - interest_normal)
+# Interest payments（金利正常化）
+interest_normal = cube.view('interest', 'optimistic')
 
-# Fiscal balance (税収 - 歳出)
-fb_optimistic = tax_optimistic - expenditure_proj
-fb_baseline = tax_baseline - expenditure_proj
-fb_pessimistic = tax_pessimistic - expenditure_proj
+# Fiscal balance (税収 - PB対象歳出)
+fb_optimistic, fb_baseline, fb_pessimistic = cube.view('primary_balance')
 
 C = {'good': '#27ae60', 'bad': '#e74c3c', 'warn': '#f39c12', 'blue': '#3498db', 
      'purple': '#9b59b6', 'panel': '#16213e', 'income': '#3498db', 
@@ -138,6 +133,7 @@ assumptions = """【前提・定義】
 • 税目内訳: 令和6年度決算の公式値
 • 楽観: 名目3%成長/現状維持: 1%/悲観: 0%
 • 歳出: 利払い除きのPBベース
+• 税収基盤: 就業者数(人口エンジンの労働力推計)
 • 利払い: ストレス試算(全残高×同一金利)"""
 fig.text(0.72, 0.93, assumptions, fontsize=10, color='white', va='top',
          bbox=dict(facecolor='#2d1f3d', alpha=0.9, boxstyle='round,pad=0.5', edgecolor='#9b59b6'))
@@ -186,6 +182,8 @@ ax2.plot(proj_years, tax_baseline, '^--', color=C['warn'], lw=2.5, markersize=5,
          label='現状維持')
 ax2.plot(proj_years, tax_pessimistic, 'v--', color=C['bad'], lw=2.5, markersize=5, 
          label='悲観 (デフレ回帰)')
+ax2.plot(proj_years, tax_baseline_participation, ':', color=C['warn'], lw=2,
+         label=f'現状維持＋労働参加進展 (就業者{(tax_base_participation[-1] - 1) * 100:+.0f}%)')
 
 ax2.axvline(x=2025, color='white', ls='--', lw=2, alpha=0.7)
 ax2.fill_between(proj_years, tax_pessimistic, tax_optimistic, color='gray', alpha=0.2)
@@ -268,9 +266,7 @@ ax5.set_title('⑤ 税収に占める利払い費の割合', color='white', font
 int_tax_hist = interest_payment_hist / tax_hist * 100
 
 # Projections
-int_tax_opt_normal = interest_normal / tax_optimistic * 100
-int_tax_base_normal = interest_normal / tax_baseline * 100
-int_tax_pess_normal = interest_normal / tax_pessimistic * 100
+int_tax_opt_normal, int_tax_base_normal, int_tax_pess_normal = cube.view('interest_tax_ratio')
 
 ax5.plot(hist_years, int_tax_hist, 'o-', color='white', lw=3, markersize=6, label='実績')
 ax5.plot(proj_years, int_tax_opt_normal, 's--', color=C['good'], lw=2.5, markersize=5, label='楽観+金利正常化')
@@ -0,0 +1,358 @@
+# correlation_stats.py
+# 変化データの相関係数・t値・p値・有効観測数を全ペア一括で計算（chg ごとにメモ化）
+# Date: 2026-10-17
+#
+# ============================================================
+# 方法
+# ============================================================
+# - 欠損はペアごとに除外（pairwise-complete）
+#   有効フラグ M (N, K) と欠損を0埋めした X (N, K) から
+#     n   = Mᵀ M,  Σx = Xᵀ M,  Σx² = (X²)ᵀ M,  Σxy = Xᵀ X
+#   を行列積で作り、全ペアの相関係数を同時に求める
+# - t = r √((n − 2) / (1 − r²))、p = 2·P(T_{n−2} > |t|)（両側）
+# - 結果は chg の内容（値・index・列名）のハッシュでキャッシュし、
+#   図07・図08・コンソール出力で同じ計算を共有する
+#
+# ============================================================
+# ブロック・ブートストラップ信頼区間（moving block bootstrap）
+# ============================================================
+# - 長さ block の連続ブロックを復元抽出して系列長 N の標本を作る（自己相関を保つ）
+#   抽出はインデックス配列 (B, N) で一括生成
+# - 各標本の相関行列 (B, K, K) を点推定と同じペアごとの欠損除外で、
+#   バッチ軸付きの行列積（pairwise_correlation）により一度に計算
+#   （標本ごとにペアの有効観測数が変わる。信頼区間と r は同じ標本の定義に基づく）
+# - 標本数 B は BOOTSTRAP_SHARDS 個のシャードに分け、プロセスプールで並列に計算
+#   （シャードごとに SeedSequence.spawn の独立な乱数列。結果はワーカー数によらない）
+# - 全列が欠損の行だけ除いてから抽出する（一部の列の欠損はペアごとに扱う）
+#
+# ============================================================
+# ローリング相関（全ペア × 複数の窓長を一括）
+# ============================================================
+# - ペア (i, j) ごとに両方有効な行だけを使う（NaN-aware な観測数 n）
+# - Σx, Σy, Σx², Σy², Σxy, n の累積和 (T+1, P) を一度作り、
+#   窓長 w の和は「累積和[t+1] − 累積和[t+1−w]」で全時点・全窓長を O(T) で求める
+# - 桁落ちを避けるため、累積前に各列の全期間平均を引いておく
+#
+# ============================================================
+# 先行・遅行の相互相関（ラグ −L〜+L、全ペア）
+# ============================================================
+# - r_k = corr(x_t, y_{t+k})。k > 0 で最大なら「x が y に k 期先行」
+# - ラグごとの Σxy, Σx, Σy, Σx², Σy², n を、有効フラグ m と 0埋めの x・x² の
+#   相互相関として FFT で求める（各列の FFT は1回、ペアは周波数領域の積）
+#   → ペアあたり O(N log N)、ラグ数 L に依存しない
+# - ラグごとに重なる区間・欠損を除いた観測数で Pearson の相関を計算
+# ============================================================
+
+from __future__ import annotations
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+import hashlib
+import os
+import numpy as np
+import pandas as pd
+from scipy import fft, stats
+
+# 有意性マーカー（p値の上限, 記号）
+SIGNIFICANCE_MARKERS = ((0.01, '**'), (0.05, '*'), (0.10, '†'))
+
+BOOTSTRAP_SHARDS = 16
+
+_CORRELATION_CACHE: dict[str, 'CorrelationTest'] = {}
+_BOOTSTRAP_CACHE: dict[tuple, 'BootstrapCI'] = {}
+
+
+@dataclass(frozen=True)
+class CorrelationTest:
+    """相関の検定結果（いずれも列 × 列の DataFrame）"""
+    r: pd.DataFrame
+    t: pd.DataFrame
+    p: pd.DataFrame
+    n: pd.DataFrame
+
+    def subset(self, columns: list[str]) -> 'CorrelationTest':
+        return CorrelationTest(*(m.loc[columns, columns] for m in (self.r, self.t, self.p, self.n)))
+
+    def markers(self) -> pd.DataFrame:
+        """有意性マーカー（**p<.01 *p<.05 †p<.10、対角は空）"""
+        p = self.p.to_numpy()
+        out = np.full(p.shape, '', dtype=object)
+        for threshold, mark in reversed(SIGNIFICANCE_MARKERS):
+            out[p < threshold] = mark
+        np.fill_diagonal(out, '')
+        return pd.DataFrame(out, index=self.p.index, columns=self.p.columns)
+
+    def labels(self, fmt: str = '{:.2f}') -> pd.DataFrame:
+        """セル表示用の文字列（相関係数 + マーカー）"""
+        r = self.r.map(fmt.format)
+        return r + self.markers()
+
+
+def _frame_key(chg: pd.DataFrame) -> str:
+    h = hashlib.sha1()
+    h.update(pd.util.hash_pandas_object(chg, index=True).to_numpy().tobytes())
+    h.update(repr(list(chg.columns)).encode())
+    return h.hexdigest()
+
+
+def pairwise_correlation(values: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+    """
+    欠損をペアごとに除いた相関係数と有効観測数
+
+    values: (..., N, K)（NaN = 欠損、先頭の軸はブートストラップ標本などのバッチ）
+
+    Returns:
+        r: (..., K, K)  n: (..., K, K)
+    """
+    valid = ~np.isnan(values)
+    x = np.where(valid, values, 0.0)
+    m = valid.astype(float)
+    xt = np.swapaxes(x, -1, -2)
+    n = np.swapaxes(m, -1, -2) @ m
+    sx = xt @ m                         # sx[i, j] = ペア (i, j) で有効な行の x_i の和
+    sxx = (xt * xt) @ m
+    sxy = xt @ x
+    with np.errstate(divide='ignore', invalid='ignore'):
+        cov = n * sxy - sx * np.swapaxes(sx, -1, -2)
+        var = n * sxx - sx * sx
+        r = cov / np.sqrt(var * np.swapaxes(var, -1, -2))
+    return np.clip(r, -1.0, 1.0), n
+
+
+def correlation_significance(chg: pd.DataFrame) -> CorrelationTest:
+    """chg の全列ペアの r・t・p・n（同じ内容の2回目以降はキャッシュを返す）"""
+    key = _frame_key(chg)
+    cached = _CORRELATION_CACHE.get(key)
+    if cached is None:
+        r, n = pairwise_correlation(chg.to_numpy(dtype=float))
+        df = n - 2
+        with np.errstate(divide='ignore', invalid='ignore'):
+            t = r * np.sqrt(df / (1 - r**2))
+        p = 2 * stats.t.sf(np.abs(t), df)
+        np.fill_diagonal(p, 0.0)
+        cols = chg.columns
+        cached = CorrelationTest(*(pd.DataFrame(a, index=cols, columns=cols) for a in (r, t, p, n)))
+        _CORRELATION_CACHE[key] = cached
+    return cached
+
+
+@dataclass(frozen=True)
+class BootstrapCI:
+    """相関係数のブートストラップ信頼区間（列 × 列の DataFrame）"""
+    lo: pd.DataFrame
+    hi: pd.DataFrame
+    n_boot: int
+    block: int
+    level: float
+
+    def subset(self, columns: list[str]) -> 'BootstrapCI':
+        return BootstrapCI(self.lo.loc[columns, columns], self.hi.loc[columns, columns],
+                           self.n_boot, self.block, self.level)
+
+    def excludes_zero(self) -> pd.DataFrame:
+        return (self.lo > 0) | (self.hi < 0)
+
+
+def default_block_length(n_obs: int) -> int:
+    """ブロック長の目安 N^(1/3)"""
+    return max(1, int(round(n_obs ** (1 / 3))))
+
+
+def block_bootstrap_indices(n_obs: int, block: int, n_boot: int,
+                            rng: np.random.Generator) -> np.ndarray:
+    """moving block bootstrap の行インデックス、shape = (n_boot, n_obs)"""
+    n_blocks = -(-n_obs // block)
+    starts = rng.integers(0, n_obs - block + 1, size=(n_boot, n_blocks))
+    idx = (starts[..., None] + np.arange(block)).reshape(n_boot, -1)
+    return idx[:, :n_obs]
+
+
+def bootstrap_correlations(values: np.ndarray, idx: np.ndarray) -> np.ndarray:
+    """
+    再標本ごとの相関行列
+
+    values: (N, K)（NaN = 欠損、ペアごとに除外）  idx: (B, N)
+
+    Returns:
+        (B, K, K)
+    """
+    return pairwise_correlation(values[idx])[0]
+
+
+def _bootstrap_shard(values: np.ndarray, block: int, n_boot: int,
+                     seed: np.random.SeedSequence) -> np.ndarray:
+    rng = np.random.default_rng(seed)
+    idx = block_bootstrap_indices(len(values), block, n_boot, rng)
+    return bootstrap_correlations(values, idx)
+
+
+def bootstrap_ci(chg: pd.DataFrame, n_boot: int = 20000, block: int | None = None,
+                 level: float = 0.95, seed: int = 2026,
+                 n_workers: int | None = None) -> BootstrapCI:
+    """
+    変化データの全列ペアの相関係数の信頼区間（パーセンタイル法）
+
+    同じ chg・設定の2回目以降はキャッシュを返す
+    """
+    data = chg.dropna(how='all')
+    if block is None:
+        block = default_block_length(len(data))
+    key = (_frame_key(chg), n_boot, block, level, seed)
+    cached = _BOOTSTRAP_CACHE.get(key)
+    if cached is None:
+        values = data.to_numpy(dtype=float)
+        values = values - np.nanmean(values, axis=0)                    # 桁落ち対策（相関は不変）
+        n_shards = min(BOOTSTRAP_SHARDS, n_boot)
+        counts = [len(c) for c in np.array_split(np.arange(n_boot), n_shards)]
+        seeds = np.random.SeedSequence(seed).spawn(n_shards)
+        if n_workers is None:
+            n_workers = os.cpu_count() or 1
+        n_workers = max(1, min(n_workers, n_shards))
+        if n_workers == 1:
+            shards = map(_bootstrap_shard, [values] * n_shards, [block] * n_shards, counts, seeds)
+            samples = np.concatenate(list(shards))
+        else:
+            with ProcessPoolExecutor(max_workers=n_workers) as pool:
+                shards = pool.map(_bootstrap_shard, [values] * n_shards, [block] * n_shards,
+                                  counts, seeds)
+                samples = np.concatenate(list(shards))
+
+        alpha = (1 - level) / 2
+        lo, hi = np.nanquantile(samples, [alpha, 1 - alpha], axis=0)
+        cols = chg.columns
+        cached = BootstrapCI(pd.DataFrame(lo, index=cols, columns=cols),
+                             pd.DataFrame(hi, index=cols, columns=cols),
+                             n_boot, block, level)
+        _BOOTSTRAP_CACHE[key] = cached
+    return cached
+
+
+@dataclass(frozen=True)
+class RollingCorrelation:
+    """
+    ローリング相関のキューブ
+
+    r, n: (T, W, P)  時点 × 窓長 × ペア（窓は各時点で終わる直近 w 行）
+    """
+    index: pd.Index
+    windows: tuple[int, ...]
+    pairs: list[tuple[str, str]]
+    r: np.ndarray
+    n: np.ndarray
+
+    def frame(self, window: int) -> pd.DataFrame:
+        """窓長 window の相関（index = 時点、列 = 'A × B'）"""
+        w = self.windows.index(window)
+        return pd.DataFrame(self.r[:, w], index=self.index,
+                            columns=[f'{a} × {b}' for a, b in self.pairs])
+
+
+def rolling_correlation_cube(chg: pd.DataFrame, windows=(5, 10, 15),
+                             min_periods: int | None = None) -> RollingCorrelation:
+    """
+    chg の全列ペア・全窓長のローリング相関を累積和から一括計算
+
+    min_periods: 窓内の有効観測数の下限（既定は窓長の半分、最低3）。下回る時点は NaN
+    """
+    values = chg.to_numpy(dtype=float)
+    values = values - np.nanmean(values, axis=0)
+    i, j = np.triu_indices(values.shape[1], k=1)
+    x, y = values[:, i], values[:, j]                                   # (T, P)
+    valid = ~(np.isnan(x) | np.isnan(y))
+    x, y = np.where(valid, x, 0.0), np.where(valid, y, 0.0)
+
+    terms = np.stack([valid.astype(float), x, y, x * x, y * y, x * y])   # (6, T, P)
+    cum = np.concatenate([np.zeros_like(terms[:, :1]), np.cumsum(terms, axis=1)], axis=1)
+
+    n_obs = len(values)
+    windows = tuple(int(w) for w in windows)
+    end = np.arange(1, n_obs + 1)
+    start = np.maximum(end[:, None] - np.array(windows), 0)             # (T, W)
+    sums = cum[:, end[:, None]] - cum[:, start]                         # (6, T, W, P)
+    n, sx, sy, sxx, syy, sxy = sums
+
+    with np.errstate(divide='ignore', invalid='ignore'):
+        cov = n * sxy - sx * sy
+        r = cov / np.sqrt((n * sxx - sx * sx) * (n * syy - sy * sy))
+    limit = np.array([max(3, w // 2) if min_periods is None else min_periods for w in windows])
+    r = np.where(n >= limit[:, None], np.clip(r, -1.0, 1.0), np.nan)
+    cols = chg.columns
+    return RollingCorrelation(index=chg.index, windows=windows,
+                              pairs=[(cols[a], cols[b]) for a, b in zip(i, j)], r=r, n=n)
+
+
+@dataclass(frozen=True)
+class LeadLag:
+    """
+    相互相関のラグ・プロファイル
+
+    r, n: (2L+1, P)  ラグ −L〜+L × ペア（r[k] = corr(x_t, y_{t+k})、x = ペアの1番目）
+    """
+    lags: np.ndarray
+    pairs: list[tuple[str, str]]
+    r: np.ndarray
+    n: np.ndarray
+
+    def profile(self, x: str, y: str) -> tuple[np.ndarray, np.ndarray]:
+        """corr(x_t, y_{t+k}) のラグ・プロファイル (r, n)（ペアの向きが逆なら反転）"""
+        if (x, y) in self.pairs:
+            k = self.pairs.index((x, y))
+            return self.r[:, k], self.n[:, k]
+        k = self.pairs.index((y, x))
+        return self.r[::-1, k], self.n[::-1, k]
+
+    def peaks(self) -> pd.DataFrame:
+        """ペアごとの |r| 最大のラグ（Peak_Lag > 0 なら Leader が Follower に先行）"""
+        k = np.nanargmax(np.abs(np.nan_to_num(self.r, nan=0.0)), axis=0)
+        cols = np.arange(len(self.pairs))
+        lag = self.lags[k]
+        first = [a for a, _ in self.pairs]
+        second = [b for _, b in self.pairs]
+        return pd.DataFrame({
+            'X': first, 'Y': second,
+            'Peak_Lag': lag,
+            'Peak_r': self.r[k, cols],
+            'r_at_0': self.r[len(self.lags) // 2],
+            'n': self.n[k, cols].astype(int),
+            'Leader': np.where(lag > 0, first, np.where(lag < 0, second, '')),
+            'Follower': np.where(lag > 0, second, np.where(lag < 0, first, '')),
+        })
+
+
+def lead_lag_correlation(chg: pd.DataFrame, max_lag: int = 5, chunk: int = 64) -> LeadLag:
+    """
+    chg の全列ペアについてラグ −max_lag〜+max_lag の相互相関を FFT で計算
+
+    chunk: 周波数領域の積を同時に処理するペア数（メモリ使用量の上限）
+    """
+    values = chg.to_numpy(dtype=float)
+    n_obs, n_cols = values.shape
+    values = values - np.nanmean(values, axis=0)
+    valid = ~np.isnan(values)
+    x = np.where(valid, values, 0.0)
+    series = np.stack([valid.astype(float), x, x * x], axis=1)          # (N, 3, K): m, x, x²
+    nfft = fft.next_fast_len(2 * n_obs - 1, real=True)
+    spectra = fft.rfft(series, n=nfft, axis=0)                          # (F, 3, K)
+
+    i, j = np.triu_indices(n_cols, k=1)
+    lags = np.arange(-max_lag, max_lag + 1)
+    # Σ_t a_i(t)·b_j(t+k) の (a, b): n, Σx, Σy, Σx², Σy², Σxy
+    combos = [(0, 0), (1, 0), (0, 1), (2, 0), (0, 2), (1, 1)]
+    r = np.empty((len(lags), len(i)))
+    n = np.empty_like(r)
+    for lo in range(0, len(i), chunk):
+        pi, pj = i[lo:lo + chunk], j[lo:lo + chunk]
+        prod = np.stack([np.conj(spectra[:, a, pi]) * spectra[:, b, pj] for a, b in combos], axis=1)
+        cross = fft.irfft(prod, n=nfft, axis=0)[lags % nfft]             # (2L+1, 6, chunk)
+        cn, sx, sy, sxx, syy, sxy = np.moveaxis(cross, 1, 0)
+        cn = np.round(cn)
+        with np.errstate(divide='ignore', invalid='ignore'):
+            rr = (cn * sxy - sx * sy) / np.sqrt((cn * sxx - sx * sx) * (cn * syy - sy * sy))
+        r[:, lo:lo + chunk] = np.where(cn >= 3, np.clip(rr, -1.0, 1.0), np.nan)
+        n[:, lo:lo + chunk] = cn
+    cols = chg.columns
+    return LeadLag(lags=lags, pairs=[(cols[a], cols[b]) for a, b in zip(i, j)], r=r, n=n)
+
+
+def clear_cache() -> None:
+    _CORRELATION_CACHE.clear()
+    _BOOTSTRAP_CACHE.clear()
@@ -0,0 +1,217 @@
+# jgb_rollover.py
+# 国債の満期構成（残存年数別の残高）による借換え・利払い費の推計
+# Date: 2026-10-17
+#
+# ============================================================
+# 方法
+# ============================================================
+# - 残高を残存年数 1〜MAX_MATURITY 年のバケットに分け、バケットごとに
+#   額面と年間クーポン額（額面 × 発行時の利率）を持つ
+# - 毎年: 残存1年のバケットが償還 → 償還額 + 新規財源債（net_issuance）を
+#   発行構成（ISSUANCE_MIX）で各年限に振り分けて発行
+#   新発債の利率 = その年の10年金利（金利パス）+ 年限別スプレッド
+# - 利払い費 = 年初と年末のクーポン額の平均（期中の償還・発行を半年分とみなす）
+# - バケットは「年初位置がずれていくリングバッファ」で持ち、毎年の配列シフトをしない
+#   （償還枠 = t mod M、年限 m の新発債は (t + m) mod M の枠へ）
+# - 金利パスの先頭軸（シナリオ）はそのままバッチ軸になり、数千本を1回の年次ループで計算
+#   発行構成も (..., M) の配列で渡せばバッチ軸として broadcast される
+#
+# ============================================================
+# 初期の満期構成（概算）
+# ============================================================
+# - 発行構成が一定だったと仮定した定常構成: 残存 k 年の残高 ∝ Σ_{m≥k} w_m
+# - 各残存年のクーポンは発行年（基準年 − (m − k)）の10年金利 + スプレッドから作り、
+#   合計が直近の利払い費に一致するよう比例調整する
+# ============================================================
+
+from __future__ import annotations
+from dataclasses import dataclass
+import numpy as np
+import pandas as pd
+
+MAX_MATURITY = 40
+
+# 発行構成（年限 → カレンダーベース市中発行額に占める割合の概算、合計1に正規化して使用）
+ISSUANCE_MIX = {1: 0.14, 2: 0.17, 5: 0.16, 10: 0.23, 20: 0.15, 30: 0.11, 40: 0.04}
+
+# 発行構成の比較用（rate_shock_surface の既定）
+ISSUANCE_MIXES = {
+    '現行': ISSUANCE_MIX,
+    '短期化': {1: 0.30, 2: 0.25, 5: 0.20, 10: 0.15, 20: 0.05, 30: 0.04, 40: 0.01},
+    '長期化': {1: 0.08, 2: 0.10, 5: 0.12, 10: 0.25, 20: 0.20, 30: 0.17, 40: 0.08},
+    '10年債中心': {1: 0.10, 2: 0.10, 5: 0.15, 10: 0.50, 20: 0.08, 30: 0.05, 40: 0.02},
+}
+
+# 10年金利に対する年限別スプレッド（%pt、2025年の利回り曲線の概形）
+TERM_SPREAD = {1: -0.9, 2: -0.8, 5: -0.5, 10: 0.0, 20: 0.8, 30: 1.1, 40: 1.3}
+
+COUPON_FLOOR = 0.005   # 表面利率の下限（%）
+
+
+def issuance_weights(mix: dict[int, float] = ISSUANCE_MIX) -> np.ndarray:
+    """年限 1〜MAX_MATURITY 年の発行割合、shape = (M,)（index = 年限 − 1）"""
+    w = np.zeros(MAX_MATURITY)
+    for m, share in mix.items():
+        w[m - 1] = share
+    return w / w.sum()
+
+
+def term_spreads() -> np.ndarray:
+    """年限別スプレッド（%pt）、shape = (M,)。節点の間は線形補間"""
+    maturities = np.arange(1, MAX_MATURITY + 1)
+    return np.interp(maturities, list(TERM_SPREAD), list(TERM_SPREAD.values()))
+
+
+def coupon_rates(level: np.ndarray) -> np.ndarray:
+    """10年金利 (...,)（%）→ 年限別の新発債利率 (..., M)（小数）"""
+    level = np.asarray(level, dtype=float)
+    return np.maximum(level[..., None] + term_spreads(), COUPON_FLOOR) / 100
+
+
+@dataclass(frozen=True)
+class Ladder:
+    """残存年数別の額面とクーポン額（兆円）、shape = (..., M)（index = 残存年数 − 1）"""
+    face: np.ndarray
+    cost: np.ndarray
+
+    @property
+    def outstanding(self) -> np.ndarray:
+        return self.face.sum(axis=-1)
+
+    @property
+    def interest(self) -> np.ndarray:
+        return self.cost.sum(axis=-1)
+
+    @property
+    def average_maturity(self) -> np.ndarray:
+        return (self.face * np.arange(1, MAX_MATURITY + 1)).sum(axis=-1) / self.outstanding
+
+
+@dataclass(frozen=True)
+class RolloverResult:
+    """
+    借換え推計の結果、いずれも shape = (..., T)
+
+    repriced: 推計開始後に発行された（金利パスの利率で借換わった）残高
+    """
+    years: np.ndarray
+    interest: np.ndarray
+    outstanding: np.ndarray
+    repriced: np.ndarray
+
+    @property
+    def average_rate(self) -> np.ndarray:
+        """平均適用金利（%）"""
+        return self.interest / self.outstanding * 100
+
+    @property
+    def repriced_share(self) -> np.ndarray:
+        return self.repriced / self.outstanding
+
+
+def initial_ladder(df: pd.DataFrame, mix: dict[int, float] = ISSUANCE_MIX) -> Ladder:
+    """
+    直近の国債残高・利払い費に合わせた初期の満期構成
+
+    df: create_historical_data() の出力（JGB_Outstanding, Interest_Payment, JP10Y）
+    """
+    latest = df.iloc[-1]
+    w = issuance_weights(mix)
+    k = np.arange(1, MAX_MATURITY + 1)[:, None]          # 残存年数
+    m = np.arange(1, MAX_MATURITY + 1)[None, :]          # 発行時の年限
+    alive = m >= k                                        # (k, m)
+
+    # 発行年の10年金利（データ期間外は端の値）
+    history = df['JP10Y'].groupby(df.index.year).last()
+    issue_year = df.index[-1].year - (m - k)
+    level = np.interp(issue_year, history.index, history.to_numpy())
+    coupon = np.maximum(level + term_spreads(), COUPON_FLOOR) / 100      # (k, m)
+
+    vintage = np.where(alive, w, 0.0)                     # (k, m)
+    face = vintage.sum(axis=1)
+    cost = (vintage * coupon).sum(axis=1)
+    face *= latest['JGB_Outstanding'] / face.sum()
+    cost *= latest['Interest_Payment'] / cost.sum()
+    return Ladder(face=face, cost=cost)
+
+
+def simulate_rollover(ladder: Ladder, rates: np.ndarray, net_issuance: float | np.ndarray = 0.0,
+                      mix: dict[int, float] | np.ndarray = ISSUANCE_MIX,
+                      start_year: int = 0) -> RolloverResult:
+    """
+    金利パスに沿って借換え・新規発行を進める
+
+    ladder:       初期の満期構成 (..., M)
+    rates:        10年金利のパス（%）(..., T)
+    net_issuance: 新規財源債（兆円/年）、スカラーまたは (..., T)
+    mix:          発行構成（dict）または発行割合の配列 (..., M)
+
+    Returns:
+        RolloverResult（years = start_year + 0..T-1）
+    """
+    rates = np.asarray(rates, dtype=float)
+    n_years = rates.shape[-1]
+    w = issuance_weights(mix) if isinstance(mix, dict) else np.asarray(mix, dtype=float)
+    batch = np.broadcast_shapes(rates.shape[:-1], ladder.face.shape[:-1],
+                                np.shape(net_issuance)[:-1], w.shape[:-1])
+    net = np.broadcast_to(np.asarray(net_issuance, dtype=float), batch + (n_years,))
+    rates = np.broadcast_to(rates, batch + (n_years,))
+
+    # リングバッファ（枠 j は年 t に残存 (j − t) mod M + 1 年）
+    face = np.broadcast_to(ladder.face, batch + (MAX_MATURITY,)).copy()
+    cost = np.broadcast_to(ladder.cost, batch + (MAX_MATURITY,)).copy()
+    new = np.zeros_like(face)
+    offsets = np.arange(1, MAX_MATURITY + 1)
+
+    interest = np.empty(batch + (n_years,))
+    outstanding = np.empty_like(interest)
+    repriced = np.empty_like(interest)
+    for t in range(n_years):
+        due = t % MAX_MATURITY
+        cost_start = cost.sum(axis=-1)
+        issue = face[..., due] + net[..., t]
+        face[..., due] = cost[..., due] = new[..., due] = 0.0
+
+        amounts = issue[..., None] * w                                   # 年限別の発行額
+        slots = (t + offsets) % MAX_MATURITY
+        face[..., slots] += amounts
+        cost[..., slots] += amounts * coupon_rates(rates[..., t])
+        new[..., slots] += amounts
+
+        interest[..., t] = 0.5 * (cost_start + cost.sum(axis=-1))
+        outstanding[..., t] = face.sum(axis=-1)
+        repriced[..., t] = new.sum(axis=-1)
+
+    return RolloverResult(years=start_year + np.arange(n_years), interest=interest,
+                          outstanding=outstanding, repriced=repriced)
+
+
+def rate_shock_paths(level: float, shocks, horizon: int) -> np.ndarray:
+    """現在の10年金利 level から即時に shocks（%pt）だけ上下して横ばいのパス、shape = (S, horizon)"""
+    return np.broadcast_to(level + np.asarray(shocks, dtype=float)[:, None],
+                           (len(shocks), horizon)).copy()
+
+
+def rate_shock_surface(df: pd.DataFrame, level: float, shocks, horizon: int,
+                       mixes: dict[str, dict[int, float]] = ISSUANCE_MIXES,
+                       net_issuance: float = 0.0) -> tuple[np.ndarray, np.ndarray]:
+    """
+    金利ショック × 経過年数 × 発行構成の利払い費
+
+    発行構成は新規発行と初期の満期構成（その構成で発行を続けてきた定常構成）の両方に使う
+    （横ばいのショックでは、追加の利払い費は借換え済みの残高に比例するため、
+    発行構成の違いは既存残高の償還の早さとして現れる）。
+    ショック0（金利横ばい）を先頭に加えた全パスを (発行構成, ショック) のバッチとして一括で推計する
+
+    Returns:
+        interest: (X, S, horizon)  各ショックの利払い費（兆円）
+        baseline: (X, 1, horizon)  金利横ばいの利払い費（兆円）
+    """
+    ladders = [initial_ladder(df, m) for m in mixes.values()]
+    ladder = Ladder(face=np.stack([l.face for l in ladders])[:, None, :],
+                    cost=np.stack([l.cost for l in ladders])[:, None, :])            # (X, 1, M)
+    weights = np.stack([issuance_weights(m) for m in mixes.values()])[:, None, :]    # (X, 1, M)
+    paths = rate_shock_paths(level, np.concatenate([[0.0], np.asarray(shocks, dtype=float)]),
+                             horizon)                                                  # (1+S, T)
+    interest = simulate_rollover(ladder, paths, net_issuance, mix=weights).interest   # (X, 1+S, T)
+    return interest[:, 1:], interest[:, :1]
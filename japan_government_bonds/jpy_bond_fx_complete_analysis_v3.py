@@ -25,13 +25,28 @@
 #     https://fred.stlouisfed.org/
 
 from __future__ import annotations
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
+import argparse
+import os
+import time
 import numpy as np
 import pandas as pd
+import matplotlib
 import matplotlib.pyplot as plt
 import matplotlib.dates as mdates
 from matplotlib.ticker import FuncFormatter
 
+from correlation_stats import (SIGNIFICANCE_MARKERS, BootstrapCI, bootstrap_ci, correlation_significance,
+                               lead_lag_correlation, rolling_correlation_cube)
+from market_data import (SNAPSHOT_DIR, add_derived_columns, build_market_frame,
+                         load_snapshots, snapshots_available)
+from jgb_rollover import (ISSUANCE_MIXES, initial_ladder, rate_shock_paths, rate_shock_surface,
+                          simulate_rollover)
+from kalman_beta import time_varying_beta
+from structural_breaks import detect_breaks
+from var_model import fit_var
+
 # =========================
 # 設定
 # =========================
@@ -174,14 +189,18 @@ def create_historical_data():
     
     df.index.name = 'date'
     
-    df['SPREAD_10Y'] = df['US10Y'] - df['JP10Y']
-    df['BOJ_Share'] = df['BOJ_Holdings'] / df['JGB_Outstanding'] * 100
-    df['Interest_to_Tax'] = df['Interest_Payment'] / df['Tax_Revenue'] * 100
-    df['Avg_Interest_Rate'] = df['Interest_Payment'] / df['JGB_Outstanding'] * 100
-    df['Nikkei_USD'] = df['Nikkei225'] / df['USDJPY']
-    df['Interest_If_1pct_Up'] = df['Interest_Payment'] + df['JGB_Outstanding'] * 0.01
+    return add_derived_columns(df)
+
+
+def create_market_data(freq: str = 'FY_END', snapshot_dir: Path = SNAPSHOT_DIR) -> pd.DataFrame:
+    """
+    日次CSVスナップショット（market_data.SNAPSHOT_FILES）から任意頻度のデータセットを構築
     
-    return df
+    freq: 'FY_END'（年度末）/ 'FY_MEAN'（年度平均）/ 'M'（月次）/ 'W'（週次）
+    国債残高・日銀保有・利払い費・税収は create_historical_data() の年度値を割り当てる
+    列構成は create_historical_data() と同じ（plot_* / create_change_data にそのまま渡せる）
+    """
+    return build_market_frame(load_snapshots(snapshot_dir), create_historical_data(), freq)
 
 
 def create_change_data(df: pd.DataFrame) -> pd.DataFrame:
@@ -202,6 +221,11 @@ def add_source_note(ax, text="※概算値（公開資料の代表値を整理
                 fontsize=7, color='gray', ha='left', va='bottom')
 
 
+# 政策イベント（日付, ラベル, 色）
+POLICY_EVENTS = [('2001-03', 'QE開始', 'blue'), ('2013-04', '異次元緩和', 'purple'),
+                 ('2016-09', 'YCC', 'orange'), ('2024-03', '利上げ局面', 'red')]
+
+
 def plot_interest_payment_history(df: pd.DataFrame, outname: str) -> Path:
     fig, ax1 = plt.subplots(figsize=(14, 6))
     ax2 = ax1.twinx()
@@ -218,9 +242,7 @@ def plot_interest_payment_history(df: pd.DataFrame, outname: str) -> Path:
     ax2.tick_params(axis='y', labelcolor=COLORS['AVG_RATE'])
     ax1.grid(True, alpha=0.3, linestyle='--', axis='y')
     
-    events = [('2001-03', 'QE開始', 'blue'), ('2013-04', '異次元緩和', 'purple'),
-              ('2016-09', 'YCC', 'orange'), ('2024-03', '利上げ局面', 'red')]
-    for date_str, label, color in events:
+    for date_str, label, color in POLICY_EVENTS:
         date = pd.Timestamp(date_str)
         if df.index.min() <= date <= df.index.max():
             ax1.axvline(x=date, color=color, linestyle=':', alpha=0.8, linewidth=1.5)
@@ -244,36 +266,72 @@ def plot_interest_payment_history(df: pd.DataFrame, outname: str) -> Path:
     return out
 
 
+def create_rollover_projection(df: pd.DataFrame, shocks=(0.0, 1.0), horizon: int = 10) -> pd.DataFrame:
+    """
+    満期構成による借換えシミュレーション（金利が即時に shocks だけ変化し横ばい）
+
+    - 新規財源債は直近10年の残高増加の平均で一定
+    - Interest_Full_Repricing: 全債務が即時に借換わった場合の上限（旧「金利+1%の場合」）
+
+    Returns:
+        Year, Shock, Interest_Payment, JGB_Outstanding, Avg_Interest_Rate,
+        Repriced_Share, Interest_Full_Repricing（縦持ち）
+    """
+    ladder = initial_ladder(df)
+    net_issuance = df['JGB_Outstanding'].diff().iloc[-10:].mean()
+    paths = rate_shock_paths(df['JP10Y'].iloc[-1], shocks, horizon)
+    result = simulate_rollover(ladder, paths, net_issuance, start_year=df.index[-1].year + 1)
+
+    shock = np.repeat(np.asarray(shocks, dtype=float), horizon)
+    base = np.tile(result.interest[0], len(shocks))
+    outstanding = result.outstanding.ravel()
+    return pd.DataFrame({
+        'Year': np.tile(result.years, len(shocks)),
+        'Shock': shock,
+        'Interest_Payment': result.interest.ravel(),
+        'JGB_Outstanding': outstanding,
+        'Avg_Interest_Rate': result.average_rate.ravel(),
+        'Repriced_Share': result.repriced_share.ravel() * 100,
+        'Interest_Full_Repricing': base + outstanding * shock / 100,
+    })
+
+
 def plot_interest_rate_sensitivity(df: pd.DataFrame, outname: str) -> Path:
+    proj = create_rollover_projection(df)
+    base = proj[proj['Shock'] == 0.0]
+    up = proj[proj['Shock'] == 1.0]
+    
     fig, ax = plt.subplots(figsize=(14, 7))
     
-    ax.bar(df.index - pd.Timedelta(days=60), df['Interest_Payment'], 
-           width=120, alpha=0.8, color=COLORS['INTEREST'], label='現状利払い費')
-    ax.bar(df.index + pd.Timedelta(days=60), df['Interest_If_1pct_Up'], 
-           width=120, alpha=0.8, color=COLORS['SPREAD'], label='金利+1%の場合')
+    ax.bar(df.index.year, df['Interest_Payment'], width=0.8, alpha=0.5,
+           color=COLORS['INTEREST'], label='利払い費（実績）')
+    ax.bar(base['Year'] - 0.2, base['Interest_Payment'], width=0.4, alpha=0.8,
+           color=COLORS['INTEREST'], label='金利横ばい（借換え推計）')
+    ax.bar(up['Year'] + 0.2, up['Interest_Payment'], width=0.4, alpha=0.8,
+           color=COLORS['SPREAD'], label='金利+1%（借換え推計）')
+    ax.plot(up['Year'], up['Interest_Full_Repricing'], color=COLORS['SPREAD'], linestyle='--',
+            linewidth=1.5, alpha=0.7, label='金利+1%（全債務が即時に借換わった場合の上限）')
     
-    ax.set_title("金利1%上昇時の利払い費増加シミュレーション\n（※全債務が借換わった長期の上限イメージ）", 
+    ax.set_title("金利1%上昇時の利払い費増加シミュレーション\n（※満期構成に沿って借換えが進むにつれ効いてくる）", 
                  fontweight="bold", fontsize=14)
     ax.set_ylabel("利払い費 (兆円)", fontsize=11)
     ax.grid(True, alpha=0.3, linestyle='--', axis='y')
     ax.legend(loc='upper left')
     
-    latest = df.iloc[-1]
-    diff = latest['Interest_If_1pct_Up'] - latest['Interest_Payment']
-    ax.annotate(f'+{diff:.1f}兆円\n(+1%で)', 
-                xy=(df.index[-1] + pd.Timedelta(days=60), latest['Interest_If_1pct_Up']),
-                xytext=(df.index[-1] - pd.Timedelta(days=365*2), latest['Interest_If_1pct_Up'] + 3),
+    last_base, last_up = base.iloc[-1], up.iloc[-1]
+    diff = last_up['Interest_Payment'] - last_base['Interest_Payment']
+    ax.annotate(f'+{diff:.1f}兆円\n({len(up)}年後、借換え{last_up["Repriced_Share"]:.0f}%)', 
+                xy=(last_up['Year'] + 0.2, last_up['Interest_Payment']),
+                xytext=(last_up['Year'] - 8, last_up['Interest_Payment'] + 3),
                 fontsize=11, fontweight='bold', arrowprops=dict(arrowstyle='->', color='red'),
                 bbox=dict(boxstyle='round', facecolor='red', alpha=0.3))
     
-    note_text = ("※実際は国債満期があり金利上昇は時間差で効く\n"
-                 "　インフレ局面では税収も増加する傾向あり")
-    ax.text(0.02, 0.98, note_text, transform=ax.transAxes, fontsize=9,
+    note_text = ("※残存年数別の残高を償還・借換え（発行構成・年限別利率）で1年ずつ更新\n"
+                 "　新規財源債は直近10年の残高増加の平均　インフレ局面では税収も増加する傾向あり")
+    ax.text(0.02, 0.80, note_text, transform=ax.transAxes, fontsize=9,
             verticalalignment='top', bbox=dict(boxstyle='round', facecolor='lightyellow', alpha=0.8))
     
     add_source_note(ax)
-    ax.xaxis.set_major_formatter(mdates.DateFormatter("%Y"))
-    ax.xaxis.set_major_locator(mdates.YearLocator(base=5))
     fig.tight_layout()
     out = OUTDIR / outname
     fig.savefig(out, dpi=180, bbox_inches="tight")
@@ -281,6 +339,75 @@ def plot_interest_rate_sensitivity(df: pd.DataFrame, outname: str) -> Path:
     return out
 
 
+def create_rate_shock_surface(df: pd.DataFrame, shocks=None, horizon: int = 30) -> dict:
+    """
+    利払い費の応答曲面（金利ショック × 経過年数 × 発行構成）
+
+    - 既定は −1%〜+5% を 0.0025%pt 刻み（2,401本）× 1〜30年 × 4通りの発行構成 = 288,120点
+    - 発行構成は既存残高の満期構成にも適用（各構成で発行を続けてきた場合の定常構成）
+    - 税収は直近の Tax_Revenue で一定（税収比は金利上昇の影響だけを見る目安）
+
+    Returns:
+        shocks (S,), horizons (H,), mixes [X], added_interest (X, S, H),
+        interest_to_tax (X, S, H)
+    """
+    if shocks is None:
+        shocks = np.round(np.arange(-1.0, 5.0 + 1e-9, 0.0025), 4)
+    latest = df.iloc[-1]
+    net_issuance = df['JGB_Outstanding'].diff().iloc[-10:].mean()
+    interest, baseline = rate_shock_surface(df, latest['JP10Y'], shocks, horizon,
+                                            ISSUANCE_MIXES, net_issuance)
+    return {
+        'shocks': np.asarray(shocks),
+        'horizons': np.arange(1, horizon + 1),
+        'mixes': list(ISSUANCE_MIXES),
+        'added_interest': interest - baseline,
+        'interest_to_tax': interest / latest['Tax_Revenue'] * 100,
+    }
+
+
+def plot_rate_shock_surface(df: pd.DataFrame, outname: str) -> Path:
+    surface = create_rate_shock_surface(df)
+    shocks, horizons, mixes = surface['shocks'], surface['horizons'], surface['mixes']
+    
+    fig, axes = plt.subplots(2, len(mixes), figsize=(5 * len(mixes), 10), sharex=True, sharey=True)
+    panels = [
+        ('added_interest', '利払い費の増加 (兆円)', 'RdBu_r',
+         dict(vmin=-np.abs(surface['added_interest']).max(), vmax=np.abs(surface['added_interest']).max())),
+        ('interest_to_tax', '利払い費 / 税収 (%)', 'Oranges',
+         dict(vmin=0, vmax=surface['interest_to_tax'].max())),
+    ]
+    for row, (key, label, cmap, norm) in enumerate(panels):
+        for col, mix in enumerate(mixes):
+            ax = axes[row, col]
+            values = surface[key][col]
+            cs = ax.contourf(horizons, shocks, values, levels=20, cmap=cmap, **norm)
+            lines = ax.contour(horizons, shocks, values, levels=[10, 20, 30, 40] if row == 0 else [20, 30, 50],
+                               colors='black', linewidths=0.8)
+            ax.clabel(lines, fmt='%g', fontsize=8)
+            ax.axhline(0, color='gray', linewidth=0.8, linestyle=':')
+            if row == 0:
+                ax.set_title(f"発行構成: {mix}", fontweight="bold", fontsize=12)
+            if col == 0:
+                ax.set_ylabel("金利ショック (%pt)", fontsize=11)
+            if row == 1:
+                ax.set_xlabel("経過年数 (年)", fontsize=11)
+            ax.grid(True, alpha=0.3, linestyle='--')
+        fig.colorbar(cs, ax=axes[row], shrink=0.9, label=label)
+    
+    n_cells = surface['added_interest'].size
+    fig.suptitle(f"金利ショック × 経過年数 × 発行構成の利払い費応答（{n_cells:,}通り、満期構成による借換え推計）",
+                 fontsize=14, fontweight="bold")
+    fig.text(0.5, 0.01, "※税収は直近値で一定　新規財源債は直近10年の残高増加の平均　"
+             "※概算値（公開資料の代表値を整理）　出典: 財務省、日銀、FRED",
+             ha='center', fontsize=9, color='gray')
+    
+    out = OUTDIR / outname
+    fig.savefig(out, dpi=180, bbox_inches="tight")
+    plt.close(fig)
+    return out
+
+
 def plot_interest_to_tax_ratio(df: pd.DataFrame, outname: str) -> Path:
     fig, ax = plt.subplots(figsize=(14, 6))
     
@@ -440,10 +567,9 @@ def plot_nikkei_jpy_vs_usd(df: pd.DataFrame, outname: str) -> Path:
     return out
 
 
-def plot_correlation_matrix_change(df: pd.DataFrame, chg: pd.DataFrame, outname: str) -> Path:
+def plot_correlation_matrix_change(df: pd.DataFrame, chg: pd.DataFrame, ci: BootstrapCI,
+                                   outname: str) -> Path:
     """07: 相関行列：レベル vs 変化の比較（読み方ガイド＋有意性マーカー付き）"""
-    from scipy import stats
-    
     fig, axes = plt.subplots(1, 2, figsize=(15, 7))
     
     # レベルの相関
@@ -466,9 +592,11 @@ def plot_correlation_matrix_change(df: pd.DataFrame, chg: pd.DataFrame, outname:
     # 変化の相関（有意性マーカー付き）
     chg_cols = ['dlog_USDJPY', 'd_SPREAD_10Y', 'd_BOJ_Share', 'd_Interest_Payment', 'dlog_Nikkei']
     chg_labels = ['Δlog(USD/JPY)', 'Δ金利差', 'Δ日銀比率', 'Δ利払い費', 'Δlog(日経)']
-    chg_data = chg[chg_cols].dropna()
-    corr_chg = chg_data.corr()
-    n_obs = len(chg_data)
+    test = correlation_significance(chg).subset(chg_cols)
+    ci = ci.subset(chg_cols)
+    corr_chg = test.r
+    cell_text = test.labels()
+    n_obs = int(test.n.to_numpy().min())
     
     ax = axes[1]
     im2 = ax.imshow(corr_chg, cmap='RdBu_r', vmin=-1, vmax=1)
@@ -477,43 +605,35 @@ def plot_correlation_matrix_change(df: pd.DataFrame, chg: pd.DataFrame, outname:
     ax.set_xticklabels(chg_labels, rotation=45, ha='right')
     ax.set_yticklabels(chg_labels)
     
-    # 有意性検定とマーカー付与
+    # 有意性マーカー付きの数値（r・p値は correlation_significance で一括計算済み）
+    # + ブロック・ブートストラップの95%信頼区間（0を含まない区間は太字）
     for i in range(len(chg_labels)):
         for j in range(len(chg_labels)):
             r = corr_chg.iloc[i, j]
+            color = 'white' if abs(r) > 0.5 else 'black'
+            ax.text(j, i - 0.12, cell_text.iloc[i, j], ha='center', va='center',
+                   color=color, fontsize=9)
             if i != j:
-                # t検定でp値を計算
-                t_stat = r * np.sqrt((n_obs - 2) / (1 - r**2 + 1e-10))
-                p_val = 2 * (1 - stats.t.cdf(abs(t_stat), n_obs - 2))
-                # 有意性マーカー
-                if p_val < 0.01:
-                    marker = '**'
-                elif p_val < 0.05:
-                    marker = '*'
-                elif p_val < 0.10:
-                    marker = '†'
-                else:
-                    marker = ''
-                text = f'{r:.2f}{marker}'
-            else:
-                text = f'{r:.2f}'
-            ax.text(j, i, text, ha='center', va='center',
-                   color='white' if abs(r) > 0.5 else 'black', fontsize=9)
+                ax.text(j, i + 0.2, f'[{ci.lo.iloc[i, j]:+.2f}, {ci.hi.iloc[i, j]:+.2f}]',
+                       ha='center', va='center', color=color, fontsize=6.5,
+                       fontweight='bold' if ci.excludes_zero().iloc[i, j] else 'normal')
     ax.set_title("変化（前年差）の相関\n（市場分析の定石＝因果検討の本丸）", fontweight="bold", fontsize=12)
     
-    plt.colorbar(im2, ax=axes, shrink=0.8, label='相関係数')
+    plt.colorbar(im2, ax=axes[1], shrink=0.8, label='相関係数')
     fig.suptitle("相関行列の比較：「レベル」vs「変化」", fontsize=14, fontweight="bold")
     
     # 読み方ガイドを追加
     guide_text = (
         "【読み方】 相関係数 r：+1〜-1（+：同方向、-：逆方向、0：関係薄）\n"
         f"強さの目安：|r|≒0.1=弱、0.3=弱〜中、0.5=中〜強、0.7+=強　　"
-        f"有意性：**p<0.01　*p<0.05　†p<0.10　　n={n_obs}年　　※相関≠因果"
+        f"有意性：**p<0.01　*p<0.05　†p<0.10　　n={n_obs}年　　※相関≠因果\n"
+        f"[ ] = {ci.level:.0%}信頼区間（ブロック長{ci.block}年の moving block bootstrap、{ci.n_boot:,}回）"
+        f"　太字＝区間が0を含まない"
     )
     fig.text(0.5, 0.02, guide_text, ha='center', fontsize=9, 
              bbox=dict(boxstyle='round', facecolor='lightyellow', alpha=0.8))
     
-    fig.tight_layout(rect=[0, 0.08, 1, 0.95])
+    fig.tight_layout(rect=[0, 0.11, 1, 0.95])
     out = OUTDIR / outname
     fig.savefig(out, dpi=180, bbox_inches="tight")
     plt.close(fig)
@@ -585,13 +705,13 @@ def plot_comprehensive_dashboard_v3(df: pd.DataFrame, chg: pd.DataFrame, outname
     ax5.grid(True, alpha=0.3)
     
     # Panel 6: 変化ベースの相関行列（有意性マーカー付き）
-    from scipy import stats
     ax6 = fig.add_subplot(gs[2, 1])
     chg_cols = ['dlog_USDJPY', 'd_SPREAD_10Y', 'd_BOJ_Share', 'dlog_Nikkei', 'dlog_Nikkei_USD']
     chg_labels = ['Δlog(JPY)', 'Δ金利差', 'Δ日銀比率', 'Δlog(日経)', 'Δlog(日経$)']
-    chg_data = chg[chg_cols].dropna()
-    corr_chg = chg_data.corr()
-    n_obs = len(chg_data)
+    test = correlation_significance(chg).subset(chg_cols)
+    corr_chg = test.r
+    cell_text = test.labels()
+    n_obs = int(test.n.to_numpy().min())
     im = ax6.imshow(corr_chg, cmap='RdBu_r', vmin=-1, vmax=1)
     ax6.set_xticks(range(len(chg_labels)))
     ax6.set_yticks(range(len(chg_labels)))
@@ -600,14 +720,7 @@ def plot_comprehensive_dashboard_v3(df: pd.DataFrame, chg: pd.DataFrame, outname
     for i in range(len(chg_labels)):
         for j in range(len(chg_labels)):
             r = corr_chg.iloc[i, j]
-            if i != j:
-                t_stat = r * np.sqrt((n_obs - 2) / (1 - r**2 + 1e-10))
-                p_val = 2 * (1 - stats.t.cdf(abs(t_stat), n_obs - 2))
-                marker = '**' if p_val < 0.01 else ('*' if p_val < 0.05 else ('†' if p_val < 0.10 else ''))
-                text = f'{r:.2f}{marker}'
-            else:
-                text = f'{r:.2f}'
-            ax6.text(j, i, text, ha='center', va='center',
+            ax6.text(j, i, cell_text.iloc[i, j], ha='center', va='center',
                     color='white' if abs(r) > 0.5 else 'black', fontsize=8)
     ax6.set_title(f"⑥ 相関行列（変化ベース, n={n_obs}）\n**p<.01 *p<.05 †p<.10", fontweight="bold", fontsize=10)
     plt.colorbar(im, ax=ax6, shrink=0.8)
@@ -622,6 +735,229 @@ def plot_comprehensive_dashboard_v3(df: pd.DataFrame, chg: pd.DataFrame, outname
     return out
 
 
+CHANGE_LABELS = {
+    'dlog_USDJPY': 'Δlog(USD/JPY)', 'd_SPREAD_10Y': 'Δ金利差', 'd_BOJ_Share': 'Δ日銀比率',
+    'dlog_Nikkei': 'Δlog(日経)', 'dlog_Nikkei_USD': 'Δlog(日経$)',
+    'd_Interest_Payment': 'Δ利払い費', 'd_Interest_to_Tax': 'Δ利払い/税収',
+}
+
+
+def plot_rolling_correlation(chg: pd.DataFrame, outname: str, windows=(5, 10, 15)) -> Path:
+    """11: 変化の相関の時間変化（全ペア × 窓長、累積和で一括計算）"""
+    chg_cols = ['dlog_USDJPY', 'd_SPREAD_10Y', 'd_BOJ_Share', 'd_Interest_Payment', 'dlog_Nikkei']
+    cube = rolling_correlation_cube(chg[chg_cols], windows)
+    
+    n_cols = 5
+    n_rows = -(-len(cube.pairs) // n_cols)
+    fig, axes = plt.subplots(n_rows, n_cols, figsize=(4 * n_cols, 3.4 * n_rows), sharex=True, sharey=True)
+    styles = ['-', '--', ':']
+    alphas = np.linspace(1.0, 0.4, len(cube.windows))         # 窓長がいくつでも (0, 1] に収まる
+    for k, (a, b) in enumerate(cube.pairs):
+        ax = axes.flat[k]
+        for w, window in enumerate(cube.windows):
+            ax.plot(cube.index, cube.r[:, w, k], linewidth=1.8, color=COLORS['USDJPY'],
+                    alpha=alphas[w], linestyle=styles[w % len(styles)], label=f'{window}期間')
+        ax.axhline(0, color='gray', linewidth=0.8)
+        ax.set_title(f"{CHANGE_LABELS[a]} × {CHANGE_LABELS[b]}", fontsize=10, fontweight='bold')
+        ax.set_ylim(-1, 1)
+        ax.grid(True, alpha=0.3, linestyle='--')
+        ax.xaxis.set_major_formatter(mdates.DateFormatter("%Y"))
+    for ax in axes.flat[len(cube.pairs):]:
+        ax.axis('off')
+    axes.flat[0].legend(loc='lower left', fontsize=8)
+    
+    fig.suptitle("変化の相関の時間変化（ローリング相関、窓 = 直近の観測数）", fontsize=14, fontweight="bold")
+    fig.text(0.5, -0.01, '※窓内の有効観測数が窓長の半分（最低3）未満の期間は非表示　'
+             '※概算値（公開資料の代表値を整理）　出典: 財務省、日銀、FRED',
+             ha='center', fontsize=9, color='gray')
+    fig.tight_layout()
+    out = OUTDIR / outname
+    fig.savefig(out, dpi=180, bbox_inches="tight")
+    plt.close(fig)
+    return out
+
+
+# 因果連鎖図（09）の矢印の向き（先行 → 遅行の仮説）
+CAUSAL_CHAIN_PAIRS = [
+    ('d_BOJ_Share', 'd_SPREAD_10Y'),
+    ('d_SPREAD_10Y', 'dlog_USDJPY'),
+    ('dlog_USDJPY', 'dlog_Nikkei_USD'),
+    ('d_Interest_Payment', 'd_BOJ_Share'),
+    ('dlog_USDJPY', 'dlog_Nikkei'),
+    ('d_SPREAD_10Y', 'dlog_Nikkei_USD'),
+]
+
+def plot_time_varying_beta(chg: pd.DataFrame, outname: str) -> Path:
+    """13: ドル円の金利差ベータの時間変化（カルマン平滑化、ノイズ分散は最尤のグリッド探索）"""
+    kb, grid = time_varying_beta(chg, 'dlog_USDJPY', 'd_SPREAD_10Y')
+    est = kb.frame()
+    both = chg[['dlog_USDJPY', 'd_SPREAD_10Y']].dropna()
+    fixed_beta = np.polyfit(both['d_SPREAD_10Y'], both['dlog_USDJPY'], 1)[0]
+    
+    fig, (ax1, ax2) = plt.subplots(1, 2, figsize=(18, 6), gridspec_kw={'width_ratios': [2.2, 1]})
+    x_num = mdates.date2num(est.index.to_pydatetime())
+    ax1.fill_between(x_num, est['Beta_Lower'], est['Beta_Upper'], color=COLORS['USDJPY'], alpha=0.2,
+                     label='95%区間（平滑化）')
+    ax1.plot(est.index, est['Beta'], linewidth=2.5, color=COLORS['USDJPY'],
+             label='時変ベータ β_t（観測のある時点のみ）')
+    ax1.axhline(fixed_beta, color=COLORS['SPREAD'], linestyle='--', linewidth=1.5,
+                label=f'固定ベータ（全期間OLS）= {fixed_beta:.3f}')
+    ax1.axhline(0, color='gray', linewidth=0.8)
+    ax1.set_title("ドル円の金利差ベータ：Δlog(USD/JPY) = α_t + β_t・Δ金利差", fontweight="bold", fontsize=13)
+    ax1.set_ylabel("β_t（金利差 +1%pt あたりのドル円変化率）", fontsize=11)
+    ax1.xaxis.set_major_formatter(mdates.DateFormatter("%Y"))
+    ax1.xaxis.set_major_locator(mdates.YearLocator(base=5))
+    ax1.grid(True, alpha=0.3, linestyle='--')
+    ax1.legend(loc='upper left', fontsize=9)
+    add_source_note(ax1)
+    
+    # ベータのノイズ分散ごとの最大対数尤度（他のパラメータで最大化）
+    profile = grid.groupby('beta_var')['loglik'].max()
+    ax2.semilogx(profile.index, profile.values, color=COLORS['USDJPY'], marker='o', linewidth=2)
+    ax2.axvline(kb.beta_var, color=COLORS['SPREAD'], linestyle='--', linewidth=1.5,
+                label=f'最尤: {kb.beta_var:.2e}')
+    ax2.set_title("ベータのノイズ分散のプロファイル尤度", fontweight="bold", fontsize=13)
+    ax2.set_xlabel("β のノイズ分散（小さいほど固定ベータに近い）", fontsize=10)
+    ax2.set_ylabel("対数尤度", fontsize=11)
+    ax2.grid(True, alpha=0.3, linestyle='--')
+    ax2.legend(loc='lower left', fontsize=9)
+    
+    fig.tight_layout()
+    out = OUTDIR / outname
+    fig.savefig(out, dpi=180, bbox_inches="tight")
+    plt.close(fig)
+    return out
+
+
+# 構造変化点の推定対象（列, 'df' | 'chg', 表示名, 色）
+BREAK_SERIES = [
+    ('Avg_Interest_Rate', 'df', '平均適用金利 (%)', COLORS['AVG_RATE']),
+    ('BOJ_Share', 'df', '日銀保有比率 (%)', COLORS['BOJ_SHARE']),
+    ('SPREAD_10Y', 'df', '日米金利差 (%pt)', COLORS['SPREAD']),
+    ('dlog_USDJPY', 'chg', 'Δlog(USD/JPY)', COLORS['USDJPY']),
+]
+
+
+def create_structural_breaks(df: pd.DataFrame, max_breaks: int = 3) -> pd.DataFrame:
+    """BREAK_SERIES の各系列の変化点（平均シフト、変化点の数は BIC）と 95% 信頼区間"""
+    frames = {'df': df, 'chg': create_change_data(df)}
+    rows = []
+    for col, source, _, _ in BREAK_SERIES:
+        table = detect_breaks(frames[source][col], max_breaks).table()
+        table.insert(0, 'Series', col)
+        rows.append(table)
+    return pd.concat(rows, ignore_index=True)
+
+
+def plot_structural_breaks(df: pd.DataFrame, outname: str, max_breaks: int = 3) -> Path:
+    """14: 推定した構造変化点（実線 + 95%区間）と政策イベント（点線）の比較"""
+    frames = {'df': df, 'chg': create_change_data(df)}
+    
+    fig, axes = plt.subplots(2, 2, figsize=(18, 10))
+    for ax, (col, source, label, color) in zip(axes.flat, BREAK_SERIES):
+        series = frames[source][col]
+        result = detect_breaks(series, max_breaks)
+        ax.plot(series.index, series, color=color, marker='o', markersize=4, linewidth=1.8, label=label)
+        ax.step(result.fitted().index, result.fitted(), where='post', color='black', linewidth=2,
+                alpha=0.7, label='区間平均（推定）')
+        for _, brk in result.table().iterrows():
+            ax.axvspan(brk['Lower'], brk['Upper'], color='gray', alpha=0.2)
+            ax.axvline(brk['Break'], color='black', linewidth=1.5)
+            ax.annotate(f"{brk['Break']:%Y}", xy=(brk['Break'], 1.0), xycoords=('data', 'axes fraction'),
+                        xytext=(0, 3), textcoords='offset points', ha='center', fontsize=9,
+                        fontweight='bold')
+        for date_str, event, ev_color in POLICY_EVENTS:
+            date = pd.Timestamp(date_str)
+            if series.index.min() <= date <= series.index.max():
+                ax.axvline(date, color=ev_color, linestyle=':', linewidth=1.5, alpha=0.8)
+                ax.annotate(event, xy=(date, 0.02), xycoords=('data', 'axes fraction'), rotation=90,
+                            fontsize=8, color=ev_color, ha='right', va='bottom')
+        ax.set_title(f"{label}：変化点 {len(result.breaks)} 個（BIC）", fontsize=12, fontweight="bold", pad=16)
+        ax.xaxis.set_major_formatter(mdates.DateFormatter("%Y"))
+        ax.xaxis.set_major_locator(mdates.YearLocator(base=5))
+        ax.grid(True, alpha=0.3, linestyle='--')
+        ax.legend(loc='upper left', fontsize=9)
+    
+    fig.suptitle("構造変化点の推定（Bai–Perron型・動的計画法）と政策イベント", fontsize=14, fontweight="bold")
+    fig.text(0.5, -0.01, '※実線 = 推定した変化点（新しい区間の最初の年度）、灰色 = 95%信頼区間（Bai 1997）、'
+             '点線 = 政策イベント　※概算値（公開資料の代表値を整理）　出典: 財務省、日銀、FRED',
+             ha='center', fontsize=9, color='gray')
+    fig.tight_layout()
+    out = OUTDIR / outname
+    fig.savefig(out, dpi=180, bbox_inches="tight")
+    plt.close(fig)
+    return out
+
+
+# 因果連鎖図の VAR（列の順序 = 直交化ショックの順序、連鎖の上流から）
+CAUSAL_CHAIN_VAR = ['d_Interest_Payment', 'd_BOJ_Share', 'd_SPREAD_10Y', 'dlog_USDJPY']
+CAUSAL_CHAIN_VAR_PMAX = 2
+
+
+def create_chain_var(df: pd.DataFrame) -> pd.DataFrame:
+    """
+    因果連鎖の矢印ごとの Granger F 検定と1年後のインパルス応答（BIC で選んだ VAR 次数）
+
+    Returns:
+        DataFrame（Cause, Effect, p, F, p_value, IRF_1y = 原因1標準偏差ショックへの1年後の応答）
+    """
+    chg = create_change_data(df)
+    sel = fit_var(chg, CAUSAL_CHAIN_VAR, CAUSAL_CHAIN_VAR_PMAX)
+    fit = sel.best()
+    irf = fit.impulse_response(horizon=1)
+    rows = []
+    for cause, effect in CAUSAL_CHAIN_PAIRS:
+        if cause not in CAUSAL_CHAIN_VAR or effect not in CAUSAL_CHAIN_VAR:
+            continue
+        test = sel.granger_test(cause, effect, fit.p)
+        rows.append({'Cause': cause, 'Effect': effect, 'p': fit.p, 'F': test['F'],
+                     'p_value': test['p_value'],
+                     'IRF_1y': irf[1, CAUSAL_CHAIN_VAR.index(effect), CAUSAL_CHAIN_VAR.index(cause)]})
+    return pd.DataFrame(rows)
+
+
+def plot_lead_lag(chg: pd.DataFrame, outname: str, max_lag: int = 5) -> Path:
+    """12: 先行・遅行の相互相関（因果連鎖図の矢印ごとのラグ・プロファイル）"""
+    lead_lag = lead_lag_correlation(chg, max_lag)
+    
+    n_cols = 3
+    n_rows = -(-len(CAUSAL_CHAIN_PAIRS) // n_cols)
+    fig, axes = plt.subplots(n_rows, n_cols, figsize=(5.5 * n_cols, 4 * n_rows), sharey=True)
+    for ax, (x, y) in zip(axes.flat, CAUSAL_CHAIN_PAIRS):
+        r, n = lead_lag.profile(x, y)
+        colors = [COLORS['SPREAD'] if lag > 0 else (COLORS['USDJPY'] if lag < 0 else 'gray')
+                  for lag in lead_lag.lags]
+        ax.bar(lead_lag.lags, r, color=colors, alpha=0.8)
+        with np.errstate(divide='ignore', invalid='ignore'):
+            band = 1.96 / np.sqrt(n)
+        ax.plot(lead_lag.lags, band, color='black', linestyle='--', linewidth=1, alpha=0.6)
+        ax.plot(lead_lag.lags, -band, color='black', linestyle='--', linewidth=1, alpha=0.6)
+        peak = np.nanargmax(np.abs(r))
+        ax.annotate(f'ピーク: ラグ{lead_lag.lags[peak]:+d}\nr={r[peak]:.2f}',
+                    xy=(lead_lag.lags[peak], r[peak]), xytext=(0.03, 0.97), textcoords='axes fraction',
+                    va='top', fontsize=9, arrowprops=dict(arrowstyle='->', color='gray'),
+                    bbox=dict(boxstyle='round', facecolor='lightyellow', alpha=0.8))
+        ax.axhline(0, color='gray', linewidth=0.8)
+        ax.set_title(f"{CHANGE_LABELS[x]} → {CHANGE_LABELS[y]}", fontsize=11, fontweight='bold')
+        ax.set_xlabel(f"ラグ k（+：{CHANGE_LABELS[x]} が先行）", fontsize=9)
+        ax.set_xticks(lead_lag.lags)
+        ax.set_ylim(-1, 1)
+        ax.grid(True, alpha=0.3, linestyle='--', axis='y')
+    for ax in axes.flat[len(CAUSAL_CHAIN_PAIRS):]:
+        ax.axis('off')
+    axes[0, 0].set_ylabel("corr(x_t, y_{t+k})")
+    
+    fig.suptitle("先行・遅行の相互相関（因果連鎖図の矢印の向きの検証）", fontsize=14, fontweight="bold")
+    fig.text(0.5, -0.01, '※破線 = ±1.96/√n（無相関の目安）　赤 = 矢印の向きに先行、青 = 逆向き　※相関≠因果　'
+             '※概算値（公開資料の代表値を整理）　出典: 財務省、日銀、FRED',
+             ha='center', fontsize=9, color='gray')
+    fig.tight_layout()
+    out = OUTDIR / outname
+    fig.savefig(out, dpi=180, bbox_inches="tight")
+    plt.close(fig)
+    return out
+
+
 def plot_causal_chain_v3(df: pd.DataFrame, outname: str) -> Path:
     """09: 因果連鎖図（v3: 色統一、データ動的取得）"""
     fig, ax = plt.subplots(figsize=(18, 12))
@@ -638,14 +974,17 @@ def plot_causal_chain_v3(df: pd.DataFrame, outname: str) -> Path:
     usdjpy = latest['USDJPY']
     interest = latest['Interest_Payment']
     avg_rate = latest['Avg_Interest_Rate']
-    interest_shock = jgb * 0.01
+    proj = create_rollover_projection(df)
+    interest_shock = (proj.loc[proj['Shock'] == 1.0, 'Interest_Payment'].iloc[-1]
+                      - proj.loc[proj['Shock'] == 0.0, 'Interest_Payment'].iloc[-1])
+    var = create_chain_var(df).set_index(['Cause', 'Effect'])
     
     boxes = [
         (12, 82, f'国債残高\n{jgb:.0f}兆円', COLORS['JGB'], 14),
         (12, 58, f'日銀保有\n{boj:.0f}兆円\n({boj_share:.0f}%)', COLORS['BOJ_SHARE'], 14),
         (12, 34, f'低金利維持\n(平均{avg_rate:.1f}%)', COLORS['AVG_RATE'], 14),
         (40, 82, f'利払い費\n{interest:.1f}兆円/年', COLORS['INTEREST'], 14),
-        (40, 58, f'金利上昇不可\n(+1%で+{interest_shock:.0f}兆円)', '#8e44ad', 14),
+        (40, 58, f'金利上昇不可\n(+1%で10年後\n+{interest_shock:.0f}兆円)', '#8e44ad', 14),
         (40, 34, '金融緩和\n継続', '#3498db', 14),
         (68, 58, f'日米金利差\n拡大 ({spread:.1f}%pt)', COLORS['SPREAD'], 16),
         (88, 58, f'円安\n{usdjpy:.0f}円', COLORS['USDJPY'], 16),
@@ -670,6 +1009,25 @@ def plot_causal_chain_v3(df: pd.DataFrame, outname: str) -> Path:
         ax.annotate('', xy=(x2, y2), xytext=(x1, y1),
                    arrowprops=dict(arrowstyle='->', color=color, lw=2.5))
     
+    # 矢印の裏付け（VAR の Granger 検定）
+    arrow_tests = [
+        (('d_BOJ_Share', 'd_SPREAD_10Y'), 56, 40, COLORS['SPREAD']),
+        (('d_SPREAD_10Y', 'dlog_USDJPY'), 78, 71, COLORS['USDJPY']),
+    ]
+    for pair, x, y, color in arrow_tests:
+        test = var.loc[pair]
+        ax.text(x, y, f"F={test['F']:.1f}\np={test['p_value']:.2f}", ha='center', va='center',
+                fontsize=9, color=color, fontweight='bold',
+                bbox=dict(boxstyle='round', facecolor='white', edgecolor=color, alpha=0.9))
+    
+    lines = [f"VAR({int(var['p'].iloc[0])}) Granger 検定（変化データ）"]
+    for (cause, effect), test in var.iterrows():
+        mark = next((m for threshold, m in SIGNIFICANCE_MARKERS if test['p_value'] < threshold), '')
+        lines.append(f"{CHANGE_LABELS[cause]} → {CHANGE_LABELS[effect]}: "
+                     f"F={test['F']:.2f} p={test['p_value']:.2f}{mark}  1年後応答 {test['IRF_1y']:+.3f}")
+    ax.text(80, 24, '\n'.join(lines), ha='center', va='center', fontsize=9,
+            bbox=dict(boxstyle='round', facecolor='lightyellow', alpha=0.9))
+    
     ax.text(50, 96, '「国債が円安の根っこ」因果連鎖（2025年3月末データ）', ha='center', va='center',
            fontsize=20, fontweight='bold')
     ax.text(50, 91, '※「根っこ＝直接原因」ではなく、"金利を上げにくい構造（レジーム）"として描写', 
@@ -707,7 +1065,62 @@ def plot_causal_chain_v3(df: pd.DataFrame, outname: str) -> Path:
     return out
 
 
-def main():
+def plot_jobs(df: pd.DataFrame, chg: pd.DataFrame) -> list[tuple]:
+    """
+    描画ジョブ (関数, 引数, 出力ファイル名) の一覧（この順にログを出す）
+
+    ブートストラップ信頼区間は自前のプロセスプールを使うので、描画ワーカーの中で
+    プールを入れ子に起動しないよう親プロセスで先に計算して引数で渡す
+    """
+    ci = bootstrap_ci(chg)
+    return [
+        (plot_interest_payment_history, (df,), "01_interest_payment_history.png"),
+        (plot_interest_rate_sensitivity, (df,), "02_interest_rate_sensitivity.png"),
+        (plot_interest_to_tax_ratio, (df,), "03_interest_to_tax_ratio.png"),
+        (plot_jgb_boj_split_1, (df,), "04a_jgb_boj_holdings.png"),
+        (plot_jgb_boj_split_2, (df,), "04b_boj_share_usdjpy.png"),
+        (plot_yield_spread_usdjpy, (df,), "05_yield_spread_usdjpy.png"),
+        (plot_nikkei_jpy_vs_usd, (df,), "06_nikkei_jpy_vs_usd.png"),
+        (plot_correlation_matrix_change, (df, chg, ci), "07_correlation_level_vs_change.png"),
+        (plot_comprehensive_dashboard_v3, (df, chg), "08_comprehensive_dashboard_v3.png"),
+        (plot_causal_chain_v3, (df,), "09_causal_chain_v3.png"),
+        (plot_rate_shock_surface, (df,), "10_rate_shock_surface.png"),
+        (plot_rolling_correlation, (chg,), "11_rolling_correlation.png"),
+        (plot_lead_lag, (chg,), "12_lead_lag_correlation.png"),
+        (plot_time_varying_beta, (chg,), "13_time_varying_beta.png"),
+        (plot_structural_breaks, (df,), "14_structural_breaks.png"),
+    ]
+
+
+def _init_render_worker() -> None:
+    matplotlib.use("Agg", force=True)
+
+
+def _render(job: tuple) -> tuple[str, float]:
+    """1枚描画して (ファイル名, 所要秒数) を返す"""
+    func, args, outname = job
+    start = time.perf_counter()
+    path = func(*args, outname)
+    plt.close('all')
+    return Path(path).name, time.perf_counter() - start
+
+
+def render_plots(jobs: list[tuple], parallel: bool = False, n_workers: int | None = None):
+    """
+    描画ジョブを順に（parallel=True ならプロセスプールで）実行し、(ファイル名, 秒) を
+    ジョブの順に yield する（完了順によらずログの順序は一定）
+    """
+    if not parallel:
+        for job in jobs:
+            yield _render(job)
+        return
+    n_workers = n_workers or os.cpu_count() or 1
+    with ProcessPoolExecutor(max_workers=min(n_workers, len(jobs)),
+                             initializer=_init_render_worker) as pool:
+        yield from pool.map(_render, jobs)
+
+
+def main(parallel: bool = False, n_workers: int | None = None):
     print("=" * 70)
     print("ドル円・金利差・国債・利払い費・日経平均 完全分析")
     print("v3.1: 2025年3月末（令和6年度末）データ更新")
@@ -718,25 +1131,16 @@ def main():
     chg = create_change_data(df)
     print(f"    期間: {df.index.min().strftime('%Y')}年度 〜 {df.index.max().strftime('%Y')}年度")
     print(f"    観測数: {len(df)}")
+    if snapshots_available():
+        monthly = create_market_data('M')
+        print(f"    日次スナップショット（{SNAPSHOT_DIR}）→ 月次: {len(monthly)} 期間 "
+              f"({monthly.index.min():%Y-%m} 〜 {monthly.index.max():%Y-%m})")
     
-    print("\n[2] グラフ生成中...")
-    
-    plots = [
-        (lambda d: plot_interest_payment_history(d, "01_interest_payment_history.png"), df),
-        (lambda d: plot_interest_rate_sensitivity(d, "02_interest_rate_sensitivity.png"), df),
-        (lambda d: plot_interest_to_tax_ratio(d, "03_interest_to_tax_ratio.png"), df),
-        (lambda d: plot_jgb_boj_split_1(d, "04a_jgb_boj_holdings.png"), df),
-        (lambda d: plot_jgb_boj_split_2(d, "04b_boj_share_usdjpy.png"), df),
-        (lambda d: plot_yield_spread_usdjpy(d, "05_yield_spread_usdjpy.png"), df),
-        (lambda d: plot_nikkei_jpy_vs_usd(d, "06_nikkei_jpy_vs_usd.png"), df),
-        (lambda d: plot_correlation_matrix_change(df, chg, "07_correlation_level_vs_change.png"), df),
-        (lambda d: plot_comprehensive_dashboard_v3(df, chg, "08_comprehensive_dashboard_v3.png"), df),
-        (lambda d: plot_causal_chain_v3(d, "09_causal_chain_v3.png"), df),
-    ]
+    print(f"\n[2] グラフ生成中...{'（並列）' if parallel else ''}")
     
-    for i, (func, data) in enumerate(plots, 1):
-        path = func(data)
-        print(f"    [{i}/{len(plots)}] ✓ {path.name if hasattr(path, 'name') else path}")
+    jobs = plot_jobs(df, chg)
+    for i, (name, seconds) in enumerate(render_plots(jobs, parallel=parallel, n_workers=n_workers), 1):
+        print(f"    [{i}/{len(jobs)}] ✓ {name} ({seconds:.1f}s)")
     
     print(f"\n[3] 出力先: {OUTDIR.resolve()}")
     
@@ -750,7 +1154,13 @@ def main():
     print(f"  日銀保有比率:      {latest['BOJ_Share']:.1f} %")
     print(f"  利払い費:          {latest['Interest_Payment']:.1f} 兆円")
     print(f"  利払い費/税収:     {latest['Interest_to_Tax']:.1f} %")
-    print(f"  金利+1%時の利払い: {latest['Interest_If_1pct_Up']:.1f} 兆円 (+{latest['Interest_If_1pct_Up']-latest['Interest_Payment']:.1f}兆円)")
+    proj = create_rollover_projection(df)
+    base = proj[proj['Shock'] == 0.0].set_index('Year')
+    up = proj[proj['Shock'] == 1.0].set_index('Year')
+    for year in base.index[[0, 4, 9]]:
+        print(f"  金利+1%時の利払い: {up.at[year, 'Interest_Payment']:.1f} 兆円 "
+              f"(+{up.at[year, 'Interest_Payment'] - base.at[year, 'Interest_Payment']:.1f}兆円, "
+              f"{year}年度, 借換え{up.at[year, 'Repriced_Share']:.0f}%)")
     print(f"  日経225(円):       {latest['Nikkei225']:.0f}")
     print(f"  日経225(ドル):     {latest['Nikkei_USD']:.0f}")
     
@@ -758,7 +1168,47 @@ def main():
     print("変化ベースの相関行列（市場分析の定石）")
     print("=" * 70)
     chg_cols = ['dlog_USDJPY', 'd_SPREAD_10Y', 'd_BOJ_Share', 'dlog_Nikkei', 'dlog_Nikkei_USD', 'd_Interest_Payment']
-    print(chg[chg_cols].dropna().corr().round(3).to_string())
+    test = correlation_significance(chg).subset(chg_cols)
+    print(test.r.round(3).to_string())
+    print("\n  p値（両側t検定、ペアごとの有効観測数で計算）:")
+    print(test.p.round(3).to_string())
+    
+    print("\n" + "=" * 70)
+    print("先行・遅行（相互相関のピーク、因果連鎖図の矢印ごと）")
+    print("=" * 70)
+    lead_lag = lead_lag_correlation(chg, max_lag=5)
+    for x, y in CAUSAL_CHAIN_PAIRS:
+        r, _ = lead_lag.profile(x, y)
+        peak = np.nanargmax(np.abs(r))
+        print(f"  {x} → {y}: ピークのラグ {lead_lag.lags[peak]:+d} (r={r[peak]:+.2f}), "
+              f"同時点 r={r[len(r) // 2]:+.2f}")
+    
+    print("\n" + "=" * 70)
+    print(f"VAR・Granger 因果性（{' → '.join(CAUSAL_CHAIN_VAR)}）")
+    print("=" * 70)
+    sel = fit_var(chg, CAUSAL_CHAIN_VAR, CAUSAL_CHAIN_VAR_PMAX)
+    print(sel.criteria.round(3).to_string())
+    print(f"\n  BIC で選んだ次数: p = {sel.best_order()}")
+    print(create_chain_var(df).round(3).to_string(index=False))
+    
+    print("\n" + "=" * 70)
+    print("ドル円の金利差ベータ（カルマン平滑化）")
+    print("=" * 70)
+    kb, grid = time_varying_beta(chg, 'dlog_USDJPY', 'd_SPREAD_10Y')
+    print(f"  ノイズ分散（最尤、{len(grid)}通りから選択）: 観測 {kb.obs_var:.2e}, "
+          f"α {kb.alpha_var:.2e}, β {kb.beta_var:.2e}（対数尤度 {kb.loglik:.1f}）")
+    est = kb.frame().dropna()
+    for date in est.index[[0, len(est) // 2, -1]]:
+        print(f"  {date:%Y}年度: β = {est.at[date, 'Beta']:+.4f} "
+              f"[{est.at[date, 'Beta_Lower']:+.4f}, {est.at[date, 'Beta_Upper']:+.4f}]")
+    
+    print("\n" + "=" * 70)
+    print("構造変化点（平均シフト、95%信頼区間）")
+    print("=" * 70)
+    breaks = create_structural_breaks(df)
+    for _, brk in breaks.iterrows():
+        print(f"  {brk['Series']:<18} {brk['Break']:%Y}年度 [{brk['Lower']:%Y}〜{brk['Upper']:%Y}]  "
+              f"平均 {brk['Mean_Before']:+.3f} → {brk['Mean_After']:+.3f}")
     
     csv_path = OUTDIR / "data_complete_v3.csv"
     df.to_csv(csv_path)
@@ -767,7 +1217,20 @@ def main():
     chg_csv_path = OUTDIR / "data_changes_v3.csv"
     chg.to_csv(chg_csv_path)
     print(f"[5] 変化データCSV: {chg_csv_path}")
+    
+    rollover_csv_path = OUTDIR / "rollover_projection_v3.csv"
+    proj.to_csv(rollover_csv_path, index=False)
+    print(f"[6] 借換え推計CSV: {rollover_csv_path}")
+    
+    if snapshots_available():
+        monthly_csv_path = OUTDIR / "data_monthly_v3.csv"
+        monthly.to_csv(monthly_csv_path)
+        print(f"[7] 月次データCSV: {monthly_csv_path}")
 
 
 if __name__ == "__main__":
-    main()
+    parser = argparse.ArgumentParser(description="ドル円・金利差・国債・利払い費・日経平均 完全分析")
+    parser.add_argument("--parallel", action="store_true", help="グラフをプロセスプールで並列に描画")
+    parser.add_argument("--workers", type=int, default=None, help="並列描画のプロセス数（既定: CPU数）")
+    args = parser.parse_args()
+    main(parallel=args.parallel, n_workers=args.workers)
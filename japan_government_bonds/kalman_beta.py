@@ -0,0 +1,221 @@
+# kalman_beta.py
+# 時変回帰 y_t = α_t + β_t x_t + ε_t のカルマンフィルタ・平滑化（ノイズ分散の候補を一括で尤度評価）
+# Date: 2026-10-17
+#
+# ============================================================
+# モデル（状態 = (α_t, β_t)、ランダムウォーク）
+# ============================================================
+#   y_t = α_t + β_t x_t + ε_t,   ε_t ~ N(0, obs_var)
+#   α_t = α_{t-1} + η_t,         η_t ~ N(0, alpha_var)
+#   β_t = β_{t-1} + ζ_t,         ζ_t ~ N(0, beta_var)
+# - 例: y = dlog_USDJPY、x = d_SPREAD_10Y（金利差1%pt の変化に対するドル円の変化率）
+# - 初期値は近似的な散漫事前分布（分散を y・x の分散の 1e4 倍）とし、
+#   対数尤度は先頭 DIFFUSE_STEPS 個の有効観測を除いて合計する
+# - 欠損の時点は予測のみ（更新しない）。その時点の α・β は前後の観測から補った値で
+#   推定ではないので、KalmanBeta.frame() では既定で NaN にする（先頭の欠損は事前分布そのもの）
+#
+# ============================================================
+# 実装
+# ============================================================
+# - 観測が1次元なので、2×2 の共分散を (P_αα, P_αβ, P_ββ) の3成分で持ち、
+#   更新式を成分ごとの配列演算で書く（逆行列なし）
+# - ハイパーパラメータは (G,) の配列として渡し、時点ループ1本で G 通りを同時に計算
+#   （日次 1万時点 × 数百通りでも時点ごとの演算は長さ G の配列のみ、pandas は使わない）
+# - 平滑化（Rauch–Tung–Striebel）は選ばれたパラメータについてだけ行い、
+#   フィルタの値を (T, G) で保存する
+# - 結果は (chg の内容, 列, グリッド) でメモ化
+# ============================================================
+
+from __future__ import annotations
+from dataclasses import dataclass
+import numpy as np
+import pandas as pd
+
+from correlation_stats import _frame_key
+
+DIFFUSE_SCALE = 1e4
+DIFFUSE_STEPS = 2       # 状態の次元（散漫初期化の影響を受ける観測数）
+
+_KALMAN_CACHE: dict[tuple, tuple['KalmanBeta', pd.DataFrame]] = {}
+
+
+@dataclass(frozen=True)
+class KalmanBeta:
+    """平滑化した α_t・β_t と標準誤差（いずれも (T,)）、観測のある時点、選ばれたノイズ分散と対数尤度"""
+    index: pd.Index
+    observed: np.ndarray
+    alpha: np.ndarray
+    beta: np.ndarray
+    alpha_se: np.ndarray
+    beta_se: np.ndarray
+    obs_var: float
+    alpha_var: float
+    beta_var: float
+    loglik: float
+
+    def frame(self, z: float = 1.96, observed_only: bool = True) -> pd.DataFrame:
+        """
+        Alpha, Beta, Beta_Lower, Beta_Upper（β ± z·SE）の DataFrame
+
+        observed_only: x・y のどちらかが欠損の時点を NaN にする（False なら補った値も返す）
+        """
+        df = pd.DataFrame({
+            'Alpha': self.alpha, 'Alpha_SE': self.alpha_se,
+            'Beta': self.beta, 'Beta_SE': self.beta_se,
+            'Beta_Lower': self.beta - z * self.beta_se,
+            'Beta_Upper': self.beta + z * self.beta_se,
+        }, index=self.index)
+        if observed_only:
+            df[~self.observed] = np.nan
+        return df
+
+
+def _initial_state(x: np.ndarray, y: np.ndarray) -> tuple[float, float]:
+    """散漫初期化の分散 (P_αα, P_ββ)"""
+    var_y = np.nanvar(y) or 1.0
+    var_x = np.nanvar(x) or 1.0
+    return DIFFUSE_SCALE * var_y, DIFFUSE_SCALE * var_y / var_x
+
+
+def kalman_filter(x: np.ndarray, y: np.ndarray, obs_var, alpha_var, beta_var,
+                  store: bool = False) -> dict[str, np.ndarray]:
+    """
+    ノイズ分散の候補 (G,)（broadcast 可）ごとのカルマンフィルタ
+
+    x, y: (T,)（NaN = 欠損）
+
+    Returns:
+        {'loglik': (G,)}。store=True なら加えて
+        フィルタ後の 'a', 'b', 'p_aa', 'p_ab', 'p_bb' と予測の 'q_aa', 'q_ab', 'q_bb'（各 (T, G)）
+    """
+    x = np.asarray(x, dtype=float)
+    y = np.asarray(y, dtype=float)
+    r, qa, qb = np.broadcast_arrays(*(np.atleast_1d(np.asarray(v, dtype=float))
+                                      for v in (obs_var, alpha_var, beta_var)))
+    shape = r.shape
+    n_obs = len(y)
+    valid = ~(np.isnan(x) | np.isnan(y))
+    counted = valid & (np.cumsum(valid) > DIFFUSE_STEPS)
+
+    a = np.zeros(shape)
+    b = np.zeros(shape)
+    p0_aa, p0_bb = _initial_state(x, y)
+    p_aa = np.full(shape, p0_aa)
+    p_ab = np.zeros(shape)
+    p_bb = np.full(shape, p0_bb)
+    loglik = np.zeros(shape)
+    if store:
+        out = {k: np.empty((n_obs,) + shape) for k in
+               ('a', 'b', 'p_aa', 'p_ab', 'p_bb', 'q_aa', 'q_ab', 'q_bb')}
+
+    for t in range(n_obs):
+        if t > 0:
+            p_aa = p_aa + qa
+            p_bb = p_bb + qb
+        if store:
+            out['q_aa'][t], out['q_ab'][t], out['q_bb'][t] = p_aa, p_ab, p_bb
+        if valid[t]:
+            xt = x[t]
+            h_a = p_aa + xt * p_ab                   # P Hᵀ（H = [1, x_t]）
+            h_b = p_ab + xt * p_bb
+            f = h_a + xt * h_b + r                   # 予測誤差の分散
+            v = y[t] - (a + b * xt)
+            a = a + h_a / f * v
+            b = b + h_b / f * v
+            p_aa = p_aa - h_a * h_a / f
+            p_ab = p_ab - h_a * h_b / f
+            p_bb = p_bb - h_b * h_b / f
+            if counted[t]:
+                loglik -= 0.5 * (np.log(2 * np.pi * f) + v * v / f)
+        if store:
+            out['a'][t], out['b'][t] = a, b
+            out['p_aa'][t], out['p_ab'][t], out['p_bb'][t] = p_aa, p_ab, p_bb
+
+    if store:
+        out['loglik'] = loglik
+        return out
+    return {'loglik': loglik}
+
+
+def kalman_smoother(filtered: dict[str, np.ndarray]) -> dict[str, np.ndarray]:
+    """
+    RTS 平滑化（遷移行列 = 単位行列）
+
+    filtered: kalman_filter(..., store=True) の出力
+
+    Returns:
+        'a', 'b', 'p_aa', 'p_ab', 'p_bb'（各 (T, G)）
+    """
+    n_obs = len(filtered['a'])
+    state = np.stack([filtered['a'], filtered['b']], axis=-1)                    # (T, G, 2)
+    pf = np.stack([np.stack([filtered['p_aa'], filtered['p_ab']], axis=-1),
+                   np.stack([filtered['p_ab'], filtered['p_bb']], axis=-1)], axis=-2)   # (T, G, 2, 2)
+    pp = np.stack([np.stack([filtered['q_aa'], filtered['q_ab']], axis=-1),
+                   np.stack([filtered['q_ab'], filtered['q_bb']], axis=-1)], axis=-2)
+
+    s = state.copy()
+    ps = pf.copy()
+    for t in range(n_obs - 2, -1, -1):
+        gain = pf[t] @ np.linalg.inv(pp[t + 1])                                  # (G, 2, 2)
+        s[t] = state[t] + (gain @ (s[t + 1] - state[t])[..., None])[..., 0]
+        ps[t] = pf[t] + gain @ (ps[t + 1] - pp[t + 1]) @ np.swapaxes(gain, -1, -2)
+    return {'a': s[..., 0], 'b': s[..., 1],
+            'p_aa': ps[..., 0, 0], 'p_ab': ps[..., 0, 1], 'p_bb': ps[..., 1, 1]}
+
+
+def default_grid(x: np.ndarray, y: np.ndarray, n: int = 9) -> dict[str, np.ndarray]:
+    """
+    ノイズ分散の候補（対数等間隔、y・x の分散に比例）
+
+    obs_var:   var(y) × 10^[-2, 0]
+    alpha_var: var(y) × 10^[-6, -1]
+    beta_var:  var(y)/var(x) × 10^[-6, -1]
+    """
+    var_y = np.nanvar(y) or 1.0
+    var_x = np.nanvar(x) or 1.0
+    return {
+        'obs_var': var_y * np.logspace(-2, 0, n),
+        'alpha_var': var_y * np.logspace(-6, -1, n),
+        'beta_var': var_y / var_x * np.logspace(-6, -1, n),
+    }
+
+
+def time_varying_beta(chg: pd.DataFrame, y_col: str = 'dlog_USDJPY', x_col: str = 'd_SPREAD_10Y',
+                      grid: dict[str, np.ndarray] | None = None) -> tuple[KalmanBeta, pd.DataFrame]:
+    """
+    ノイズ分散をグリッドの全組み合わせで尤度評価し、最尤の組で平滑化した α_t・β_t
+
+    grid: {'obs_var', 'alpha_var', 'beta_var'} → 候補の配列（None なら default_grid）
+
+    Returns:
+        (KalmanBeta, 全組み合わせの対数尤度の DataFrame（obs_var, alpha_var, beta_var, loglik）)
+    """
+    x = chg[x_col].to_numpy(dtype=float)
+    y = chg[y_col].to_numpy(dtype=float)
+    grid = default_grid(x, y) if grid is None else grid
+    key = (_frame_key(chg[[y_col, x_col]]),
+           tuple((k, np.asarray(v, dtype=float).tobytes()) for k, v in sorted(grid.items())))
+    cached = _KALMAN_CACHE.get(key)
+    if cached is None:
+        r, qa, qb = (g.ravel() for g in np.meshgrid(grid['obs_var'], grid['alpha_var'],
+                                                     grid['beta_var'], indexing='ij'))
+        loglik = kalman_filter(x, y, r, qa, qb)['loglik']
+        best = int(np.nanargmax(loglik))
+
+        filtered = kalman_filter(x, y, r[best], qa[best], qb[best], store=True)
+        smoothed = kalman_smoother(filtered)
+        result = KalmanBeta(
+            index=chg.index, observed=~(np.isnan(x) | np.isnan(y)),
+            alpha=smoothed['a'][:, 0], beta=smoothed['b'][:, 0],
+            alpha_se=np.sqrt(smoothed['p_aa'][:, 0]), beta_se=np.sqrt(smoothed['p_bb'][:, 0]),
+            obs_var=float(r[best]), alpha_var=float(qa[best]), beta_var=float(qb[best]),
+            loglik=float(loglik[best]),
+        )
+        table = pd.DataFrame({'obs_var': r, 'alpha_var': qa, 'beta_var': qb, 'loglik': loglik})
+        cached = (result, table)
+        _KALMAN_CACHE[key] = cached
+    return cached[0], cached[1].copy()
+
+
+def clear_cache() -> None:
+    _KALMAN_CACHE.clear()
@@ -0,0 +1,148 @@
+# market_data.py
+# 日次の市場データ（CSVスナップショット）の読み込みと年度末・年度平均・月次・週次への集計
+# Date: 2026-10-17
+#
+# ============================================================
+# 入力
+# ============================================================
+# - SNAPSHOT_DIR 以下の日次CSV（1列目 = 日付、2列目 = 値。FRED形式の "." は欠損扱い）
+#     usdjpy_daily.csv     USD/JPY
+#     jgb10y_daily.csv     日本10年国債利回り
+#     ust10y_daily.csv     米国10年国債利回り
+#     nikkei225_daily.csv  日経225終値
+# - 国債残高・日銀保有・利払い費・税収は年度値のみ（create_historical_data() の値）
+#
+# ============================================================
+# 集計
+# ============================================================
+# - 日付から期間コード（整数）を配列演算で一度だけ作り、groupby(コード) で集計する
+#     FY_END / FY_MEAN: 年度コード = 年 + (月 ≥ 4)  … 3月末で区切る（ラベルは3/31）
+#     M:                年×12 + 月                  … ラベルは月末
+#     W:                月曜起点の通し週番号         … ラベルは日曜
+# - 市場データ: FY_MEAN は期間平均、それ以外は期間内の最終値
+# - 年度値: 残高（ストック）は年度末の値を日付で線形補間、
+#           利払い費・税収（フロー）はその日が属する年度の値
+#   （データ期間外は端の年度の値）
+# - どの頻度でも create_historical_data() と同じ列構成の DataFrame を返す
+# ============================================================
+
+from __future__ import annotations
+from pathlib import Path
+import numpy as np
+import pandas as pd
+
+SNAPSHOT_DIR = Path("data")
+SNAPSHOT_FILES = {
+    'USDJPY': 'usdjpy_daily.csv',
+    'JP10Y': 'jgb10y_daily.csv',
+    'US10Y': 'ust10y_daily.csv',
+    'Nikkei225': 'nikkei225_daily.csv',
+}
+
+FISCAL_STOCKS = ('JGB_Outstanding', 'BOJ_Holdings')
+FISCAL_FLOWS = ('Interest_Payment', 'Tax_Revenue')
+BASE_COLUMNS = ('USDJPY', 'JP10Y', 'US10Y', 'JGB_Outstanding', 'BOJ_Holdings',
+                'Interest_Payment', 'Nikkei225', 'Tax_Revenue')
+FREQUENCIES = ('FY_END', 'FY_MEAN', 'M', 'W')
+
+
+def add_derived_columns(df: pd.DataFrame) -> pd.DataFrame:
+    """金利差・日銀保有比率・税収比・平均金利・ドル建て日経を追加（in place、df を返す）"""
+    df['SPREAD_10Y'] = df['US10Y'] - df['JP10Y']
+    df['BOJ_Share'] = df['BOJ_Holdings'] / df['JGB_Outstanding'] * 100
+    df['Interest_to_Tax'] = df['Interest_Payment'] / df['Tax_Revenue'] * 100
+    df['Avg_Interest_Rate'] = df['Interest_Payment'] / df['JGB_Outstanding'] * 100
+    df['Nikkei_USD'] = df['Nikkei225'] / df['USDJPY']
+    return df
+
+
+def snapshots_available(snapshot_dir: Path = SNAPSHOT_DIR) -> bool:
+    return all((Path(snapshot_dir) / name).exists() for name in SNAPSHOT_FILES.values())
+
+
+def read_snapshot(path: Path, column: str) -> pd.Series:
+    """日次CSV（日付, 値）を Series に（重複日付は最後の値）"""
+    raw = pd.read_csv(path, usecols=[0, 1])
+    dates = pd.to_datetime(raw.iloc[:, 0])
+    values = pd.to_numeric(raw.iloc[:, 1], errors='coerce')
+    series = pd.Series(values.to_numpy(), index=pd.DatetimeIndex(dates, name='date'), name=column)
+    series = series[~series.index.duplicated(keep='last')]
+    return series.sort_index()
+
+
+def load_snapshots(snapshot_dir: Path = SNAPSHOT_DIR) -> pd.DataFrame:
+    """市場データの日次テーブル（列 = SNAPSHOT_FILES のキー、全系列が欠損の日は除く）"""
+    series = [read_snapshot(Path(snapshot_dir) / name, col) for col, name in SNAPSHOT_FILES.items()]
+    daily = pd.concat(series, axis=1, join='outer').dropna(how='all')
+    daily.index.name = 'date'
+    return daily
+
+
+def period_codes(index: pd.DatetimeIndex, freq: str) -> tuple[np.ndarray, np.ndarray]:
+    """
+    日付 → 期間コード（int64）と各日付の期間ラベル（datetime64[D]）
+
+    Returns:
+        codes: (N,)  labels: (N,)
+    """
+    days = index.values.astype('datetime64[D]')
+    if freq in ('FY_END', 'FY_MEAN'):
+        months = index.values.astype('datetime64[M]').astype(np.int64)      # 1970-01 = 0
+        codes = 1970 + (months - 3) // 12 + 1                              # 4月始まり → 翌3月末の年
+        labels = (codes - 1970).astype('datetime64[Y]').astype('datetime64[M]') + 2
+        labels = (labels + 1).astype('datetime64[D]') - 1                   # その年の3/31
+    elif freq == 'M':
+        months = index.values.astype('datetime64[M]')
+        codes = months.astype(np.int64)
+        labels = (months + 1).astype('datetime64[D]') - 1
+    elif freq == 'W':
+        ordinal = days.astype(np.int64)
+        codes = (ordinal + 3) // 7                                          # 1970-01-01 は木曜
+        labels = (codes * 7 + 3).astype('datetime64[D]')                    # 日曜
+    else:
+        raise ValueError(f"freq must be one of {FREQUENCIES}: {freq!r}")
+    return codes, labels
+
+
+def resample_market(daily: pd.DataFrame, freq: str) -> pd.DataFrame:
+    """市場データを期間ごとに集計（FY_MEAN は平均、それ以外は最終値）。index = 期間ラベル"""
+    codes, labels = period_codes(daily.index, freq)
+    grouped = daily.groupby(codes, sort=True)
+    out = grouped.mean() if freq == 'FY_MEAN' else grouped.last()
+    _, first = np.unique(codes, return_index=True)
+    out.index = pd.DatetimeIndex(labels[first], name='date')
+    return out
+
+
+def attach_fiscal(market: pd.DataFrame, annual: pd.DataFrame) -> pd.DataFrame:
+    """
+    年度値（annual: 3/31 の DatetimeIndex）を market の日付に割り当てる
+
+    ストックは日付で線形補間、フローは属する年度の値
+    """
+    out = market.copy()
+    annual = annual.sort_index()
+    dates = out.index.values.astype('datetime64[D]').astype(np.int64)
+    anchor = annual.index.values.astype('datetime64[D]').astype(np.int64)
+    for col in FISCAL_STOCKS:
+        out[col] = np.interp(dates, anchor, annual[col].to_numpy(dtype=float))
+
+    codes, _ = period_codes(out.index, 'FY_END')
+    years = annual.index.year.to_numpy()
+    pos = np.clip(np.searchsorted(years, codes), 0, len(years) - 1)
+    for col in FISCAL_FLOWS:
+        out[col] = annual[col].to_numpy(dtype=float)[pos]
+    return out
+
+
+def build_market_frame(daily: pd.DataFrame, annual: pd.DataFrame, freq: str = 'FY_END') -> pd.DataFrame:
+    """
+    日次の市場データ + 年度値 → create_historical_data() と同じ列構成のテーブル
+
+    daily:  load_snapshots() の出力
+    annual: create_historical_data() の出力（年度値の供給元）
+    """
+    df = attach_fiscal(resample_market(daily, freq), annual)
+    df = df[list(BASE_COLUMNS)]
+    df.index.name = 'date'
+    return add_derived_columns(df)
@@ -0,0 +1,225 @@
+# var_model.py
+# 変化データ（chg）の VAR 推計・Granger 因果性検定・インパルス応答（ラグ次数 × 変数の組を一括）
+# Date: 2026-10-17
+#
+# ============================================================
+# 推計
+# ============================================================
+# - y_t = c + A_1 y_{t-1} + … + A_p y_{t-p} + e_t（K 変数、定数項あり）
+# - ラグ p_max までの説明変数行列 Z = [1, y_{t-1}, …, y_{t-p_max}] を一度だけ作り、
+#   次数 p のモデルはその先頭 1 + K·p 列を使う
+#   （どの次数も同じ標本 = 先頭 p_max 行と欠損行を除いた T 行で推計し、情報量基準を比較可能にする）
+# - 次数ごとに全方程式を1回の最小二乗（右辺 Y (T, K) をまとめて lstsq）で解く
+# - 情報量基準（Lütkepohl）: ln|Σ| + c_T · p·K² / T
+#     AIC: c_T = 2,  BIC: c_T = ln T,  HQ: c_T = 2 ln ln T
+#
+# ============================================================
+# Granger 因果性（全ての順序ペア）
+# ============================================================
+# - 原因 j のラグ p 本を除いた制約付きモデルを原因ごとに作り、
+#   (K, T, 1 + (K−1)·p) のスタックとして1回の QR で全方程式の残差平方和を求める
+#   （RSS_r = ‖Y − Q Qᵀ Y‖²、係数は解かない）
+# - F = ((RSS_r − RSS_u) / p) / (RSS_u / (T − 1 − K·p))、自由度 (p, T − 1 − K·p)
+#
+# ============================================================
+# インパルス応答
+# ============================================================
+# - コンパニオン行列 A (K·p, K·p) の累乗 A^h の左上 K×K ブロック = Φ_h
+# - 直交化: Φ_h · chol(Σ)（ショックの順序 = 列の順序、因果連鎖の上流から並べる）
+# ============================================================
+
+from __future__ import annotations
+from dataclasses import dataclass
+import numpy as np
+import pandas as pd
+from scipy import stats
+
+from correlation_stats import _frame_key
+
+INFORMATION_CRITERIA = ('AIC', 'BIC', 'HQ')
+
+_VAR_CACHE: dict[tuple, 'VARSelection'] = {}
+
+
+@dataclass(frozen=True)
+class VARFit:
+    """
+    次数 p の VAR の推計結果
+
+    coef:  (1 + K·p, K)  行 = [定数, y_{t-1} の K 列, …, y_{t-p} の K 列]、列 = 方程式
+    sigma: (K, K)        残差の共分散（最尤推定、T で割る）
+    """
+    columns: list[str]
+    p: int
+    coef: np.ndarray
+    sigma: np.ndarray
+    n_obs: int
+
+    def companion(self) -> np.ndarray:
+        """コンパニオン行列 (K·p, K·p)"""
+        k = len(self.columns)
+        top = self.coef[1:].T                                   # (K, K·p) = [A_1 … A_p]
+        lower = np.eye(k * (self.p - 1), k * self.p)
+        return np.vstack([top, lower])
+
+    def impulse_response(self, horizon: int = 10, orthogonal: bool = True,
+                         cumulative: bool = False) -> np.ndarray:
+        """
+        インパルス応答 (horizon + 1, K, K)  [h, 応答する変数, ショック]
+
+        orthogonal: 1標準偏差の直交化ショック（False なら各変数の1単位ショック）
+        cumulative: 累積応答（変化率の VAR から水準への効果を見る）
+        """
+        k = len(self.columns)
+        a = self.companion()
+        power = np.eye(k * self.p)
+        out = np.empty((horizon + 1, k, k))
+        for h in range(horizon + 1):
+            out[h] = power[:k, :k]
+            power = a @ power
+        if orthogonal:
+            out = out @ np.linalg.cholesky(self.sigma)
+        return np.cumsum(out, axis=0) if cumulative else out
+
+    def stable(self) -> bool:
+        return bool(np.all(np.abs(np.linalg.eigvals(self.companion())) < 1))
+
+
+@dataclass(frozen=True)
+class VARSelection:
+    """
+    次数 1〜p_max の VAR と検定結果
+
+    criteria: index = p、列 = AIC, BIC, HQ, n_obs
+    granger:  p, Cause, Effect, F, df1, df2, p_value（全次数 × 全順序ペア）
+    """
+    columns: list[str]
+    fits: dict[int, VARFit]
+    criteria: pd.DataFrame
+    granger: pd.DataFrame
+
+    def best_order(self, criterion: str = 'BIC') -> int:
+        if criterion not in INFORMATION_CRITERIA:
+            raise ValueError(f"criterion must be one of {INFORMATION_CRITERIA}: {criterion!r}")
+        return int(self.criteria[criterion].idxmin())
+
+    def best(self, criterion: str = 'BIC') -> VARFit:
+        return self.fits[self.best_order(criterion)]
+
+    def granger_test(self, cause: str, effect: str, p: int | None = None) -> pd.Series:
+        """cause → effect の F 検定（p = None なら BIC で選んだ次数）"""
+        p = self.best_order() if p is None else p
+        g = self.granger
+        row = g[(g['p'] == p) & (g['Cause'] == cause) & (g['Effect'] == effect)]
+        return row.iloc[0]
+
+
+def lag_design(values: np.ndarray, p_max: int) -> tuple[np.ndarray, np.ndarray]:
+    """
+    被説明変数 Y (T, K) とラグ p_max までの説明変数 Z (T, 1 + K·p_max)
+
+    values: (N, K)。Y・Z のいずれかに欠損がある行は除く
+    """
+    values = np.asarray(values, dtype=float)
+    n_obs = len(values)
+    y = values[p_max:]
+    lags = [values[p_max - l:n_obs - l] for l in range(1, p_max + 1)]
+    z = np.hstack([np.ones((n_obs - p_max, 1))] + lags)
+    keep = ~(np.isnan(y).any(axis=1) | np.isnan(z).any(axis=1))
+    return y[keep], z[keep]
+
+
+def _granger_rss(y: np.ndarray, z: np.ndarray, k: int, p: int) -> np.ndarray:
+    """原因 j のラグを除いたモデルの残差平方和 [j, 方程式 i]、shape = (K, K)"""
+    cols = np.arange(1 + k * p)
+    owner = np.r_[-1, np.tile(np.arange(k), p)]               # 各列のラグ変数（定数は −1）
+    keep = np.stack([cols[owner != j] for j in range(k)])     # (K, 1 + (K−1)·p)
+    restricted = np.moveaxis(z[:, keep], 1, 0)                # (K, T, 1 + (K−1)·p)
+    q, _ = np.linalg.qr(restricted)
+    fitted = q @ (np.swapaxes(q, 1, 2) @ y)                   # (K, T, K)
+    return ((y - fitted) ** 2).sum(axis=1)
+
+
+def fit_var(chg: pd.DataFrame, columns: list[str] | None = None, p_max: int = 2) -> VARSelection:
+    """
+    chg[columns] の VAR(1)〜VAR(p_max)、情報量基準と Granger 検定
+
+    結果は (chg[columns] の内容, p_max) でメモ化する
+    """
+    columns = list(chg.columns if columns is None else columns)
+    frame = chg[columns]
+    key = (_frame_key(frame), p_max)
+    cached = _VAR_CACHE.get(key)
+    if cached is not None:
+        return cached
+
+    k = len(columns)
+    y, z = lag_design(frame.to_numpy(dtype=float), p_max)
+    n_obs = len(y)
+    if n_obs <= 1 + k * p_max:
+        raise ValueError(f"観測数 {n_obs} が VAR({p_max})・{k} 変数の推計に足りない")
+
+    fits: dict[int, VARFit] = {}
+    criteria = []
+    granger = []
+    cause, effect = np.meshgrid(np.arange(k), np.arange(k), indexing='ij')
+    off = cause != effect
+    for p in range(1, p_max + 1):
+        zp = z[:, :1 + k * p]
+        coef, *_ = np.linalg.lstsq(zp, y, rcond=None)             # 全方程式を一括
+        resid = y - zp @ coef
+        rss = (resid ** 2).sum(axis=0)                            # (K,)
+        sigma = resid.T @ resid / n_obs
+        fits[p] = VARFit(columns=columns, p=p, coef=coef, sigma=sigma, n_obs=n_obs)
+
+        _, logdet = np.linalg.slogdet(sigma)
+        penalty = p * k * k / n_obs
+        criteria.append({'p': p, 'AIC': logdet + 2 * penalty, 'BIC': logdet + np.log(n_obs) * penalty,
+                         'HQ': logdet + 2 * np.log(np.log(n_obs)) * penalty, 'n_obs': n_obs})
+
+        df2 = n_obs - 1 - k * p
+        rss_r = _granger_rss(y, z[:, :1 + k * p], k, p)
+        with np.errstate(divide='ignore', invalid='ignore'):
+            f = ((rss_r - rss[None, :]) / p) / (rss[None, :] / df2)
+        granger.append(pd.DataFrame({
+            'p': p,
+            'Cause': np.asarray(columns)[cause[off]],
+            'Effect': np.asarray(columns)[effect[off]],
+            'F': f[off],
+            'df1': p,
+            'df2': df2,
+            'p_value': stats.f.sf(f[off], p, df2),
+        }))
+
+    cached = VARSelection(columns=columns, fits=fits,
+                          criteria=pd.DataFrame(criteria).set_index('p'),
+                          granger=pd.concat(granger, ignore_index=True))
+    _VAR_CACHE[key] = cached
+    return cached
+
+
+def var_sweep(chg: pd.DataFrame, subsets: list[list[str]], p_max: int = 2,
+              window: int | None = None, step: int = 1) -> pd.DataFrame:
+    """
+    変数の組 × 推計期間（window 行の移動窓、None なら全期間）の Granger 検定を縦持ちで返す
+
+    列: Subset, Start, End, p, Selected（BIC で選ばれた次数か）, Cause, Effect, F, df1, df2, p_value
+    """
+    n_obs = len(chg)
+    starts = [0] if window is None else range(0, n_obs - window + 1, step)
+    rows = []
+    for columns in subsets:
+        for s in starts:
+            part = chg.iloc[s:] if window is None else chg.iloc[s:s + window]
+            sel = fit_var(part, columns, p_max)
+            g = sel.granger.copy()
+            g.insert(0, 'Subset', ' + '.join(columns))
+            g.insert(1, 'Start', part.index[0])
+            g.insert(2, 'End', part.index[-1])
+            g.insert(4, 'Selected', g['p'] == sel.best_order())
+            rows.append(g)
+    return pd.concat(rows, ignore_index=True)
+
+
+def clear_cache() -> None:
+    _VAR_CACHE.clear()
@@ -0,0 +1,94 @@
+# age_bands.py
+# 各歳人口の年齢方向の累積和による任意年齢区分の集計
+# Date: 2026-10-17
+#
+# ============================================================
+# 方針
+# ============================================================
+# - 各歳人口 P(a) の累積和 C(a) = P(0) + … + P(a-1) を一度だけ作る
+# - 任意の区分 [lo, hi) の人口は C(hi) - C(lo) の引き算1回（年・バリアント数によらず O(1)/要素）
+# - 年少・高齢の境界年齢を変えた従属人口指数・PSR を、全年・全バリアント・
+#   複数の境界年齢について一括で計算する
+#     例: 生産年齢 20-69歳、高齢 70歳以上 / 75歳以上、介護需要 85歳以上
+# ============================================================
+
+from __future__ import annotations
+import numpy as np
+import pandas as pd
+
+from cohort_projection import N_AGES, CohortResult
+
+
+class AgeBands:
+    """
+    各歳・男女別人口 (..., Y, 2, N_AGES) の累積和
+
+    bands.total(65)          → 65歳以上、shape = (..., Y)
+    bands.band(20, 70)       → 20-69歳
+    bands.band(85, sex=1)    → 女性85歳以上
+    """
+    __slots__ = ('years', '_cum_by_sex', '_cum')
+
+    def __init__(self, years: np.ndarray, population: np.ndarray):
+        self.years = np.asarray(years)
+        cum = np.zeros(population.shape[:-1] + (N_AGES + 1,))
+        np.cumsum(population, axis=-1, out=cum[..., 1:])
+        self._cum_by_sex = cum                  # (..., Y, 2, N_AGES+1)
+        self._cum = cum.sum(axis=-2)            # (..., Y, N_AGES+1)
+
+    @classmethod
+    def from_result(cls, result: CohortResult) -> 'AgeBands':
+        return cls(result.years, result.population)
+
+    def band(self, lo, hi=N_AGES, sex: int | None = None) -> np.ndarray:
+        """
+        [lo, hi) 歳の人口（hi 省略時は lo 歳以上）
+
+        lo, hi は整数または配列（配列の場合は末尾に区分の軸が付く）
+        """
+        cum = self._cum if sex is None else self._cum_by_sex[..., sex, :]
+        lo, hi = np.broadcast_arrays(np.asarray(lo), np.asarray(hi))
+        return cum[..., hi] - cum[..., lo]
+
+    def total(self, lo=0, sex: int | None = None) -> np.ndarray:
+        """lo 歳以上の人口"""
+        return self.band(lo, N_AGES, sex)
+
+    def indicators(self, young_end=15, old_start=65) -> dict[str, np.ndarray]:
+        """
+        境界年齢を変えた従属人口指数・PSR
+
+        年少 = [0, young_end)、生産年齢 = [young_end, old_start)、高齢 = [old_start, ∞)
+        young_end, old_start は配列でもよい（broadcast した形が末尾の軸になる）
+        """
+        young_end, old_start = np.broadcast_arrays(np.asarray(young_end), np.asarray(old_start))
+        young = self.band(0, young_end)
+        working = self.band(young_end, old_start)
+        elderly = self.band(old_start)
+        return {
+            'Young_Dependency': young / working * 100,
+            'Old_Dependency': elderly / working * 100,
+            'Total_Dependency': (young + elderly) / working * 100,
+            'PSR': working / elderly,
+        }
+
+    def threshold_table(self, thresholds: list[tuple[int, int]]) -> pd.DataFrame:
+        """
+        複数の (young_end, old_start) について従属人口指数・PSR を縦持ちで返す
+        （バリアント軸のない推計結果のみ）
+
+        Returns:
+            Year, Working_Ages, Total_Dependency, PSR, Old_Dependency, Young_Dependency
+        """
+        if self._cum.ndim != 2:
+            raise ValueError("threshold_table() requires a single variant")
+        young_end, old_start = np.array(thresholds).T
+        values = self.indicators(young_end, old_start)          # 各 (Y, K)
+        labels = [f'{y}-{o - 1}歳' for y, o in thresholds]
+        n_years, n_thresholds = len(self.years), len(thresholds)
+        return pd.DataFrame({
+            'Year': np.repeat(self.years, n_thresholds),
+            'Working_Ages': np.tile(labels, n_years),
+            **{k: values[k].ravel() for k in
+               ('Total_Dependency', 'PSR', 'Old_Dependency', 'Young_Dependency')},
+        })
@@ -0,0 +1,443 @@
+# cohort_projection.py
+# コーホート要因法による人口推計エンジン（各歳 0〜105歳以上・男女別）
+# Date: 2026-10-17
+#
+# ============================================================
+# 概要
+# ============================================================
+# - 基準人口: 2025年（社人研 令和5年推計 出生中位・死亡中位の
+#   年齢3区分・75歳以上人口に合わせて各歳・男女別に按分）
+# - 出生: 女性の年齢別出生率（ASFR）× 女性人口（期首・期末の平均）
+# - 死亡: 年齢別生残率（Siler型死亡率モデル + 年率一定の死亡率改善）
+# - 国際人口移動: 年齢・男女別の純移動数を期末に加算
+# - 1年分の推計は Leslie 行列（副対角の生残率 + 第1行の出生）を
+#   帯行列として一括適用する（年齢についての Python ループなし）
+#
+# ============================================================
+# 注記
+# ============================================================
+# - 人口単位: 万人（japan_population_pyramid_projection_v3.py と同じ）
+# - 既定の仮定値は公表資料の代表値を整理した概算値であり、
+#   社人研推計そのものの再現ではない
+# - 配列の先頭に任意のバッチ軸（バリアント等）を持たせることができる
+# ============================================================
+
+from __future__ import annotations
+from dataclasses import dataclass
+import numpy as np
+import pandas as pd
+
+from life_table import life_table, survival_ratios
+
+# =========================
+# 定数
+# =========================
+N_AGES = 106                 # 0〜104歳 + 105歳以上（開放区間）
+OPEN_AGE = N_AGES - 1
+AGES = np.arange(N_AGES)
+SEXES = ('male', 'female')
+MALE, FEMALE = 0, 1
+
+BASE_YEAR = 2025
+SEX_RATIO_AT_BIRTH = 1.05    # 出生性比（女性100に対する男性）
+
+# 2025年の5歳階級別人口（男女計、万人）- 各歳按分の形状に使用
+# (下限年齢, 人口)  ※最終階級は105歳以上
+BASE_5YR_2025 = [
+    (0, 410), (5, 470), (10, 520), (15, 540), (20, 620), (25, 640),
+    (30, 630), (35, 700), (40, 780), (45, 920), (50, 960), (55, 830),
+    (60, 740), (65, 720), (70, 820), (75, 900), (80, 640), (85, 420),
+    (90, 180), (95, 45), (100, 9), (105, 1),
+]
+
+# 社人研 令和5年推計（出生中位・死亡中位）2025年の年齢区分別人口（万人）
+# 各歳按分後にこの合計へ合わせる
+BASE_BANDS_2025 = [
+    (0, 15, 1369),       # 年少人口
+    (15, 65, 7296),      # 生産年齢人口
+    (65, 75, 3661 - 2180),
+    (75, N_AGES, 2180),  # 後期高齢者
+]
+
+# 年齢別の男性比率（男性 / 男女計）
+MALE_SHARE_POINTS = (
+    [0, 50, 65, 75, 85, 95, 105],
+    [0.512, 0.500, 0.485, 0.440, 0.360, 0.250, 0.150],
+)
+
+# Siler型死亡率 m(x) = a0·exp(-b0·x) + c + a1·exp(b1·x)
+# 2023年簡易生命表の平均寿命（男81.1年、女87.1年）に概ね合うよう調整
+SILER_PARAMS = {
+    'male': dict(a0=0.0018, b0=1.5, c=0.0002, a1=7.93e-6, b1=0.11),
+    'female': dict(a0=0.0018, b0=1.5, c=0.0001, a1=4.23e-6, b1=0.11),
+}
+
+# 出生・移動の既定仮定（社人研 令和5年推計 中位仮定の代表値）
+TFR_START = 1.15             # 2025年の合計特殊出生率（2024年実績に近い値）
+TFR_ULTIMATE = 1.36          # 長期の合計特殊出生率（中位仮定）
+TFR_ULTIMATE_YEAR = 2070
+MEAN_AGE_AT_BIRTH = 32.5
+SD_AGE_AT_BIRTH = 5.5
+MORTALITY_IMPROVEMENT = 0.01  # 死亡率の年率改善
+NET_MIGRATION = 16.4          # 純移動数（万人/年）
+MIGRATION_PEAK_AGE = 24
+MIGRATION_SPREAD = 7.0
+
+
+# =========================
+# 仮定の構築
+# =========================
+@dataclass(frozen=True)
+class ProjectionAssumptions:
+    """
+    推計の仮定（配列は t年→t+1年 の遷移ごとに年次軸を持つ）
+
+    fertility:      (..., T, N_AGES)     女性の年齢別出生率
+    survival:       (..., T, 2, N_AGES)  a歳→a+1歳の生残率（最後の2要素は105歳以上への移行・残存率）
+    birth_survival: (..., T, 2)          出生→期末（0歳）の生残率
+    migration:      (..., T, 2, N_AGES)  純移動数（万人/年）
+    """
+    fertility: np.ndarray
+    survival: np.ndarray
+    birth_survival: np.ndarray
+    migration: np.ndarray
+    sex_ratio_at_birth: float = SEX_RATIO_AT_BIRTH
+
+    @property
+    def n_steps(self) -> int:
+        return self.fertility.shape[-2]
+
+
+def base_population() -> np.ndarray:
+    """
+    2025年の各歳・男女別人口（万人）、shape = (2, N_AGES)
+
+    5歳階級の形状を各歳に均等按分し、年齢区分の合計を社人研2025年値に合わせる
+    """
+    total = np.zeros(N_AGES)
+    edges = [lo for lo, _ in BASE_5YR_2025] + [N_AGES]
+    for (lo, pop), hi in zip(BASE_5YR_2025, edges[1:]):
+        total[lo:hi] = pop / (hi - lo)
+
+    for lo, hi, target in BASE_BANDS_2025:
+        total[lo:hi] *= target / total[lo:hi].sum()
+
+    male_share = np.interp(AGES, *MALE_SHARE_POINTS)
+    return np.stack([total * male_share, total * (1 - male_share)])
+
+
+def siler_mortality(sex: str) -> np.ndarray:
+    """基準年の年齢別死亡率 m(x)、shape = (N_AGES,)"""
+    p = SILER_PARAMS[sex]
+    x = AGES.astype(float)
+    return p['a0'] * np.exp(-p['b0'] * x) + p['c'] + p['a1'] * np.exp(p['b1'] * x)
+
+
+def mortality_rates(years: np.ndarray, improvement: float = MORTALITY_IMPROVEMENT) -> np.ndarray:
+    """年次別の死亡率、shape = (T, 2, N_AGES)"""
+    base = np.stack([siler_mortality(s) for s in SEXES])
+    decay = np.exp(-improvement * (np.asarray(years) - BASE_YEAR))
+    return decay[:, None, None] * base
+
+
+def survival_from_mortality(mx: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+    """
+    死亡率 m(x) から生命表を経由して生残率と出生時生残率を求める
+
+    mx: (..., 2, N_AGES)
+
+    Returns:
+        survival: (..., 2, N_AGES)  a歳→a+1歳（最後の2要素は105歳以上への移行・残存率）
+        birth_survival: (..., 2)    出生→期末（L(0) / l(0)）
+    """
+    return survival_ratios(life_table(mx, SEXES))
+
+
+def fertility_schedule(tfr: np.ndarray) -> np.ndarray:
+    """
+    合計特殊出生率から年齢別出生率を作る（15〜49歳のガンマ型スケジュール）
+
+    tfr: (...,) → (..., N_AGES)
+    """
+    x = AGES - 14.5
+    shape = (MEAN_AGE_AT_BIRTH - 14.5) ** 2 / SD_AGE_AT_BIRTH ** 2
+    scale = SD_AGE_AT_BIRTH ** 2 / (MEAN_AGE_AT_BIRTH - 14.5)
+    dens = np.where((AGES >= 15) & (AGES <= 49),
+                    np.clip(x, 1e-9, None) ** (shape - 1) * np.exp(-x / scale), 0.0)
+    dens /= dens.sum()
+    return np.asarray(tfr, dtype=float)[..., None] * dens
+
+
+def tfr_path(years: np.ndarray, start: float = TFR_START, ultimate: float = TFR_ULTIMATE,
+             ultimate_year: int = TFR_ULTIMATE_YEAR) -> np.ndarray:
+    """合計特殊出生率の推移（基準年から到達年まで線形、以降一定）"""
+    return np.interp(years, [BASE_YEAR, ultimate_year], [start, ultimate])
+
+
+def migration_profile(total: float = NET_MIGRATION) -> np.ndarray:
+    """年齢・男女別の純移動数（万人/年）、shape = (2, N_AGES)"""
+    dens = np.exp(-0.5 * ((AGES - MIGRATION_PEAK_AGE) / MIGRATION_SPREAD) ** 2)
+    dens /= dens.sum()
+    return np.stack([0.5 * total * dens, 0.5 * total * dens])
+
+
+def default_assumptions(end_year: int = 2100, tfr: float | np.ndarray | None = None,
+                        mortality_improvement: float = MORTALITY_IMPROVEMENT,
+                        net_migration: float = NET_MIGRATION,
+                        tfr_ultimate: float = TFR_ULTIMATE) -> ProjectionAssumptions:
+    """
+    既定（中位相当）の仮定を構築する
+
+    tfr: None なら tfr_ultimate へ向かう推移、スカラーなら一定、配列なら年次別（長さ T）
+    """
+    step_years = np.arange(BASE_YEAR, end_year)
+    n_steps = len(step_years)
+
+    if tfr is None:
+        tfr_values = tfr_path(step_years, ultimate=tfr_ultimate)
+    else:
+        tfr_values = np.broadcast_to(np.asarray(tfr, dtype=float), (n_steps,))
+
+    mx = mortality_rates(step_years, mortality_improvement)
+    survival, birth_survival = survival_from_mortality(mx)
+    migration = np.broadcast_to(migration_profile(net_migration), (n_steps, 2, N_AGES))
+
+    return ProjectionAssumptions(
+        fertility=fertility_schedule(tfr_values),
+        survival=survival,
+        birth_survival=birth_survival,
+        migration=np.array(migration),
+    )
+
+
+# =========================
+# 推計本体
+# =========================
+@dataclass(frozen=True)
+class CohortResult:
+    """
+    推計結果
+
+    years:      (T+1,)
+    population: (..., T+1, 2, N_AGES)  各歳・男女別人口（万人）
+    births:     (..., T)               年間出生数（万人）
+    """
+    years: np.ndarray
+    population: np.ndarray
+    births: np.ndarray
+
+    def to_frame(self) -> pd.DataFrame:
+        """create_population_data() と同じ列構成の DataFrame（バッチ軸なしの場合）"""
+        if self.population.ndim != 3:
+            raise ValueError("to_frame() requires a single variant; use population_frame() per variant")
+        return population_frame(self.years, self.population)
+
+
+def fertility_row(assumptions: ProjectionAssumptions) -> np.ndarray:
+    """Leslie 行列の第1行（女性人口に掛ける出生係数）、shape = (..., T, N_AGES)"""
+    return leslie_fertility_row(assumptions.fertility, assumptions.survival[..., FEMALE, :])
+
+
+def leslie_fertility_row(fertility: np.ndarray, female_survival: np.ndarray) -> np.ndarray:
+    """
+    k(a) = [f(a) + S(a)·f(a+1)] / 2   （期首・期末の女性人口の平均に出生率を掛ける）
+
+    fertility, female_survival: (..., N_AGES)
+    """
+    fert_next = np.zeros_like(fertility)
+    fert_next[..., :-1] = fertility[..., 1:]
+    return 0.5 * (fertility + female_survival * fert_next)
+
+
+def leslie_step(pop: np.ndarray, k_row: np.ndarray, survival: np.ndarray,
+                birth_survival: np.ndarray, migration: np.ndarray,
+                male_share_at_birth: float) -> tuple[np.ndarray, np.ndarray]:
+    """
+    1年分の推計（帯行列としての Leslie 行列積 + 純移動）
+
+    pop: (..., 2, N_AGES) → (..., 2, N_AGES)
+    """
+    survivors = survival * pop
+    new = np.empty_like(pop)
+    new[..., 1:] = survivors[..., :-1]
+    new[..., OPEN_AGE] += survivors[..., OPEN_AGE]
+
+    births = np.einsum('...a,...a->...', k_row, pop[..., FEMALE, :])
+    new[..., MALE, 0] = births * male_share_at_birth * birth_survival[..., MALE]
+    new[..., FEMALE, 0] = births * (1 - male_share_at_birth) * birth_survival[..., FEMALE]
+
+    new += migration
+    return new, births
+
+
+def project_cohort(base: np.ndarray, assumptions: ProjectionAssumptions,
+                   start_year: int = BASE_YEAR, n_steps: int | None = None) -> CohortResult:
+    """
+    コーホート要因法による推計
+
+    base: (..., 2, N_AGES) 基準年人口。先頭のバッチ軸は仮定の配列と broadcast される
+    """
+    if n_steps is None:
+        n_steps = assumptions.n_steps
+
+    k_row = fertility_row(assumptions)
+    male_share = assumptions.sex_ratio_at_birth / (1 + assumptions.sex_ratio_at_birth)
+
+    batch = np.broadcast_shapes(base.shape[:-2], k_row.shape[:-2],
+                                assumptions.survival.shape[:-3], assumptions.migration.shape[:-3])
+    population = np.empty(batch + (n_steps + 1, 2, N_AGES))
+    births = np.empty(batch + (n_steps,))
+
+    pop = np.broadcast_to(base, batch + (2, N_AGES)).astype(float)
+    population[..., 0, :, :] = pop
+    for t in range(n_steps):
+        pop, births[..., t] = leslie_step(
+            pop, k_row[..., t, :], assumptions.survival[..., t, :, :],
+            assumptions.birth_survival[..., t, :], assumptions.migration[..., t, :, :],
+            male_share)
+        population[..., t + 1, :, :] = pop
+
+    years = np.arange(start_year, start_year + n_steps + 1)
+    return CohortResult(years=years, population=population, births=births)
+
+
+def run_default_projection(end_year: int = 2100) -> CohortResult:
+    """既定仮定による 2025年〜end_year の推計"""
+    return project_cohort(base_population(), default_assumptions(end_year))
+
+
+# =========================
+# 年齢区分への集計
+# =========================
+def add_population_indicators(df: pd.DataFrame) -> pd.DataFrame:
+    """年齢3区分合計・比率・従属人口指数・PSR の列を追加する（df を変更して返す）"""
+    # 年齢3区分合計（積み上げグラフ用）
+    df['Age3_Sum'] = df['Young_0_14'] + df['Working_15_64'] + df['Elderly_65plus']
+
+    # 総人口と年齢3区分合計の差（年齢不詳等）
+    df['Age_Unknown'] = df['TotalPopulation'] - df['Age3_Sum']
+
+    # 比率計算（総人口ベース）
+    df['Young_Ratio'] = df['Young_0_14'] / df['TotalPopulation'] * 100
+    df['Working_Ratio'] = df['Working_15_64'] / df['TotalPopulation'] * 100
+    df['Elderly_Ratio'] = df['Elderly_65plus'] / df['TotalPopulation'] * 100
+    df['VeryOld_Ratio'] = df['VeryOld_75plus'] / df['TotalPopulation'] * 100
+
+    # 従属人口指数（Dependency Ratio）の計算
+    df['Young_Dependency'] = df['Young_0_14'] / df['Working_15_64'] * 100
+    df['Old_Dependency'] = df['Elderly_65plus'] / df['Working_15_64'] * 100
+    df['Total_Dependency'] = (df['Young_0_14'] + df['Elderly_65plus']) / df['Working_15_64'] * 100
+
+    # 潜在扶養指数（Potential Support Ratio: PSR）
+    df['PSR'] = df['Working_15_64'] / df['Elderly_65plus']
+
+    return df
+
+
+def age_band_totals(population: np.ndarray) -> dict[str, np.ndarray]:
+    """各歳・男女別人口 (..., 2, N_AGES) から年齢区分別人口 (...) を求める"""
+    by_age = population.sum(axis=-2)
+    return {
+        'TotalPopulation': by_age.sum(axis=-1),
+        'Young_0_14': by_age[..., :15].sum(axis=-1),
+        'Working_15_64': by_age[..., 15:65].sum(axis=-1),
+        'Elderly_65plus': by_age[..., 65:].sum(axis=-1),
+        'VeryOld_75plus': by_age[..., 75:].sum(axis=-1),
+    }
+
+
+def population_frame(years: np.ndarray, population: np.ndarray) -> pd.DataFrame:
+    """(T, 2, N_AGES) の推計結果を create_population_data() と同じ列構成にする"""
+    df = pd.DataFrame({'Year': np.asarray(years)})
+    for col, values in age_band_totals(population).items():
+        df[col] = values
+    return add_population_indicators(df)
+
+
+# =========================
+# バリアント一括推計
+# =========================
+# 社人研 令和5年推計の仮定（出生3 × 死亡3）に対応する既定値
+# 出生: 長期の合計特殊出生率 / 死亡: 死亡率の年率改善
+FERTILITY_VARIANTS = {'出生高位': 1.64, '出生中位': 1.36, '出生低位': 1.13}
+MORTALITY_VARIANTS = {'死亡高位': 0.006, '死亡中位': MORTALITY_IMPROVEMENT, '死亡低位': 0.014}
+
+
+def ipss_variant_grid(end_year: int = 2100) -> dict[str, ProjectionAssumptions]:
+    """出生 × 死亡の全組合せ（9通り）の仮定"""
+    return {
+        f'{f_name}・{m_name}': default_assumptions(end_year, tfr_ultimate=tfr,
+                                                  mortality_improvement=improvement)
+        for f_name, tfr in FERTILITY_VARIANTS.items()
+        for m_name, improvement in MORTALITY_VARIANTS.items()
+    }
+
+
+def stack_assumptions(assumptions: list[ProjectionAssumptions]) -> ProjectionAssumptions:
+    """複数の仮定を先頭のバリアント軸に積み重ねる（出生性比は共通であること）"""
+    srb = {a.sex_ratio_at_birth for a in assumptions}
+    if len(srb) != 1:
+        raise ValueError("all variants must share the same sex_ratio_at_birth")
+    return ProjectionAssumptions(
+        fertility=np.stack([a.fertility for a in assumptions]),
+        survival=np.stack([a.survival for a in assumptions]),
+        birth_survival=np.stack([a.birth_survival for a in assumptions]),
+        migration=np.stack([a.migration for a in assumptions]),
+        sex_ratio_at_birth=srb.pop(),
+    )
+
+
+def project_variants(variants: dict[str, ProjectionAssumptions],
+                     base: np.ndarray | None = None) -> pd.DataFrame:
+    """
+    複数バリアントを (バリアント × 男女 × 年齢) の配列として同時に推計する
+
+    Returns:
+        縦持ちの DataFrame（Variant, Year + create_population_data() と同じ列）
+    """
+    if base is None:
+        base = base_population()
+    names = list(variants)
+    result = project_cohort(base, stack_assumptions([variants[n] for n in names]))
+
+    n_years = len(result.years)
+    tidy = pd.DataFrame({
+        'Variant': np.repeat(names, n_years),
+        'Year': np.tile(result.years, len(names)),
+    })
+    for col, values in age_band_totals(result.population).items():
+        tidy[col] = values.reshape(-1)
+    return add_population_indicators(tidy)
+
+
+def variant_range(tidy: pd.DataFrame, columns: list[str]) -> pd.DataFrame:
+    """
+    バリアント間の幅（年次別の最小・中央・最大）
+
+    Returns:
+        Year, {col}_lo, {col}_mid, {col}_hi  （plot_* の bands 引数に渡す形式）
+    """
+    grouped = tidy.groupby('Year')[columns]
+    lo, mid, hi = grouped.min(), grouped.median(), grouped.max()
+    bands = pd.concat([lo.add_suffix('_lo'), mid.add_suffix('_mid'), hi.add_suffix('_hi')], axis=1)
+    return bands.reset_index()
+
+
+def band_coverage(bands: pd.DataFrame, reference: pd.DataFrame, columns: list[str]) -> pd.DataFrame:
+    """
+    reference（Year + 指標列）の値が bands の [lo, hi] の外にある年
+
+    Returns:
+        Year, Column, Value, Lo, Mid, Hi（幅に収まっていれば空）
+    """
+    merged = reference[['Year'] + columns].merge(bands, on='Year')
+    rows = []
+    for col in columns:
+        value = merged[col]
+        out = (value < merged[f'{col}_lo']) | (value > merged[f'{col}_hi'])
+        rows.append(pd.DataFrame({
+            'Year': merged.loc[out, 'Year'], 'Column': col, 'Value': value[out],
+            'Lo': merged.loc[out, f'{col}_lo'], 'Mid': merged.loc[out, f'{col}_mid'],
+            'Hi': merged.loc[out, f'{col}_hi'],
+        }))
+    return pd.concat(rows, ignore_index=True)
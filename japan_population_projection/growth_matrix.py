@@ -0,0 +1,143 @@
+# growth_matrix.py
+# 全期間ペア（開始年 × 終了年）の CAGR・対数成長率分解を行列で一括計算
+# Date: 2026-10-17
+#
+# ============================================================
+# 定義（年差 dt を考慮、年次の間隔は不均等でよい）
+# ============================================================
+# - CAGR(i, j)      = (v_j / v_i)^(1 / (t_j - t_i)) - 1
+# - 対数成長率(i, j) = log(v_j / v_i) / (t_j - t_i)
+# - 加法分解: total = Π factor_k のとき
+#     log(total_j / total_i) = Σ_k log(factor_k,j / factor_k,i)
+#   各要因の寄与（年率）と寄与割合を全ペアについて求める
+#   （例: GDP = 人口 × 生産性、高齢者人口 = 総人口 × 高齢化率）
+# - 開始 ≥ 終了のセル、値が0以下のセルは NaN
+#
+# ============================================================
+# 実装
+# ============================================================
+# - 時点ベクトル t (n,) と系列 (..., n) から broadcast で (..., n, n) を作る（二重ループなし）
+# - 時点は 'Year' 列、なければ DatetimeIndex / 'date' 列から小数年に換算
+#   （人口テーブル・国債テーブルのどちらにも使える）
+# - DataFrame 単位の結果は (時点, 列の値) のハッシュでメモ化
+# ============================================================
+
+from __future__ import annotations
+import numpy as np
+import pandas as pd
+
+from population_interpolation import table_hash
+
+_MATRIX_CACHE: dict[tuple, dict[str, pd.DataFrame]] = {}
+
+
+def time_axis(df: pd.DataFrame) -> np.ndarray:
+    """時点（小数年）: 'Year' 列 → DatetimeIndex → 'date' 列の順に探す"""
+    if 'Year' in df.columns:
+        return df['Year'].to_numpy(dtype=float)
+    dates = df.index if isinstance(df.index, pd.DatetimeIndex) else pd.DatetimeIndex(df['date'])
+    start = pd.to_datetime(dates.year.astype(str) + '-01-01')
+    days = np.where(dates.is_leap_year, 366.0, 365.0)
+    return dates.year.to_numpy(dtype=float) + (dates - start).days.to_numpy() / days
+
+
+def _pairwise(t: np.ndarray, values: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+    """(dt, log比) の行列、各 (..., n, n)。開始 ≥ 終了・非正の値は NaN"""
+    t = np.asarray(t, dtype=float)
+    values = np.asarray(values, dtype=float)
+    dt = t[None, :] - t[:, None]
+    with np.errstate(divide='ignore', invalid='ignore'):
+        logv = np.log(np.where(values > 0, values, np.nan))
+        log_ratio = logv[..., None, :] - logv[..., :, None]
+    log_ratio = np.where(dt > 0, log_ratio, np.nan)
+    return dt, log_ratio
+
+
+def log_growth_matrix(t: np.ndarray, values: np.ndarray) -> np.ndarray:
+    """年率の対数成長率 [i, j]（開始 i → 終了 j）、shape = (..., n, n)"""
+    dt, log_ratio = _pairwise(t, values)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        return log_ratio / dt
+
+
+def cagr_matrix(t: np.ndarray, values: np.ndarray) -> np.ndarray:
+    """dt 補正済み CAGR [i, j]（開始 i → 終了 j）、shape = (..., n, n)"""
+    return np.expm1(log_growth_matrix(t, values))
+
+
+def log_decomposition_matrix(t: np.ndarray, total: np.ndarray,
+                             factors: dict[str, np.ndarray]) -> dict[str, np.ndarray]:
+    """
+    total = Π factors の対数加法分解を全ペアについて求める
+
+    Returns:
+        {'{name}_contribution': 年率寄与, '{name}_share': 寄与割合, ...,
+         'Residual_contribution': total - Σ 寄与（積が一致すれば0）}
+    """
+    total_growth = log_growth_matrix(t, total)
+    out: dict[str, np.ndarray] = {}
+    residual = total_growth.copy()
+    for name, values in factors.items():
+        contribution = log_growth_matrix(t, values)
+        with np.errstate(divide='ignore', invalid='ignore'):
+            out[f'{name}_share'] = contribution / total_growth
+        out[f'{name}_contribution'] = contribution
+        residual = residual - contribution
+    out['Residual_contribution'] = residual
+    return out
+
+
+def _labels(df: pd.DataFrame) -> pd.Index:
+    if 'Year' in df.columns:
+        return pd.Index(df['Year'], name=None)
+    return pd.Index(df.index if isinstance(df.index, pd.DatetimeIndex) else df['date'])
+
+
+def growth_matrices(df: pd.DataFrame, columns: list[str],
+                    kind: str = 'cagr') -> dict[str, pd.DataFrame]:
+    """
+    列ごとの全ペア行列（index = 開始時点、columns = 終了時点）
+
+    kind: 'cagr' | 'log'。結果は入力内容でメモ化（呼び出し側には DataFrame のコピーを返す）
+    """
+    if kind not in ('cagr', 'log'):
+        raise ValueError(f"kind must be 'cagr' or 'log': {kind!r}")
+    t = time_axis(df)
+    frame = pd.DataFrame({'__t': t, **{c: df[c].to_numpy() for c in columns}})
+    key = ('growth', kind, table_hash(frame))
+    cached = _MATRIX_CACHE.get(key)
+    if cached is None:
+        func = cagr_matrix if kind == 'cagr' else log_growth_matrix
+        stacked = func(t, frame[list(columns)].to_numpy(dtype=float).T)     # (k, n, n)
+        labels = _labels(df)
+        cached = {c: pd.DataFrame(stacked[i], index=labels, columns=labels)
+                  for i, c in enumerate(columns)}
+        _MATRIX_CACHE[key] = cached
+    return {c: m.copy() for c, m in cached.items()}
+
+
+def decomposition_matrices(df: pd.DataFrame, total: str,
+                           factors: dict[str, str | pd.Series]) -> dict[str, pd.DataFrame]:
+    """
+    列 total を factors（列名または Series）の積として分解した全ペア行列
+
+    例: decomposition_matrices(df, 'Elderly_65plus',
+                               {'総人口': 'TotalPopulation', '高齢化率': 'Elderly_Ratio'})
+    """
+    t = time_axis(df)
+    series = {name: (df[f] if isinstance(f, str) else f).to_numpy(dtype=float)
+              for name, f in factors.items()}
+    frame = pd.DataFrame({'__t': t, '__total': df[total].to_numpy(dtype=float),
+                          **{f'__{k}': v for k, v in series.items()}})
+    key = ('decomposition', table_hash(frame))
+    cached = _MATRIX_CACHE.get(key)
+    if cached is None:
+        labels = _labels(df)
+        result = log_decomposition_matrix(t, frame['__total'].to_numpy(), series)
+        cached = {k: pd.DataFrame(v, index=labels, columns=labels) for k, v in result.items()}
+        _MATRIX_CACHE[key] = cached
+    return {k: m.copy() for k, m in cached.items()}
+
+
+def clear_cache() -> None:
+    _MATRIX_CACHE.clear()
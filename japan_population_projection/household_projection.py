@@ -0,0 +1,156 @@
+# household_projection.py
+# 世帯主率法による世帯数の将来推計（人口エンジンの各歳・男女別人口に適用）
+# Date: 2026-10-17
+#
+# ============================================================
+# 方法
+# ============================================================
+# - 世帯数(家族類型 h, 性 s, 年齢 a) = 人口(s, a) × 世帯主率(h, s, a)
+# - 人口 (..., T, 2, N_AGES) と世帯主率 (H, 2, N_AGES) を broadcast して
+#   全年・全バリアントの世帯数 (..., T, H, 2, N_AGES) を1回の演算で求める
+# - 世帯主の年齢区分・家族類型別に集計
+# - project_households() は1回の broadcast 積なのでキャッシュは持たない
+#   （入力配列のハッシュは積そのものと同程度のコスト）
+# - 既定仮定の世帯数表は household_projection() で end_year ごとにキャッシュし、
+#   メインスクリプトが HOUSEHOLDS_CSV に書き出す
+#   （Inflation_in_Japan/inflation_household_2060.py が世帯主の年齢区分別に読む）
+#
+# ============================================================
+# 世帯主率（既定値）
+# ============================================================
+# - 2020年国勢調査の家族類型別・世帯主の男女年齢別の構成を整理した概算値
+#   （2025年の一般世帯数 約5,700万、単独世帯割合 約4割となる水準）
+# - 推計期間中は一定（世帯主率の変化は rates 引数で与える）
+# ============================================================
+
+from __future__ import annotations
+import numpy as np
+import pandas as pd
+
+from cohort_projection import AGES, N_AGES, CohortResult, run_default_projection
+
+HOUSEHOLD_TYPES = ('単独', '夫婦のみ', '夫婦と子', 'ひとり親と子', 'その他')
+
+# 世帯主の年齢区分 (開始年齢, 終了年齢+1, ラベル)
+HOUSEHOLDER_AGE_GROUPS = [
+    (15, 30, '15-29歳'),
+    (30, 50, '30-49歳'),
+    (50, 65, '50-64歳'),
+    (65, 75, '65-74歳'),
+    (75, N_AGES, '75歳以上'),
+]
+
+# 世帯主率の節点（年齢 → 率、間は線形補間）
+HEADSHIP_AGES = [15, 20, 25, 30, 40, 50, 60, 70, 80, 90, 105]
+HEADSHIP_POINTS = {
+    'male': {
+        '単独':         [0.014, 0.299, 0.408, 0.299, 0.231, 0.231, 0.218, 0.163, 0.163, 0.204, 0.204],
+        '夫婦のみ':     [0.00, 0.005, 0.043, 0.076, 0.065, 0.108, 0.324, 0.486, 0.486, 0.324, 0.216],
+        '夫婦と子':     [0.00, 0.005, 0.086, 0.302, 0.54, 0.486, 0.302, 0.151, 0.108, 0.054, 0.032],
+        'ひとり親と子': [0.00, 0.00, 0.002, 0.005, 0.011, 0.022, 0.032, 0.032, 0.043, 0.054, 0.054],
+        'その他':       [0.00, 0.005, 0.011, 0.022, 0.032, 0.065, 0.086, 0.108, 0.108, 0.086, 0.065],
+    },
+    'female': {
+        '単独':         [0.014, 0.272, 0.272, 0.136, 0.095, 0.095, 0.136, 0.218, 0.34, 0.272, 0.245],
+        '夫婦のみ':     [0.00, 0.003, 0.005, 0.005, 0.005, 0.005, 0.011, 0.022, 0.022, 0.011, 0.011],
+        '夫婦と子':     [0.00, 0.002, 0.005, 0.011, 0.011, 0.011, 0.011, 0.011, 0.005, 0.005, 0.00],
+        'ひとり親と子': [0.00, 0.002, 0.011, 0.032, 0.054, 0.054, 0.043, 0.043, 0.054, 0.054, 0.043],
+        'その他':       [0.00, 0.002, 0.005, 0.005, 0.011, 0.011, 0.022, 0.032, 0.043, 0.032, 0.032],
+    },
+}
+
+# メインスクリプトの出力ディレクトリに書き出すファイル名（inflation_household_2060.py が読む）
+HOUSEHOLDS_CSV = 'japan_households_projection_2100_v3.csv'
+
+_HOUSEHOLD_CACHE: dict[int, pd.DataFrame] = {}
+
+
+def headship_rates() -> np.ndarray:
+    """家族類型・男女・各歳の世帯主率、shape = (H, 2, N_AGES)"""
+    rates = np.zeros((len(HOUSEHOLD_TYPES), 2, N_AGES))
+    for s, sex in enumerate(('male', 'female')):
+        for h, htype in enumerate(HOUSEHOLD_TYPES):
+            rates[h, s] = np.interp(AGES, HEADSHIP_AGES, HEADSHIP_POINTS[sex][htype], left=0.0)
+    rates[..., AGES < HEADSHIP_AGES[0]] = 0.0
+    return rates
+
+
+def project_households(population: np.ndarray, rates: np.ndarray | None = None) -> np.ndarray:
+    """
+    世帯数（万世帯）
+
+    population: (..., 2, N_AGES)  各歳・男女別人口（年・バリアント軸は先頭に任意）
+    rates:      (H, 2, N_AGES) または年次別 (..., T, H, 2, N_AGES)
+
+    Returns:
+        (..., H, 2, N_AGES)
+    """
+    if rates is None:
+        rates = headship_rates()
+    return np.asarray(population, dtype=float)[..., None, :, :] * rates
+
+
+def households_by_type(households: np.ndarray) -> np.ndarray:
+    """家族類型別の世帯数、(..., H, 2, N_AGES) → (..., H)"""
+    return households.sum(axis=(-2, -1))
+
+
+def households_by_age_group(households: np.ndarray) -> np.ndarray:
+    """家族類型 × 世帯主の年齢区分別の世帯数、(..., H, 2, N_AGES) → (..., H, G)"""
+    starts = [lo for lo, _, _ in HOUSEHOLDER_AGE_GROUPS]
+    return np.add.reduceat(households.sum(axis=-2), starts, axis=-1)
+
+
+def household_frame(years: np.ndarray, population: np.ndarray,
+                    households: np.ndarray) -> pd.DataFrame:
+    """
+    年別の世帯数サマリ（バリアント軸なし）
+
+    Returns:
+        Year, Households_Total, Households_{型}, OnePerson_Share,
+        Elderly_Householder_Share（世帯主65歳以上）, Persons_per_Household
+    """
+    if households.ndim != 4:
+        raise ValueError("household_frame() requires a single variant")
+    by_type = households_by_type(households)                         # (T, H)
+    by_age = households_by_age_group(households).sum(axis=-2)        # (T, G)
+    total = by_type.sum(axis=-1)
+
+    df = pd.DataFrame({'Year': np.asarray(years), 'Households_Total': total})
+    for h, htype in enumerate(HOUSEHOLD_TYPES):
+        df[f'Households_{htype}'] = by_type[:, h]
+    elderly_groups = [g for g, (lo, _, _) in enumerate(HOUSEHOLDER_AGE_GROUPS) if lo >= 65]
+    df['OnePerson_Share'] = by_type[:, 0] / total * 100
+    df['Elderly_Householder_Share'] = by_age[:, elderly_groups].sum(axis=-1) / total * 100
+    df['Persons_per_Household'] = population.sum(axis=(-2, -1)) / total
+    return df
+
+
+def household_table(years: np.ndarray, households: np.ndarray) -> pd.DataFrame:
+    """縦持ち（Year, Type, Householder_Age, Households）の世帯数（バリアント軸なし）"""
+    values = households_by_age_group(households)                     # (T, H, G)
+    labels = [label for _, _, label in HOUSEHOLDER_AGE_GROUPS]
+    idx = pd.MultiIndex.from_product([np.asarray(years), HOUSEHOLD_TYPES, labels],
+                                     names=['Year', 'Type', 'Householder_Age'])
+    return pd.DataFrame({'Households': values.ravel()}, index=idx).reset_index()
+
+
+def default_households(end_year: int = 2100) -> tuple[CohortResult, np.ndarray]:
+    """既定仮定の人口推計と世帯数"""
+    result = run_default_projection(end_year)
+    return result, project_households(result.population)
+
+
+def household_projection(end_year: int = 2100) -> pd.DataFrame:
+    """
+    既定仮定の世帯数（household_table() の縦持ち、キャッシュ済みのコピーを返す）
+
+    Returns:
+        Year, Type, Householder_Age, Households（万世帯）
+    """
+    cached = _HOUSEHOLD_CACHE.get(end_year)
+    if cached is None:
+        result, households = default_households(end_year)
+        cached = household_table(result.years, households)
+        _HOUSEHOLD_CACHE[end_year] = cached
+    return cached.copy()
@@ -48,6 +48,20 @@ import matplotlib.pyplot as plt
 from matplotlib.ticker import FuncFormatter
 import matplotlib.patches as mpatches
 
+from cohort_projection import (add_population_indicators, run_default_projection,
+                               ipss_variant_grid, project_variants, variant_range, band_coverage,
+                               mortality_rates)
+from life_table import life_table, life_expectancy_frame
+from household_projection import HOUSEHOLDS_CSV, default_households, household_frame, household_projection
+from labour_force import LABOUR_FORCE_CSV, PARTICIPATION_SCENARIOS, labour_force_projection
+from stochastic_projection import simulate_paths, stochastic_bands, check_deterministic_coverage
+from population_interpolation import interpolate_annual
+from population_table import PopulationTable, as_table
+from pyramid_animation import single_year_pyramids, render_pyramid_animation
+from age_bands import AgeBands
+from policy_solver import PolicySolver, LEVER_LABELS, target_grid
+from growth_matrix import decomposition_matrices, growth_matrices
+
 # =========================
 # 設定
 # =========================
@@ -82,10 +96,15 @@ COLORS = {
 # =========================
 # 歴史的・将来推計データの構築【修正版v3】
 # =========================
-def create_population_data():
+def create_population_data(projection: str = "ipss"):
     """
     日本の年齢3区分別人口データ（1950年〜2100年）
     
+    projection:
+    - "ipss":   2025年以降も社人研の公表値（5年刻み）を使用
+    - "cohort": 2025年以降をコーホート要因法エンジン（cohort_projection.py）の
+                各年推計に置き換える（2024年までの実績・推計値はそのまま）
+    
     データソース:
     - 1950-2020: 国勢調査確定値（総務省統計局）
     - 2021-2024: 人口推計（総務省統計局）
@@ -167,43 +186,60 @@ def create_population_data():
         'VeryOld_75plus': [data[y][4] for y in years],
     })
     
-    # 【追加】年齢3区分合計を計算（積み上げグラフ用）
-    df['Age3_Sum'] = df['Young_0_14'] + df['Working_15_64'] + df['Elderly_65plus']
-    
-    # 【追加】総人口と年齢3区分合計の差（年齢不詳等）
-    df['Age_Unknown'] = df['TotalPopulation'] - df['Age3_Sum']
-    
-    # 比率計算（総人口ベース）
-    df['Young_Ratio'] = df['Young_0_14'] / df['TotalPopulation'] * 100
-    df['Working_Ratio'] = df['Working_15_64'] / df['TotalPopulation'] * 100
-    df['Elderly_Ratio'] = df['Elderly_65plus'] / df['TotalPopulation'] * 100
-    df['VeryOld_Ratio'] = df['VeryOld_75plus'] / df['TotalPopulation'] * 100
-    
-    # 従属人口指数（Dependency Ratio）の計算
-    df['Young_Dependency'] = df['Young_0_14'] / df['Working_15_64'] * 100
-    df['Old_Dependency'] = df['Elderly_65plus'] / df['Working_15_64'] * 100
-    df['Total_Dependency'] = (df['Young_0_14'] + df['Elderly_65plus']) / df['Working_15_64'] * 100
-    
-    # 潜在扶養指数（Potential Support Ratio: PSR）
-    df['PSR'] = df['Working_15_64'] / df['Elderly_65plus']
+    if projection == "cohort":
+        projected = run_default_projection(end_year=2100).to_frame()
+        df = pd.concat([df[df['Year'] < projected['Year'].min()], projected[df.columns]],
+                       ignore_index=True)
+    elif projection != "ipss":
+        raise ValueError(f"unknown projection: {projection}")
     
-    return df
+    # 年齢3区分合計・比率・従属人口指数・PSR
+    return add_population_indicators(df)
 
 
-def plot_population_composition_stacked(df: pd.DataFrame) -> None:
+def draw_bands(ax, bands: pd.DataFrame | list[pd.DataFrame] | None, column: str, color: str) -> None:
+    """
+    推計の幅（bands: Year, {column}_lo, {column}_hi）を塗りつぶしで描画
+    - {column}_mid があれば幅の中央値を破線で重ねる（幅はエンジンの仮定による推計で、
+      公表値の線の周りの幅ではないため、幅と対応する中心線を必ず一緒に示す）
+    - bands.attrs['label'] があれば凡例に使用
+    - bands.attrs['style'] / ['mid_style'] があれば fill_between / plot の引数を上書き（複数の幅を重ねる場合）
+    - リストを渡すと順に重ねて描画
+    """
+    if bands is None:
+        return
+    if isinstance(bands, list):
+        for b in bands:
+            draw_bands(ax, b, column, color)
+        return
+    if f'{column}_lo' not in bands.columns:
+        return
+    style = dict(color=color, alpha=0.2, linewidth=0)
+    style.update(bands.attrs.get('style', {}))
+    label = bands.attrs.get('label', '推計の幅')
+    ax.fill_between(bands['Year'], bands[f'{column}_lo'], bands[f'{column}_hi'],
+                    label=label, **style)
+    if f'{column}_mid' in bands.columns:
+        mid_style = dict(color=color, linestyle='--', linewidth=1.5, alpha=0.9)
+        mid_style.update(bands.attrs.get('mid_style', {}))
+        ax.plot(bands['Year'], bands[f'{column}_mid'], label=f'{label} 中央値', **mid_style)
+
+
+def plot_population_composition_stacked(df: PopulationTable | pd.DataFrame) -> None:
     """
     年齢3区分別人口構成（積み上げ面グラフ）- 2100年まで
     【修正】Elderly_65plusを直接使用し、総人口は別線で表示
     """
+    table = as_table(df)
     fig, ax = plt.subplots(figsize=(16, 9))
     
-    years = df['Year'].values
+    years = table.years
     
     # 【修正】積み上げは年齢3区分の実数値を使用
     # 下から順に: 年少 → 生産年齢 → 高齢者
-    young = df['Young_0_14'].values
-    working = df['Working_15_64'].values
-    elderly = df['Elderly_65plus'].values
+    young = table['Young_0_14']
+    working = table['Working_15_64']
+    elderly = table['Elderly_65plus']
     
     ax.fill_between(years, 0, young, 
                     alpha=0.8, color=COLORS['young'], label='年少人口 (0-14歳)')
@@ -218,7 +254,7 @@ def plot_population_composition_stacked(df: pd.DataFrame) -> None:
             label='年齢3区分合計')
     
     # 総人口の線（年齢不詳を含む公表値）
-    ax.plot(years, df['TotalPopulation'], color='black', linewidth=2.5, linestyle='--',
+    ax.plot(years, table['TotalPopulation'], color='black', linewidth=2.5, linestyle='--',
             alpha=0.7, label='総人口（公表値）')
     
     # 現在と将来の境界線
@@ -277,32 +313,35 @@ def plot_population_composition_stacked(df: pd.DataFrame) -> None:
     plt.close()
 
 
-def plot_population_ratio_trends(df: pd.DataFrame) -> None:
+def plot_population_ratio_trends(df: PopulationTable | pd.DataFrame, bands: pd.DataFrame | list[pd.DataFrame] | None = None) -> None:
     """
     年齢構成比率の推移（線グラフ）- 2100年まで
+    bands: 高齢化率の推計幅（variant_range() の出力）
     """
+    table = as_table(df)
     fig, ax = plt.subplots(figsize=(16, 9))
     
-    years = df['Year'].values
+    years = table.years
     
-    ax.plot(years, df['Young_Ratio'], color=COLORS['young'], linewidth=3, 
+    ax.plot(years, table['Young_Ratio'], color=COLORS['young'], linewidth=3, 
             marker='', label='年少人口比率 (0-14歳)')
-    ax.plot(years, df['Working_Ratio'], color=COLORS['working'], linewidth=3, 
+    ax.plot(years, table['Working_Ratio'], color=COLORS['working'], linewidth=3, 
             marker='', label='生産年齢人口比率 (15-64歳)')
-    ax.plot(years, df['Elderly_Ratio'], color=COLORS['elderly'], linewidth=3, 
+    ax.plot(years, table['Elderly_Ratio'], color=COLORS['elderly'], linewidth=3, 
             marker='', label='高齢化率 (65歳以上)')
-    ax.plot(years, df['VeryOld_Ratio'], color=COLORS['very_old'], linewidth=2.5, 
+    ax.plot(years, table['VeryOld_Ratio'], color=COLORS['very_old'], linewidth=2.5, 
             linestyle='--', marker='', label='後期高齢者比率 (75歳以上)')
+    draw_bands(ax, bands, 'Elderly_Ratio', COLORS['elderly'])
     
     ax.axvline(x=2024, color='purple', linestyle='--', linewidth=2, alpha=0.7)
     ax.axvline(x=2070, color='gray', linestyle=':', linewidth=1.5, alpha=0.6)
     
     # 重要なポイントの注釈
     key_points = [
-        (1950, df[df['Year']==1950]['Elderly_Ratio'].values[0], f'1950年\n約{df[df["Year"]==1950]["Elderly_Ratio"].values[0]:.1f}%'),
-        (2024, df[df['Year']==2024]['Elderly_Ratio'].values[0], f'2024年\n約{df[df["Year"]==2024]["Elderly_Ratio"].values[0]:.1f}%'),
-        (2070, df[df['Year']==2070]['Elderly_Ratio'].values[0], f'2070年\n約{df[df["Year"]==2070]["Elderly_Ratio"].values[0]:.1f}%'),
-        (2100, df[df['Year']==2100]['Elderly_Ratio'].values[0], f'2100年\n約{df[df["Year"]==2100]["Elderly_Ratio"].values[0]:.1f}%'),
+        (1950, table.at(1950, 'Elderly_Ratio'), f'1950年\n約{table.at(1950, "Elderly_Ratio"):.1f}%'),
+        (2024, table.at(2024, 'Elderly_Ratio'), f'2024年\n約{table.at(2024, "Elderly_Ratio"):.1f}%'),
+        (2070, table.at(2070, 'Elderly_Ratio'), f'2070年\n約{table.at(2070, "Elderly_Ratio"):.1f}%'),
+        (2100, table.at(2100, 'Elderly_Ratio'), f'2100年\n約{table.at(2100, "Elderly_Ratio"):.1f}%'),
     ]
     
     for yr, val, label in key_points:
@@ -340,22 +379,25 @@ def plot_population_ratio_trends(df: pd.DataFrame) -> None:
     plt.close()
 
 
-def plot_population_decline_impact(df: pd.DataFrame) -> None:
+def plot_population_decline_impact(df: PopulationTable | pd.DataFrame, bands: pd.DataFrame | list[pd.DataFrame] | None = None) -> None:
     """
     人口減少のインパクト分析
+    bands: 総人口の推計幅（variant_range() / stochastic_bands() の出力、またはそのリスト）
     """
+    table = as_table(df)
     fig, axes = plt.subplots(1, 2, figsize=(16, 8))
     
-    years = df['Year'].values
+    years = table.years
     
     # 左パネル: 総人口の推移
     ax1 = axes[0]
-    ax1.fill_between(years, 0, df['TotalPopulation'], alpha=0.4, color=COLORS['total'])
-    ax1.plot(years, df['TotalPopulation'], color=COLORS['total'], linewidth=3)
+    ax1.fill_between(years, 0, table['TotalPopulation'], alpha=0.4, color=COLORS['total'])
+    ax1.plot(years, table['TotalPopulation'], color=COLORS['total'], linewidth=3)
+    draw_bands(ax1, bands, 'TotalPopulation', COLORS['total'])
     
     peak_year = 2008
-    peak_pop = df[df['Year']==peak_year]['TotalPopulation'].values[0]
-    final_pop = df[df['Year']==2100]['TotalPopulation'].values[0]
+    peak_pop = table.at(peak_year, 'TotalPopulation')
+    final_pop = table.at(2100, 'TotalPopulation')
     
     ax1.scatter([peak_year], [peak_pop], color='green', s=150, zorder=5, marker='o')
     ax1.scatter([2100], [final_pop], color='red', s=150, zorder=5, marker='o')
@@ -383,22 +425,18 @@ def plot_population_decline_impact(df: pd.DataFrame) -> None:
     ax1.set_ylim(0, 14000)
     ax1.yaxis.set_major_formatter(FuncFormatter(lambda x, p: f'{x/10000:.1f}億' if x >= 10000 else f'{int(x):,}'))
     ax1.grid(True, alpha=0.3)
+    if bands is not None:
+        ax1.legend(loc='lower left', fontsize=10, framealpha=0.9)
     
     # 右パネル: 年齢層別の変化率（2008年基準）
     ax2 = axes[1]
     
     base_year = 2008
-    base_row = df[df['Year']==base_year]
-    
-    df['Total_Index'] = df['TotalPopulation'] / base_row['TotalPopulation'].values[0] * 100
-    df['Young_Index'] = df['Young_0_14'] / base_row['Young_0_14'].values[0] * 100
-    df['Working_Index'] = df['Working_15_64'] / base_row['Working_15_64'].values[0] * 100
-    df['Elderly_Index'] = df['Elderly_65plus'] / base_row['Elderly_65plus'].values[0] * 100
     
-    ax2.plot(years, df['Total_Index'], color=COLORS['total'], linewidth=3, label='総人口')
-    ax2.plot(years, df['Young_Index'], color=COLORS['young'], linewidth=2.5, label='年少人口')
-    ax2.plot(years, df['Working_Index'], color=COLORS['working'], linewidth=2.5, label='生産年齢人口')
-    ax2.plot(years, df['Elderly_Index'], color=COLORS['elderly'], linewidth=2.5, label='高齢者人口')
+    ax2.plot(years, table.index('Total_Index', base_year), color=COLORS['total'], linewidth=3, label='総人口')
+    ax2.plot(years, table.index('Young_Index', base_year), color=COLORS['young'], linewidth=2.5, label='年少人口')
+    ax2.plot(years, table.index('Working_Index', base_year), color=COLORS['working'], linewidth=2.5, label='生産年齢人口')
+    ax2.plot(years, table.index('Elderly_Index', base_year), color=COLORS['elderly'], linewidth=2.5, label='高齢者人口')
     
     ax2.axhline(y=100, color='black', linestyle='-', linewidth=1, alpha=0.5)
     ax2.axvline(x=base_year, color='green', linestyle='--', linewidth=2, alpha=0.7)
@@ -434,32 +472,34 @@ def plot_population_decline_impact(df: pd.DataFrame) -> None:
     plt.close()
 
 
-def plot_dependency_and_psr(df: pd.DataFrame) -> None:
+def plot_dependency_and_psr(df: PopulationTable | pd.DataFrame, bands: pd.DataFrame | list[pd.DataFrame] | None = None) -> None:
     """
     従属人口指数と潜在扶養指数（PSR）の推移
+    bands: 総従属人口指数・PSRの推計幅（variant_range() / stochastic_bands() の出力、またはそのリスト）
     """
+    table = as_table(df)
     fig, axes = plt.subplots(1, 2, figsize=(18, 8))
     
-    years = df['Year'].values
+    years = table.years
     
     # === 左パネル: 従属人口指数 ===
     ax1 = axes[0]
     
-    ax1.fill_between(years, 0, df['Young_Dependency'], alpha=0.5, color=COLORS['young'],
+    ax1.fill_between(years, 0, table['Young_Dependency'], alpha=0.5, color=COLORS['young'],
                      label='年少従属人口指数')
-    ax1.fill_between(years, df['Young_Dependency'], df['Total_Dependency'], 
+    ax1.fill_between(years, table['Young_Dependency'], table['Total_Dependency'], 
                      alpha=0.5, color=COLORS['elderly'],
                      label='老年従属人口指数')
-    ax1.plot(years, df['Total_Dependency'], color='black', linewidth=3, 
+    ax1.plot(years, table['Total_Dependency'], color='black', linewidth=3, 
              label='総従属人口指数')
+    draw_bands(ax1, bands, 'Total_Dependency', 'black')
     
     ax1.axvline(x=2024, color='purple', linestyle='--', linewidth=2, alpha=0.7)
     ax1.axvline(x=2070, color='gray', linestyle=':', linewidth=1.5, alpha=0.6)
     
     for yr in [1970, 2024, 2070, 2100]:
-        row = df[df['Year']==yr]
-        if len(row) > 0:
-            total_dep = row['Total_Dependency'].values[0]
+        if yr in table:
+            total_dep = table.at(yr, 'Total_Dependency')
             ax1.annotate(f'{yr}年\n{total_dep:.1f}', 
                         xy=(yr, total_dep), xytext=(yr, total_dep+8),
                         fontsize=10, ha='center', fontweight='bold',
@@ -479,8 +519,9 @@ def plot_dependency_and_psr(df: pd.DataFrame) -> None:
     # === 右パネル: 潜在扶養指数（PSR）===
     ax2 = axes[1]
     
-    ax2.fill_between(years, 0, df['PSR'], alpha=0.5, color=COLORS['working'])
-    ax2.plot(years, df['PSR'], color=COLORS['working'], linewidth=3)
+    ax2.fill_between(years, 0, table['PSR'], alpha=0.5, color=COLORS['working'])
+    ax2.plot(years, table['PSR'], color=COLORS['working'], linewidth=3)
+    draw_bands(ax2, bands, 'PSR', COLORS['working'])
     
     ax2.axvline(x=2024, color='purple', linestyle='--', linewidth=2, alpha=0.7)
     ax2.axvline(x=2070, color='gray', linestyle=':', linewidth=1.5, alpha=0.6)
@@ -495,9 +536,8 @@ def plot_dependency_and_psr(df: pd.DataFrame) -> None:
     ]
     
     for yr, label, color in psr_annotations:
-        row = df[df['Year']==yr]
-        if len(row) > 0:
-            psr = row['PSR'].values[0]
+        if yr in table:
+            psr = table.at(yr, 'PSR')
             ax2.annotate(f'{yr}年: {psr:.2f}人\n({label})', 
                         xy=(yr, psr), xytext=(yr+3 if yr < 2050 else yr-15, psr+1.2),
                         fontsize=10, ha='center', fontweight='bold',
@@ -511,6 +551,8 @@ def plot_dependency_and_psr(df: pd.DataFrame) -> None:
     ax2.set_xlim(1950, 2100)
     ax2.set_ylim(0, 14)
     ax2.grid(True, alpha=0.3)
+    if bands is not None:
+        ax2.legend(loc='upper right', fontsize=10, framealpha=0.9)
     
     ax2.text(1955, 13, '潜在扶養指数（PSR） = 生産年齢人口 / 高齢者人口',
              fontsize=9, style='italic', color='gray')
@@ -534,26 +576,27 @@ def plot_dependency_and_psr(df: pd.DataFrame) -> None:
     plt.close()
 
 
-def plot_comprehensive_age_dashboard(df: pd.DataFrame) -> None:
+def plot_comprehensive_age_dashboard(df: PopulationTable | pd.DataFrame) -> None:
     """
     年齢構成総合ダッシュボード（4パネル）
     """
+    table = as_table(df)
     fig, axes = plt.subplots(2, 2, figsize=(18, 14))
     
-    years = df['Year'].values
+    years = table.years
     
     # === パネル1: 年齢3区分別人口（積み上げ） ===
     ax1 = axes[0, 0]
-    young = df['Young_0_14'].values
-    working = df['Working_15_64'].values
-    elderly = df['Elderly_65plus'].values
+    young = table['Young_0_14']
+    working = table['Working_15_64']
+    elderly = table['Elderly_65plus']
     
     ax1.fill_between(years, 0, young, alpha=0.8, color=COLORS['young'])
     ax1.fill_between(years, young, young + working, alpha=0.8, color=COLORS['working'])
     ax1.fill_between(years, young + working, young + working + elderly, 
                      alpha=0.8, color=COLORS['elderly'])
     ax1.plot(years, young + working + elderly, color='black', linewidth=2, label='年齢3区分合計')
-    ax1.plot(years, df['TotalPopulation'], color='black', linewidth=2, linestyle='--', 
+    ax1.plot(years, table['TotalPopulation'], color='black', linewidth=2, linestyle='--', 
              alpha=0.7, label='総人口')
     ax1.axvline(x=2024, color='purple', linestyle='--', alpha=0.7)
     ax1.axvline(x=2070, color='gray', linestyle=':', alpha=0.5)
@@ -572,9 +615,9 @@ def plot_comprehensive_age_dashboard(df: pd.DataFrame) -> None:
     
     # === パネル2: 年齢構成比率 ===
     ax2 = axes[0, 1]
-    ax2.plot(years, df['Young_Ratio'], color=COLORS['young'], linewidth=2.5, label='年少')
-    ax2.plot(years, df['Working_Ratio'], color=COLORS['working'], linewidth=2.5, label='生産年齢')
-    ax2.plot(years, df['Elderly_Ratio'], color=COLORS['elderly'], linewidth=2.5, label='高齢者')
+    ax2.plot(years, table['Young_Ratio'], color=COLORS['young'], linewidth=2.5, label='年少')
+    ax2.plot(years, table['Working_Ratio'], color=COLORS['working'], linewidth=2.5, label='生産年齢')
+    ax2.plot(years, table['Elderly_Ratio'], color=COLORS['elderly'], linewidth=2.5, label='高齢者')
     ax2.axvline(x=2024, color='purple', linestyle='--', alpha=0.7)
     ax2.axvline(x=2070, color='gray', linestyle=':', alpha=0.5)
     ax2.axhline(y=50, color='gray', linestyle=':', alpha=0.5)
@@ -586,10 +629,10 @@ def plot_comprehensive_age_dashboard(df: pd.DataFrame) -> None:
     
     # === パネル3: 従属人口指数 ===
     ax3 = axes[1, 0]
-    ax3.fill_between(years, 0, df['Young_Dependency'], alpha=0.4, color=COLORS['young'])
-    ax3.fill_between(years, df['Young_Dependency'], df['Total_Dependency'], 
+    ax3.fill_between(years, 0, table['Young_Dependency'], alpha=0.4, color=COLORS['young'])
+    ax3.fill_between(years, table['Young_Dependency'], table['Total_Dependency'], 
                      alpha=0.4, color=COLORS['elderly'])
-    ax3.plot(years, df['Total_Dependency'], color='black', linewidth=2.5, label='総従属人口指数')
+    ax3.plot(years, table['Total_Dependency'], color='black', linewidth=2.5, label='総従属人口指数')
     ax3.axvline(x=2024, color='purple', linestyle='--', alpha=0.7)
     ax3.axvline(x=2070, color='gray', linestyle=':', alpha=0.5)
     ax3.set_title('③ 従属人口指数\n（年少+高齢者）/生産年齢×100', fontsize=12, fontweight='bold')
@@ -600,8 +643,8 @@ def plot_comprehensive_age_dashboard(df: pd.DataFrame) -> None:
     
     # === パネル4: 潜在扶養指数（PSR） ===
     ax4 = axes[1, 1]
-    ax4.fill_between(years, 0, df['PSR'], alpha=0.5, color=COLORS['working'])
-    ax4.plot(years, df['PSR'], color=COLORS['working'], linewidth=3)
+    ax4.fill_between(years, 0, table['PSR'], alpha=0.5, color=COLORS['working'])
+    ax4.plot(years, table['PSR'], color=COLORS['working'], linewidth=3)
     ax4.axvline(x=2024, color='purple', linestyle='--', alpha=0.7)
     ax4.axvline(x=2070, color='gray', linestyle=':', alpha=0.5)
     ax4.axhline(y=1, color='red', linestyle='--', alpha=0.7)
@@ -611,9 +654,8 @@ def plot_comprehensive_age_dashboard(df: pd.DataFrame) -> None:
     ax4.grid(True, alpha=0.3)
     
     for yr, label in [(1970, '胴上げ型'), (2024, '騎馬戦型'), (2100, '肩車型')]:
-        row = df[df['Year']==yr]
-        if len(row) > 0:
-            val = row['PSR'].values[0]
+        if yr in table:
+            val = table.at(yr, 'PSR')
             ax4.annotate(f'{yr}年: {val:.2f}人\n({label})', 
                         xy=(yr, val), xytext=(yr, val+1.8),
                         fontsize=9, ha='center',
@@ -627,10 +669,9 @@ def plot_comprehensive_age_dashboard(df: pd.DataFrame) -> None:
     plt.suptitle('日本の人口構造の大転換：年齢構成の激変（1950-2100）', 
                  fontsize=18, fontweight='bold', y=1.02)
     
-    row_2100 = df[df['Year']==2100]
-    total_pop_2100 = row_2100['TotalPopulation'].values[0]
-    elderly_ratio_2100 = row_2100['Elderly_Ratio'].values[0]
-    psr_2100 = row_2100['PSR'].values[0]
+    total_pop_2100 = table.at(2100, 'TotalPopulation')
+    elderly_ratio_2100 = table.at(2100, 'Elderly_Ratio')
+    psr_2100 = table.at(2100, 'PSR')
     decline_rate = (12808 - total_pop_2100) / 12808 * 100
     
     source_text = (
@@ -651,7 +692,41 @@ def plot_comprehensive_age_dashboard(df: pd.DataFrame) -> None:
     plt.close()
 
 
-def save_extended_data_csv(df: pd.DataFrame) -> None:
+def plot_growth_matrix(df: PopulationTable | pd.DataFrame,
+                       columns: tuple[str, ...] = ('TotalPopulation', 'Working_15_64', 'Elderly_65plus')) -> None:
+    """
+    全期間ペア（開始年 × 終了年）の年平均増減率（CAGR）ヒートマップ
+
+    データの年次は不均等（5年・1年刻みが混在）なので、セルは実際の年に合わせて描画する
+    """
+    frame = as_table(df).to_frame()
+    matrices = growth_matrices(frame, list(columns))
+    years = frame['Year'].to_numpy()
+    titles = {'TotalPopulation': '総人口', 'Working_15_64': '生産年齢人口（15-64歳）',
+              'Elderly_65plus': '高齢者人口（65歳以上）'}
+
+    fig, axes = plt.subplots(1, len(columns), figsize=(7 * len(columns), 6.5))
+    limit = max(np.nanmax(np.abs(m.to_numpy())) for m in matrices.values()) * 100
+    for ax, col in zip(np.atleast_1d(axes), columns):
+        mesh = ax.pcolormesh(years, years, matrices[col].to_numpy() * 100, shading='nearest',
+                             cmap='RdBu', vmin=-limit, vmax=limit)
+        ax.axvline(x=2024, color='purple', linestyle='--', alpha=0.7)
+        ax.axhline(y=2024, color='purple', linestyle='--', alpha=0.7)
+        ax.set_title(titles.get(col, col), fontsize=12, fontweight='bold')
+        ax.set_xlabel('終了年', fontsize=10)
+        ax.set_ylabel('開始年', fontsize=10)
+        ax.set_aspect('equal')
+    fig.colorbar(mesh, ax=axes, shrink=0.8, label='年平均増減率（%）')
+    fig.suptitle('全期間ペアの年平均増減率（CAGR、開始年 → 終了年）', fontsize=14, fontweight='bold')
+
+    outpath = OUTDIR / "12_population_growth_matrix.png"
+    plt.savefig(outpath, dpi=150, bbox_inches='tight')
+    print(f"[SAVED] {outpath}")
+    plt.close()
+
+
+def save_extended_data_csv(df: pd.DataFrame,
+                           filename: str = "japan_population_age_projection_2100_v3.csv") -> None:
     """
     拡張データをCSVで保存
     """
@@ -669,7 +744,7 @@ def save_extended_data_csv(df: pd.DataFrame) -> None:
         'Young_Dependency', 'Old_Dependency', 'Total_Dependency', 'PSR_Workers_per_Elderly'
     ]
     
-    outpath = OUTDIR / "japan_population_age_projection_2100_v3.csv"
+    outpath = OUTDIR / filename
     output_df.to_csv(outpath, index=False, encoding='utf-8-sig', float_format='%.2f')
     print(f"[SAVED] {outpath}")
 
@@ -776,6 +851,7 @@ if __name__ == "__main__":
     
     # データ作成
     df = create_population_data()
+    table = PopulationTable.from_frame(df)
     print(f"\n[DATA] {len(df)} years of data loaded (1950-2100)")
     
     # 2021-2024が含まれていることを確認
@@ -786,9 +862,8 @@ if __name__ == "__main__":
     print("\n[CHECK] 総人口と年齢3区分合計の差異（万人）:")
     check_years = [1955, 1960, 1965, 1970, 2010, 2020, 2070, 2100]
     for yr in check_years:
-        row = df[df['Year']==yr]
-        if len(row) > 0:
-            diff = row['Age_Unknown'].values[0]
+        if yr in table:
+            diff = table.at(yr, 'Age_Unknown')
             print(f"  {yr}年: {diff:+.0f}")
     
     # 主要年のデータを表示
@@ -802,22 +877,125 @@ if __name__ == "__main__":
     # 2070年と2100年の検証
     print("\n【検証】主要指標:")
     for yr in [2070, 2100]:
-        row = df[df['Year']==yr]
         print(f"\n{yr}年:")
-        print(f"  総人口: {row['TotalPopulation'].values[0]:,.0f}万人")
-        print(f"  高齢化率: {row['Elderly_Ratio'].values[0]:.2f}%")
-        print(f"  PSR（潜在扶養指数）: {row['PSR'].values[0]:.2f}人")
-    
+        print(f"  総人口: {table.at(yr, 'TotalPopulation'):,.0f}万人")
+        print(f"  高齢化率: {table.at(yr, 'Elderly_Ratio'):.2f}%")
+        print(f"  PSR（潜在扶養指数）: {table.at(yr, 'PSR'):.2f}人")
+
+    # コーホート要因法エンジンとの比較（既定仮定）
+    cohort = PopulationTable.from_frame(create_population_data(projection="cohort"))
+    print("\n【参考】コーホート要因法エンジン（既定仮定）:")
+    for yr in [2070, 2100]:
+        print(f"  {yr}年: 総人口 {cohort.at(yr, 'TotalPopulation'):,.0f}万人 / "
+              f"高齢化率 {cohort.at(yr, 'Elderly_Ratio'):.2f}% / PSR {cohort.at(yr, 'PSR'):.2f}人")
+
+    # 平均余命（エンジンの死亡率仮定による生命表）
+    e_years = np.array([2025, 2050, 2070, 2100])
+    life_expectancy = life_expectancy_frame(e_years, life_table(mortality_rates(e_years)))
+    print("\n【参考】平均余命（エンジンの死亡率仮定）:")
+    print(life_expectancy.round(2).to_string(index=False))
+
+    # 世帯数（世帯主率法、エンジンの各歳・男女別人口に適用）
+    cohort_result, households = default_households()
+    household_summary = household_frame(cohort_result.years, cohort_result.population, households)
+    print("\n【参考】世帯数の推計（万世帯）:")
+    print(household_summary[household_summary['Year'].isin([2025, 2050, 2070, 2100])][[
+        'Year', 'Households_Total', 'Households_単独', 'OnePerson_Share',
+        'Elderly_Householder_Share', 'Persons_per_Household'
+    ]].round(2).to_string(index=False))
+
+    # 労働力人口・就業者数（労働力率シナリオ × エンジンの各歳・男女別人口）
+    labour = labour_force_projection()
+    print("\n【参考】労働力人口・就業者数（万人）:")
+    print(labour[labour['Year'].isin([2025, 2040, 2060, 2100])]
+          .pivot(index='Year', columns='Scenario', values='LabourForce')
+          [list(PARTICIPATION_SCENARIOS)].round(0).to_string())
+
+    # 出生×死亡バリアント（9通り）の一括推計 → グラフに推計幅として表示
+    variants = project_variants(ipss_variant_grid())
+    variant_bands = variant_range(variants, ['TotalPopulation', 'Elderly_Ratio',
+                                             'Total_Dependency', 'PSR'])
+    variant_bands.attrs['label'] = '出生×死亡 9仮定の幅（エンジン推計）'
+    print(f"\n[VARIANTS] {variants['Variant'].nunique()} variants projected")
+    # 幅はエンジンの仮定によるもの（社人研の公表値を再現するよう較正したものではない）
+    outside = band_coverage(variant_bands, df, ['TotalPopulation', 'PSR'])
+    if len(outside):
+        print("  ※社人研公表値が9仮定の幅の外にある年（グラフには幅の中央値を併記）:")
+        for _, r in outside[outside['Year'].isin([2050, 2070, 2100])].iterrows():
+            print(f"    {r['Year']}年 {r['Column']}: 公表値 {r['Value']:,.2f} / "
+                  f"幅 {r['Lo']:,.2f}〜{r['Hi']:,.2f}（中央値 {r['Mid']:,.2f}）")
+
+    # 確率推計（Lee–Carter型死亡率 × 確率的TFR × 確率的純移動）の分位点
+    paths = simulate_paths(n_paths=20000, seed=2026)
+    stochastic = stochastic_bands(paths)
+    stochastic.attrs['style'] = dict(alpha=0.35, hatch='//', edgecolor='white')
+    stochastic.attrs['mid_style'] = dict(linestyle=':', linewidth=2)
+    print(f"[STOCHASTIC] {paths.shape[1]:,} paths simulated")
+    outside = check_deterministic_coverage(stochastic)
+    if len(outside):
+        print(f"  [WARN] 決定論的推計が確率推計の幅の外に出る年: "
+              f"{', '.join(f'{y}年 {c}' for y, c in zip(outside['Year'], outside['Column']))}")
+    else:
+        print("  決定論的推計（既定仮定）は全年で確率推計の幅の内側")
+    for yr in [2070, 2100]:
+        row = stochastic[stochastic['Year']==yr]
+        print(f"  {yr}年 総人口 90%区間: {row['TotalPopulation_lo'].values[0]:,.0f}〜"
+              f"{row['TotalPopulation_hi'].values[0]:,.0f}万人 / "
+              f"PSR: {row['PSR_lo'].values[0]:.2f}〜{row['PSR_hi'].values[0]:.2f}人")
+
+    # 政策レバーの必要水準（ベクトル化二分法）
+    solver = PolicySolver()
+    needs = pd.concat([
+        solver.solve('net_migration', target_grid('PSR', [1.5], [2070, 2100], through=True)),
+        solver.solve('tfr', target_grid('Working_15_64', [5000], [2070, 2100])),
+    ], ignore_index=True)
+    print(f"\n[POLICY] 目標達成に必要な水準（TFR は基準年から{solver.tfr_ultimate_year}年にかけて"
+          f"必要水準へ移行、エンジンの中位仮定と同じ到達年）:")
+    for _, r in needs.iterrows():
+        cond = f"{r['Year']}年まで" if r['Through'] else f"{r['Year']}年に"
+        value = f"{r['Required']:.2f}" if r['Feasible'] else "探索範囲内で達成不可"
+        print(f"  {cond} {r['Metric']} ≥ {r['Threshold']:g}: {LEVER_LABELS[r['Lever']]} {value}")
+
     # グラフ作成
     print("\n[PLOTTING] Creating visualizations...")
-    plot_population_composition_stacked(df)
-    plot_population_ratio_trends(df)
-    plot_population_decline_impact(df)
-    plot_dependency_and_psr(df)
-    plot_comprehensive_age_dashboard(df)
+    plot_population_composition_stacked(table)
+    plot_population_ratio_trends(table, bands=variant_bands)
+    plot_population_decline_impact(table, bands=[variant_bands, stochastic])
+    plot_dependency_and_psr(table, bands=[variant_bands, stochastic])
+    plot_comprehensive_age_dashboard(table)
+    plot_growth_matrix(table)
+
+    # 高齢者人口の増減 = 総人口要因 + 高齢化率要因（全期間ペアの対数分解）
+    elderly = decomposition_matrices(df, 'Elderly_65plus',
+                                     {'総人口': 'TotalPopulation', '高齢化率': 'Elderly_Ratio'})
+    print("\n[GROWTH] 高齢者人口の年平均増減率の要因分解（%/年）:")
+    for start, end in [(1970, 2008), (2008, 2024), (2024, 2070), (2070, 2100)]:
+        parts = {k: elderly[f'{k}_contribution'].loc[start, end] * 100 for k in ('総人口', '高齢化率')}
+        print(f"  {start}→{end}: 計 {sum(parts.values()):+.2f} = "
+              + " + ".join(f"{k} {v:+.2f}" for k, v in parts.items()))
+
+    # 各年系列（財政モデル・国債分析との突合用、ピラミッドのアニメーションにも使用）
+    annual = interpolate_annual(df)
+    pyramid_years, pyramids = single_year_pyramids(annual)
+    render_pyramid_animation(pyramid_years, pyramids, COLORS, OUTDIR)
+
+    # 生産年齢の定義を変えた PSR（各歳人口の累積和から全年を一括計算）
+    # 各歳の年齢構造を持つのはコーホート要因法エンジンの推計（2025年〜）のみ。
+    # ピラミッドの2024年以前は区分内を静止人口で按分した形なので使わない
+    thresholds = AgeBands.from_result(cohort_result).threshold_table([(15, 65), (20, 70), (20, 75)])
+    print("\n[THRESHOLD] 生産年齢の定義別 PSR（人、エンジン推計の各歳人口）:")
+    print(thresholds[thresholds['Year'].isin([2025, 2050, 2070, 2100])]
+          .pivot(index='Year', columns='Working_Ages', values='PSR').round(2).to_string())
     
     # データ保存
     save_extended_data_csv(df)
+    save_extended_data_csv(annual, "japan_population_age_projection_2100_annual_v3.csv")
+    household_path = OUTDIR / HOUSEHOLDS_CSV
+    household_projection().to_csv(household_path, index=False, encoding='utf-8-sig', float_format='%.2f')
+    print(f"[SAVED] {household_path}")
+    labour_path = OUTDIR / LABOUR_FORCE_CSV
+    labour.to_csv(labour_path, index=False, encoding='utf-8-sig', float_format='%.2f')
+    print(f"[SAVED] {labour_path}")
     save_metadata()
     
     print("\n" + "=" * 60)
@@ -0,0 +1,135 @@
+# labour_force.py
+# 労働力人口・就業者数の将来推計（労働力率シナリオ × 人口エンジンの各歳・男女別人口）
+# Date: 2026-10-17
+#
+# ============================================================
+# 方法
+# ============================================================
+# - 労働力人口(シナリオ k, 年 t, 性 s, 年齢 a) = 人口(t, s, a) × 労働力率(k, t, s, a)
+# - 就業者数 = 労働力人口 × (1 - 年齢別失業率)
+# - 人口 (..., T, 2, N_AGES) と労働力率 (K, T, 2, N_AGES) を1回の broadcast で計算
+#   → (..., K, T, 2, N_AGES)（先頭の軸は人口側のバリアント）
+# - 財政モデル（税収・GDP）からは labour_force_projection() / employment_index() で参照
+#   （結果は引数ごとにキャッシュ）。メインスクリプトが LABOUR_FORCE_CSV に書き出し、
+#   Inflation_in_Japan/scenario_cube.py がそれを読んで税収基盤指数（labour 軸）を作る
+#
+# ============================================================
+# 労働力率（概算）
+# ============================================================
+# - 基準: 2023年労働力調査の男女・年齢階級別労働力率を整理した値
+# - シナリオは2040年までに目標の労働力率へ線形に移行し、以降一定
+#     現状維持       … 基準年の労働力率で一定
+#     労働参加漸進   … 女性・高齢者の参加が目標の半分まで進む
+#     労働参加進展   … 女性の M字カーブ解消・65-74歳の就労拡大
+#   （JILPT「労働力需給の推計」のシナリオ区分を参考にした概算）
+# ============================================================
+
+from __future__ import annotations
+import numpy as np
+import pandas as pd
+
+from cohort_projection import AGES, BASE_YEAR, run_default_projection
+
+PARTICIPATION_AGES = [15, 20, 25, 30, 35, 45, 55, 60, 65, 70, 75, 80, 85, 105]
+PARTICIPATION_BASE = {
+    'male':   [0.19, 0.78, 0.95, 0.96, 0.96, 0.96, 0.95, 0.88, 0.66, 0.45, 0.28, 0.16, 0.07, 0.0],
+    'female': [0.21, 0.80, 0.90, 0.84, 0.82, 0.85, 0.80, 0.66, 0.46, 0.30, 0.15, 0.08, 0.03, 0.0],
+}
+PARTICIPATION_TARGET = {
+    'male':   [0.19, 0.78, 0.95, 0.96, 0.96, 0.96, 0.96, 0.92, 0.76, 0.55, 0.33, 0.18, 0.07, 0.0],
+    'female': [0.21, 0.82, 0.93, 0.90, 0.89, 0.90, 0.86, 0.76, 0.56, 0.38, 0.19, 0.09, 0.03, 0.0],
+}
+# シナリオ名 → 目標への到達度（0 = 基準のまま、1 = PARTICIPATION_TARGET）
+PARTICIPATION_SCENARIOS = {'現状維持': 0.0, '労働参加漸進': 0.5, '労働参加進展': 1.0}
+PARTICIPATION_TARGET_YEAR = 2040
+
+# 年齢別失業率（男女共通、概算）
+UNEMPLOYMENT_POINTS = ([15, 25, 35, 55, 65, 105], [0.040, 0.035, 0.022, 0.024, 0.018, 0.018])
+
+# メインスクリプトの出力ディレクトリに書き出すファイル名（scenario_cube.py が読む）
+LABOUR_FORCE_CSV = 'japan_labour_force_projection_2100_v3.csv'
+
+_LABOUR_CACHE: dict[tuple, pd.DataFrame] = {}
+
+
+def _schedule(points: dict[str, list[float]]) -> np.ndarray:
+    """節点から各歳の率、shape = (2, N_AGES)（15歳未満は0）"""
+    rates = np.stack([np.interp(AGES, PARTICIPATION_AGES, points[s]) for s in ('male', 'female')])
+    rates[:, AGES < PARTICIPATION_AGES[0]] = 0.0
+    return rates
+
+
+def participation_rates(years: np.ndarray,
+                        scenarios: dict[str, float] = PARTICIPATION_SCENARIOS) -> np.ndarray:
+    """シナリオ別・年次別の労働力率、shape = (K, T, 2, N_AGES)"""
+    base = _schedule(PARTICIPATION_BASE)
+    target = _schedule(PARTICIPATION_TARGET)
+    ramp = np.interp(years, [BASE_YEAR, PARTICIPATION_TARGET_YEAR], [0.0, 1.0])     # (T,)
+    reach = np.array(list(scenarios.values()))                                      # (K,)
+    weight = (reach[:, None] * ramp)[..., None, None]                               # (K, T, 1, 1)
+    return base + weight * (target - base)
+
+
+def unemployment_rates() -> np.ndarray:
+    """年齢別失業率、shape = (N_AGES,)"""
+    return np.interp(AGES, *UNEMPLOYMENT_POINTS)
+
+
+def project_labour_force(population: np.ndarray, rates: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+    """
+    労働力人口と就業者数（万人）
+
+    population: (..., T, 2, N_AGES)
+    rates:      (K, T, 2, N_AGES)
+
+    Returns:
+        labour_force, employment: いずれも (..., K, T, 2, N_AGES)
+    """
+    labour_force = population[..., None, :, :, :] * rates
+    return labour_force, labour_force * (1 - unemployment_rates())
+
+
+def labour_force_projection(end_year: int = 2100,
+                            scenarios: dict[str, float] = PARTICIPATION_SCENARIOS) -> pd.DataFrame:
+    """
+    既定の人口推計に対する労働力人口・就業者数（縦持ち、キャッシュ済みのコピーを返す）
+
+    Returns:
+        Scenario, Year, Population_15plus, LabourForce, LabourForce_15_64,
+        Employment, Participation_Rate, Employment_Index（基準年=100）
+    """
+    key = (end_year, tuple(scenarios.items()))
+    cached = _LABOUR_CACHE.get(key)
+    if cached is None:
+        result = run_default_projection(end_year)
+        rates = participation_rates(result.years, scenarios)
+        labour_force, employment = project_labour_force(result.population, rates)
+
+        lf_by_age = labour_force.sum(axis=-2)                                   # (K, T, A)
+        emp_total = employment.sum(axis=(-2, -1))
+        pop15 = result.population[..., 15:].sum(axis=(-2, -1))                 # (T,)
+        names = list(scenarios)
+        n_years = len(result.years)
+        cached = pd.DataFrame({
+            'Scenario': np.repeat(names, n_years),
+            'Year': np.tile(result.years, len(names)),
+            'Population_15plus': np.tile(pop15, len(names)),
+            'LabourForce': lf_by_age.sum(axis=-1).ravel(),
+            'LabourForce_15_64': lf_by_age[..., 15:65].sum(axis=-1).ravel(),
+            'Employment': emp_total.ravel(),
+        })
+        cached['Participation_Rate'] = cached['LabourForce'] / cached['Population_15plus'] * 100
+        cached['Employment_Index'] = (emp_total / emp_total[:, :1] * 100).ravel()
+        _LABOUR_CACHE[key] = cached
+    return cached.copy()
+
+
+def employment_index(years, scenario: str = '現状維持', end_year: int = 2100) -> np.ndarray:
+    """
+    就業者数の指数（基準年=100）。税収・GDP の労働投入として使う
+
+    years: 参照する年（例: np.arange(2025, 2065, 5)）
+    """
+    df = labour_force_projection(end_year)
+    series = df[df['Scenario'] == scenario].set_index('Year')['Employment_Index']
+    return series.loc[np.asarray(years)].to_numpy()
@@ -0,0 +1,105 @@
+# life_table.py
+# 生命表の一括計算（年 × 男女 × バリアントを1回の配列演算で）
+# Date: 2026-10-17
+#
+# ============================================================
+# 定義（各歳、最終年齢は開放区間 ω+）
+# ============================================================
+# - a(x): 死亡者の平均生存年数（0歳は Andreev–Kingkade 式、1歳以上は 0.5）
+# - q(x) = m(x) / (1 + (1 - a(x))·m(x))、開放区間は q = 1
+# - l(x): 生存数（l(0) = 1）、d(x) = l(x)·q(x)
+# - L(x) = l(x+1) + a(x)·d(x)、開放区間は L = l(ω) / m(ω)
+# - T(x) = Σ_{y≥x} L(y)、e(x) = T(x) / l(x)
+#
+# ============================================================
+# 推計用の生残率（コーホート要因法）
+# ============================================================
+# - S(x) = L(x+1) / L(x)                         （x = 0 … ω-2）
+# - S(ω-1) = S(ω) = T(ω) / T(ω-1)                （ω-1歳と ω+ をまとめて ω+ へ）
+# - 出生時生残率 = L(0) / l(0)                     （年間出生が期末 0歳になる割合）
+# ============================================================
+
+from __future__ import annotations
+from dataclasses import dataclass
+import numpy as np
+import pandas as pd
+
+# 0歳の a(0)（Andreev & Kingkade 2015、m(0) < 0.0230 の低死亡率域）: (切片, 傾き)
+A0_COEFFICIENTS = {
+    'male': (0.14929, -1.99545),
+    'female': (0.14903, -2.05527),
+}
+
+
+@dataclass(frozen=True)
+class LifeTable:
+    """生命表の各列、いずれも shape = (..., N_AGES)"""
+    mx: np.ndarray
+    ax: np.ndarray
+    qx: np.ndarray
+    lx: np.ndarray
+    dx: np.ndarray
+    Lx: np.ndarray
+    Tx: np.ndarray
+    ex: np.ndarray
+
+
+def life_table(mx: np.ndarray, sexes: tuple[str, ...] = ('male', 'female')) -> LifeTable:
+    """
+    年齢別死亡率から生命表を作る
+
+    mx: (..., len(sexes), N_AGES)  最後の年齢は開放区間
+    """
+    mx = np.asarray(mx, dtype=float)
+    intercept, slope = np.array([A0_COEFFICIENTS[s] for s in sexes]).T
+    ax = np.full_like(mx, 0.5)
+    ax[..., 0] = intercept + slope * mx[..., 0]
+
+    qx = mx / (1 + (1 - ax) * mx)
+    qx[..., -1] = 1.0
+
+    lx = np.ones_like(mx)
+    np.cumprod(1 - qx[..., :-1], axis=-1, out=lx[..., 1:])
+    dx = lx * qx
+
+    Lx = np.empty_like(mx)
+    Lx[..., :-1] = lx[..., 1:] + ax[..., :-1] * dx[..., :-1]
+    Lx[..., -1] = lx[..., -1] / mx[..., -1]
+    ax[..., -1] = 1 / mx[..., -1]
+
+    Tx = np.cumsum(Lx[..., ::-1], axis=-1)[..., ::-1]
+    ex = Tx / lx
+    return LifeTable(mx=mx, ax=ax, qx=qx, lx=lx, dx=dx, Lx=Lx, Tx=Tx, ex=ex)
+
+
+def survival_ratios(table: LifeTable) -> tuple[np.ndarray, np.ndarray]:
+    """
+    生命表からコーホート要因法の生残率を求める
+
+    Returns:
+        survival: (..., N_AGES)  x歳→x+1歳（最後の2要素は ω+ への移行・残存）
+        birth_survival: (...)    出生→期末
+    """
+    Lx, Tx = table.Lx, table.Tx
+    survival = np.empty_like(Lx)
+    survival[..., :-2] = Lx[..., 1:-1] / Lx[..., :-2]
+    survival[..., -2:] = (Tx[..., -1] / Tx[..., -2])[..., None]
+    birth_survival = Lx[..., 0] / table.lx[..., 0]
+    return survival, birth_survival
+
+
+def life_expectancy_frame(years: np.ndarray, table: LifeTable,
+                          ages: tuple[int, ...] = (0, 65, 75)) -> pd.DataFrame:
+    """
+    平均余命の推移（バリアント軸のない (T, 2, N_AGES) の生命表）
+
+    Returns:
+        Year, e0_male, e0_female, e65_male, ...
+    """
+    if table.ex.ndim != 3:
+        raise ValueError("life_expectancy_frame() requires a single variant")
+    df = pd.DataFrame({'Year': np.asarray(years)})
+    for age in ages:
+        for s, sex in enumerate(('male', 'female')):
+            df[f'e{age}_{sex}'] = table.ex[:, s, age]
+    return df
@@ -0,0 +1,173 @@
+# policy_solver.py
+# 政策レバー（純移動数・合計特殊出生率）の必要水準をベクトル化二分法で求める
+# Date: 2026-10-17
+#
+# ============================================================
+# 問いの例
+# ============================================================
+# - 「2100年まで PSR ≥ 1.5 を保つには年間何万人の純移動が必要か」
+# - 「2070年に生産年齢人口 5,000万人以上を保つには TFR がいくつ必要か」
+#
+# ============================================================
+# 方法
+# ============================================================
+# - 目標（指標・閾値・年・期間全体か単年か）を並べ、二分法の区間を目標ごとに持つ
+# - 1回の反復で全目標の試行値をバッチ軸に積み、まとめて評価する
+# - 純移動数: 推計は (人口, 移動) について線形なので
+#     人口(t; m) = 人口(t; 移動0) + m × 人口(t; 基準人口0・移動1万人)
+#   の2本を最初に1回だけ推計してキャッシュし、反復では年齢区分の合計を線形結合するだけ
+# - TFR: 試行値は長期の TFR（基準年から tfr_ultimate_year まで線形に移行、以降一定）。
+#   既定の到達年はエンジンの中位仮定（cohort_projection.TFR_ULTIMATE_YEAR）と同じ
+# - TFR: 出生以外の仮定（生残率・移動）はキャッシュして使い回し、
+#   試行値ごとの出生率スケジュールだけを作り直してバッチ推計する
+# ============================================================
+
+from __future__ import annotations
+from dataclasses import dataclass
+import numpy as np
+import pandas as pd
+
+from cohort_projection import (
+    BASE_YEAR, NET_MIGRATION, TFR_START, TFR_ULTIMATE_YEAR,
+    ProjectionAssumptions, add_population_indicators, age_band_totals, base_population,
+    default_assumptions, fertility_schedule, project_cohort, tfr_path,
+)
+
+LEVERS = ('net_migration', 'tfr')
+LEVER_LABELS = {'net_migration': '純移動数（万人/年）', 'tfr': '合計特殊出生率'}
+
+
+@dataclass(frozen=True)
+class PolicyTarget:
+    """
+    目標: metric ≥ threshold
+
+    through=True なら基準年の翌年から year までの全期間、False なら year 単年で判定
+    """
+    metric: str
+    threshold: float
+    year: int
+    through: bool = False
+
+
+def target_grid(metric: str, thresholds, years, through: bool = False) -> list[PolicyTarget]:
+    """閾値 × 年の全組合せの目標"""
+    return [PolicyTarget(metric, float(th), int(yr), through) for th in thresholds for yr in years]
+
+
+def metric_paths(totals: dict[str, np.ndarray]) -> dict[str, np.ndarray]:
+    """年齢区分別人口（age_band_totals() の出力）から全指標を計算する"""
+    return add_population_indicators(dict(totals))
+
+
+class PolicySolver:
+    """
+    レバーごとに、反復間で使い回す推計状態を保持する
+
+    solver = PolicySolver(end_year=2100)
+    solver.solve('net_migration', target_grid('PSR', [1.3, 1.5], [2070, 2100], through=True))
+    """
+
+    def __init__(self, end_year: int = 2100, tfr_ultimate_year: int = TFR_ULTIMATE_YEAR,
+                 net_migration: float = NET_MIGRATION):
+        self.end_year = end_year
+        self.years = np.arange(BASE_YEAR, end_year + 1)
+        self.base = base_population()
+        self.net_migration = net_migration
+        self.tfr_ultimate_year = tfr_ultimate_year
+
+        # 純移動数レバー: 移動0の推計 + 移動1万人/年への応答（どちらも既定の出生・死亡仮定）
+        baseline = default_assumptions(end_year, net_migration=0.0)
+        unit = default_assumptions(end_year, net_migration=1.0)
+        zero = project_cohort(self.base, baseline).population
+        response = project_cohort(np.zeros_like(self.base), unit).population
+        self._migration_totals = (age_band_totals(zero), age_band_totals(response))
+
+        # TFR レバー: 出生以外の仮定を固定（既定の死亡・移動）
+        self._fixed = default_assumptions(end_year, net_migration=net_migration)
+        # 基準年の TFR から試行値へ tfr_ultimate_year までに線形に移行する重み
+        self._tfr_ramp = tfr_path(np.arange(BASE_YEAR, end_year), start=0.0, ultimate=1.0,
+                                  ultimate_year=tfr_ultimate_year)
+
+    # ---------- 試行値 → 指標 ----------
+    def _evaluate_migration(self, values: np.ndarray) -> dict[str, np.ndarray]:
+        zero, response = self._migration_totals
+        m = values[:, None]
+        return metric_paths({k: zero[k] + m * response[k] for k in zero})
+
+    def _evaluate_tfr(self, values: np.ndarray) -> dict[str, np.ndarray]:
+        tfr = TFR_START + (values[:, None] - TFR_START) * self._tfr_ramp
+        assumptions = ProjectionAssumptions(
+            fertility=fertility_schedule(tfr),                  # (K, T, A) のみ試行値ごと
+            survival=self._fixed.survival,
+            birth_survival=self._fixed.birth_survival,
+            migration=self._fixed.migration,
+        )
+        return metric_paths(age_band_totals(project_cohort(self.base, assumptions).population))
+
+    def evaluate(self, lever: str, values: np.ndarray) -> dict[str, np.ndarray]:
+        """試行値 (K,) に対する全指標の推移、各 (K, T+1)"""
+        if lever == 'net_migration':
+            return self._evaluate_migration(np.asarray(values, dtype=float))
+        if lever == 'tfr':
+            return self._evaluate_tfr(np.asarray(values, dtype=float))
+        raise ValueError(f"lever must be one of {LEVERS}: {lever!r}")
+
+    # ---------- 判定 ----------
+    def _margin(self, metrics: dict[str, np.ndarray], targets: list[PolicyTarget]) -> np.ndarray:
+        """各目標の (指標 - 閾値) の最小値（期間判定なら該当期間の最小）、shape = (K,)"""
+        end = np.array([t.year - BASE_YEAR for t in targets])
+        start = np.array([1 if t.through else t.year - BASE_YEAR for t in targets])
+        steps = np.arange(len(self.years))
+        window = (steps >= start[:, None]) & (steps <= end[:, None])       # (K, T+1)
+
+        values = np.empty((len(targets), len(self.years)))
+        for metric in {t.metric for t in targets}:
+            rows = [i for i, t in enumerate(targets) if t.metric == metric]
+            values[rows] = metrics[metric][rows]
+        threshold = np.array([t.threshold for t in targets])[:, None]
+        return np.where(window, values - threshold, np.inf).min(axis=1)
+
+    def solve(self, lever: str, targets: list[PolicyTarget],
+              bounds: tuple[float, float] | None = None, tol: float | None = None,
+              max_iter: int = 60) -> pd.DataFrame:
+        """
+        各目標を満たす最小のレバー水準（全目標を同時に二分法）
+
+        指標はレバーについて単調増加であることを前提とする。
+        下限で既に満たす目標は下限値、上限でも満たせない目標は NaN（Feasible=False）。
+        """
+        if bounds is None:
+            bounds = (0.0, 200.0) if lever == 'net_migration' else (0.5, 4.0)
+        if tol is None:
+            tol = 0.01 if lever == 'net_migration' else 0.0005
+        for t in targets:
+            if not BASE_YEAR < t.year <= self.end_year:
+                raise ValueError(f"target year must be in ({BASE_YEAR}, {self.end_year}]: {t.year}")
+
+        k = len(targets)
+        lo = np.full(k, bounds[0])
+        hi = np.full(k, bounds[1])
+        met_lo = self._margin(self.evaluate(lever, lo), targets) >= 0
+        feasible = self._margin(self.evaluate(lever, hi), targets) >= 0
+
+        active = feasible & ~met_lo
+        for _ in range(max_iter):
+            if not active.any() or (hi - lo)[active].max() < tol:
+                break
+            idx = np.flatnonzero(active)
+            mid = 0.5 * (lo[idx] + hi[idx])
+            ok = self._margin(self.evaluate(lever, mid), [targets[i] for i in idx]) >= 0
+            hi[idx[ok]] = mid[ok]
+            lo[idx[~ok]] = mid[~ok]
+
+        required = np.where(met_lo, bounds[0], np.where(feasible, hi, np.nan))
+        return pd.DataFrame({
+            'Metric': [t.metric for t in targets],
+            'Threshold': [t.threshold for t in targets],
+            'Year': [t.year for t in targets],
+            'Through': [t.through for t in targets],
+            'Lever': lever,
+            'Required': required,
+            'Feasible': feasible,
+        })
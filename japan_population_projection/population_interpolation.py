@@ -0,0 +1,78 @@
+# population_interpolation.py
+# 5年刻みの人口系列を各年系列に補間する（形状保存型の単調補間）
+# Date: 2026-10-17
+#
+# ============================================================
+# 方針
+# ============================================================
+# - create_population_data() は 2020-2024年以外が5年刻み（2008年のみ例外）
+# - 財政モデル・国債分析は各年で動くため、全列を各年に揃える
+# - 補間は PCHIP（区分3次エルミート、Fritsch–Carlson型）を全列まとめて1回で適用
+#   → 公表値の年は値がそのまま残り、区間内で行き過ぎ（オーバーシュート）が出ない
+# - 年齢3区分合計・比率・従属人口指数・PSR は補間後の人口から再計算
+#   → 補間後も「年少+生産年齢+高齢者 = Age3_Sum」などの恒等式が保たれる
+# - 結果は入力テーブルのハッシュでメモ化（他モジュールからの再呼び出しは再計算なし）
+# ============================================================
+
+from __future__ import annotations
+import hashlib
+import numpy as np
+import pandas as pd
+from scipy.interpolate import PchipInterpolator
+
+from cohort_projection import add_population_indicators
+
+# add_population_indicators() で再計算される列
+DERIVED_COLUMNS = [
+    'Age3_Sum', 'Age_Unknown',
+    'Young_Ratio', 'Working_Ratio', 'Elderly_Ratio', 'VeryOld_Ratio',
+    'Young_Dependency', 'Old_Dependency', 'Total_Dependency', 'PSR',
+]
+
+_ANNUAL_CACHE: dict[str, pd.DataFrame] = {}
+
+
+def table_hash(df: pd.DataFrame) -> str:
+    """DataFrame の内容（列名・値）から決まるハッシュ"""
+    h = hashlib.sha1()
+    h.update('\x1f'.join(map(str, df.columns)).encode('utf-8'))
+    h.update(pd.util.hash_pandas_object(df, index=False).values.tobytes())
+    return h.hexdigest()
+
+
+def interpolate_annual(df: pd.DataFrame) -> pd.DataFrame:
+    """
+    人口テーブルを各年（最初の年〜最後の年）に補間する
+
+    - 数値列はすべて PCHIP で一括補間
+    - 派生列（DERIVED_COLUMNS）は補間後の人口から再計算
+    - 同じ内容のテーブルに対する2回目以降の呼び出しはキャッシュから返す（コピー）
+    """
+    key = table_hash(df)
+    cached = _ANNUAL_CACHE.get(key)
+    if cached is None:
+        cached = _interpolate(df)
+        _ANNUAL_CACHE[key] = cached
+    return cached.copy()
+
+
+def clear_cache() -> None:
+    _ANNUAL_CACHE.clear()
+
+
+def _interpolate(df: pd.DataFrame) -> pd.DataFrame:
+    df = df.sort_values('Year')
+    years = df['Year'].to_numpy()
+    annual = np.arange(years[0], years[-1] + 1)
+
+    value_cols = [c for c in df.columns
+                  if c != 'Year' and c not in DERIVED_COLUMNS and pd.api.types.is_numeric_dtype(df[c])]
+    values = df[value_cols].to_numpy(dtype=float)
+    interpolated = PchipInterpolator(years, values, axis=0)(annual)
+
+    out = pd.DataFrame(interpolated, columns=value_cols)
+    out.insert(0, 'Year', annual)
+    if all(c in out.columns for c in ('TotalPopulation', 'Young_0_14', 'Working_15_64',
+                                      'Elderly_65plus', 'VeryOld_75plus')):
+        out = add_population_indicators(out)
+    return out
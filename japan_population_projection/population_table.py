@@ -0,0 +1,100 @@
+# population_table.py
+# 年 → 行の O(1) 索引を持つ NumPy 配列ベースの人口テーブル
+# Date: 2026-10-17
+#
+# ============================================================
+# 方針
+# ============================================================
+# - df[df['Year']==yr]['col'].values[0] のような全行スキャンを置き換える
+#   （各年データ × 多数のバリアントで二乗オーダーになるのを避ける）
+# - 列は NumPy 配列で保持し、年 → 行番号は dict で O(1) 参照
+# - 比率・従属人口指数・PSR は初回参照時に一度だけ計算してキャッシュ
+# - 基準年指数（*_Index）も (列, 基準年) ごとにキャッシュ
+# - 呼び出し元の DataFrame には一切書き戻さない
+# ============================================================
+
+from __future__ import annotations
+import numpy as np
+import pandas as pd
+
+from cohort_projection import add_population_indicators
+
+# 人口（実数）の列。これ以外の派生列は add_population_indicators() で再計算する
+COUNT_COLUMNS = ('TotalPopulation', 'Young_0_14', 'Working_15_64', 'Elderly_65plus', 'VeryOld_75plus')
+
+# 基準年指数の列名 → 元の人口列
+INDEX_COLUMNS = {
+    'Total_Index': 'TotalPopulation',
+    'Young_Index': 'Young_0_14',
+    'Working_Index': 'Working_15_64',
+    'Elderly_Index': 'Elderly_65plus',
+}
+
+
+class PopulationTable:
+    """
+    年別人口テーブル（読み取り専用）
+
+    table['PSR']            → 全年の配列
+    table.at(2070, 'PSR')   → 1値（O(1)）
+    table.index('Total_Index', base_year=2008) → 基準年=100 の指数
+    """
+    __slots__ = ('years', '_columns', '_row', '_derived', '_indices')
+
+    def __init__(self, years: np.ndarray, columns: dict[str, np.ndarray]):
+        self.years = np.asarray(years, dtype=int)
+        self._columns = {name: np.asarray(values, dtype=float) for name, values in columns.items()}
+        self._row = {int(yr): i for i, yr in enumerate(self.years)}
+        self._derived: dict[str, np.ndarray] | None = None
+        self._indices: dict[tuple[str, int], np.ndarray] = {}
+
+    @classmethod
+    def from_frame(cls, df: pd.DataFrame) -> 'PopulationTable':
+        """DataFrame の人口列（COUNT_COLUMNS）から作成（派生列は再計算）"""
+        return cls(df['Year'].to_numpy(), {c: df[c].to_numpy() for c in COUNT_COLUMNS})
+
+    def __len__(self) -> int:
+        return len(self.years)
+
+    def __contains__(self, year) -> bool:
+        return int(year) in self._row
+
+    def __getitem__(self, name: str) -> np.ndarray:
+        if name == 'Year':
+            return self.years
+        if name in self._columns:
+            return self._columns[name]
+        if name in INDEX_COLUMNS:
+            raise KeyError(f"{name} は index('{name}', base_year) で取得してください")
+        if self._derived is None:
+            self._derived = {k: v for k, v in add_population_indicators(dict(self._columns)).items()
+                             if k not in self._columns}
+        return self._derived[name]
+
+    def row(self, year: int) -> int:
+        """年 → 行番号（存在しない年は KeyError）"""
+        return self._row[int(year)]
+
+    def at(self, year: int, name: str) -> float:
+        """指定年・指定列の値"""
+        return float(self[name][self.row(year)])
+
+    def index(self, name: str, base_year: int) -> np.ndarray:
+        """基準年を100とする指数（name は INDEX_COLUMNS のキー）"""
+        key = (name, int(base_year))
+        cached = self._indices.get(key)
+        if cached is None:
+            values = self[INDEX_COLUMNS[name]]
+            cached = values / values[self.row(base_year)] * 100
+            self._indices[key] = cached
+        return cached
+
+    def to_frame(self) -> pd.DataFrame:
+        """DataFrame に戻す（人口列 + 派生列）"""
+        df = pd.DataFrame({'Year': self.years, **self._columns})
+        return add_population_indicators(df)
+
+
+def as_table(data: PopulationTable | pd.DataFrame) -> PopulationTable:
+    """DataFrame なら PopulationTable に変換、PopulationTable ならそのまま返す"""
+    return data if isinstance(data, PopulationTable) else PopulationTable.from_frame(data)
@@ -0,0 +1,246 @@
+# pyramid_animation.py
+# 人口ピラミッド（各歳・男女別）のアニメーション出力（1950-2100年）
+# Date: 2026-10-17
+#
+# ============================================================
+# 各歳データの作り方
+# ============================================================
+# - 年齢区分（0-14 / 15-64 / 65-74 / 75+）の人口は create_population_data() を
+#   各年補間（population_interpolation.interpolate_annual）したものを使う
+# - 区分内の各歳・男女別の形状:
+#     2025年以降 … コーホート要因法エンジン（既定仮定）の各歳・男女別人口
+#     2024年以前 … 各年の死亡率による静止人口 l(x)（出生性比で男女按分）
+#   ※2024年以前は年齢3区分しか持っていないため、区分内の凹凸（ベビーブーム等）は表現されない
+# - 形状は区分ごとに合計が補間値と一致するよう再スケール
+#
+# ============================================================
+# 描画
+# ============================================================
+# - 図（軸・凡例・タイトル）は各ワーカーで1回だけ描画して背景として保存
+#   （pyplot を使わず Agg キャンバスの Figure を直接作るので、呼び出し側のバックエンドは変えない）
+# - フレームごとにバーの幅・年ラベルだけを更新し、背景に重ねて描く（ブリッティング）
+# - フレームはプロセスプールに分割して描画・PNG保存し、最後に GIF / APNG にまとめる
+# ============================================================
+
+from __future__ import annotations
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+import os
+import numpy as np
+import pandas as pd
+import matplotlib
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+from matplotlib.collections import PolyCollection
+from matplotlib.figure import Figure
+from matplotlib.patches import Rectangle
+from matplotlib.ticker import FuncFormatter
+from PIL import Image
+
+from cohort_projection import (
+    AGES, BASE_YEAR, MALE, FEMALE, N_AGES, SEX_RATIO_AT_BIRTH,
+    mortality_rates, run_default_projection, survival_from_mortality,
+)
+
+# (開始年齢, 終了年齢+1, COLORS のキー)
+AGE_BANDS = [
+    (0, 15, 'young'),
+    (15, 65, 'working'),
+    (65, 75, 'elderly'),
+    (75, N_AGES, 'very_old'),
+]
+
+
+def band_targets(annual: pd.DataFrame) -> np.ndarray:
+    """AGE_BANDS の各区分の人口（万人）、shape = (Y, len(AGE_BANDS))"""
+    return np.column_stack([
+        annual['Young_0_14'],
+        annual['Working_15_64'],
+        annual['Elderly_65plus'] - annual['VeryOld_75plus'],
+        annual['VeryOld_75plus'],
+    ])
+
+
+def stationary_shape(years: np.ndarray) -> np.ndarray:
+    """各年の死亡率による静止人口（出生1あたり）、shape = (Y, 2, N_AGES)"""
+    survival, _ = survival_from_mortality(mortality_rates(years))
+    lx = np.ones_like(survival)
+    lx[..., 1:] = np.cumprod(survival[..., :-1], axis=-1)
+    male_share = SEX_RATIO_AT_BIRTH / (1 + SEX_RATIO_AT_BIRTH)
+    lx[:, MALE] *= male_share
+    lx[:, FEMALE] *= 1 - male_share
+    return lx
+
+
+def single_year_pyramids(annual: pd.DataFrame) -> tuple[np.ndarray, np.ndarray]:
+    """
+    各年の各歳・男女別人口
+
+    annual: interpolate_annual() の出力（各年）
+
+    Returns:
+        years: (Y,)
+        population: (Y, 2, N_AGES)（万人）
+    """
+    years = annual['Year'].to_numpy()
+    shape = stationary_shape(years)
+
+    projected = years >= BASE_YEAR
+    if projected.any():
+        result = run_default_projection(end_year=int(years.max()))
+        shape[projected] = result.population[years[projected] - BASE_YEAR]
+
+    targets = band_targets(annual)
+    population = np.empty_like(shape)
+    for b, (lo, hi, _) in enumerate(AGE_BANDS):
+        block = shape[..., lo:hi]
+        population[..., lo:hi] = block * (targets[:, b] / block.sum(axis=(-2, -1)))[:, None, None]
+    return years, population
+
+
+# =========================
+# 描画（ワーカー側）
+# =========================
+_FRAME = {}
+
+
+def _init_renderer(years: np.ndarray, population: np.ndarray, colors: dict,
+                   rc: dict, frame_dir: Path) -> None:
+    """ワーカーごとに図を1回だけ作り、背景（静的部分）を保存する（Agg キャンバスに直接描画）"""
+    matplotlib.rcParams.update(rc)
+    fig = Figure(figsize=(9, 9), dpi=100)
+    FigureCanvasAgg(fig)
+    ax = fig.add_subplot()
+
+    # 各歳のバーは1つの PolyCollection（頂点を毎フレーム書き換え、描画は1回）
+    bar_colors = np.empty(N_AGES, dtype=object)
+    for lo, hi, key in AGE_BANDS:
+        bar_colors[lo:hi] = colors[key]
+    verts = np.zeros((N_AGES, 4, 2))
+    verts[:, :, 1] = AGES[:, None] + np.array([-0.5, -0.5, 0.5, 0.5])
+    male = PolyCollection(verts.copy(), facecolors=list(bar_colors), alpha=0.85,
+                          edgecolors='none', animated=True)
+    female = PolyCollection(verts.copy(), facecolors=list(bar_colors), alpha=0.6,
+                            edgecolors='none', animated=True)
+    ax.add_collection(male)
+    ax.add_collection(female)
+
+    xmax = np.ceil(population.max() / 5) * 5
+    ax.set_xlim(-xmax, xmax)
+    ax.set_ylim(-0.5, N_AGES - 0.5)
+    ax.xaxis.set_major_formatter(FuncFormatter(lambda x, p: f'{abs(x):.0f}'))
+    ax.axvline(0, color='black', linewidth=0.8)
+    for age in (15, 65, 75):
+        ax.axhline(age - 0.5, color='gray', linestyle=':', linewidth=1, alpha=0.6)
+    ax.text(-xmax * 0.95, N_AGES - 4, '男性', fontsize=14, fontweight='bold')
+    ax.text(xmax * 0.95, N_AGES - 4, '女性', fontsize=14, fontweight='bold', ha='right')
+    ax.set_xlabel('人口（万人）', fontsize=12)
+    ax.set_ylabel('年齢（105歳以上は一括）', fontsize=12)
+    ax.set_title('日本の人口ピラミッド（各歳・男女別）', fontsize=15, fontweight='bold')
+    legend = ax.legend(handles=[Rectangle((0, 0), 1, 1, color=colors[key]) for _, _, key in AGE_BANDS],
+              labels=['0-14歳', '15-64歳', '65-74歳', '75歳以上'],
+              loc='lower right', fontsize=10, framealpha=0.9)
+    legend.set_animated(True)   # バーより前面に描くため毎フレーム描画
+    ax.grid(True, axis='x', alpha=0.3)
+
+    year_text = ax.text(0.02, 0.90, '', transform=ax.transAxes, fontsize=28,
+                        fontweight='bold', animated=True)
+    info_text = ax.text(0.02, 0.78, '', transform=ax.transAxes, fontsize=11,
+                        va='top', animated=True,
+                        bbox=dict(boxstyle='round', facecolor='white', alpha=0.8))
+    fig.text(0.5, 0.005, '1950-2024: 実績（区分内は静止人口で按分） / 2025-2100: 社人研推計の区分人口 × コーホート要因法の年齢構造',
+             fontsize=8, color='gray', ha='center')
+
+    fig.canvas.draw()
+    _FRAME.update(
+        fig=fig, ax=ax, male=male, female=female, verts=verts,
+        legend=legend, year_text=year_text, info_text=info_text,
+        background=fig.canvas.copy_from_bbox(fig.bbox),
+        years=years, population=population, frame_dir=frame_dir,
+    )
+
+
+def _render(i: int) -> Image.Image:
+    """背景を復元し、バー幅とラベルだけ描き直す"""
+    f = _FRAME
+    canvas = f['fig'].canvas
+    pop = f['population'][i]
+    canvas.restore_region(f['background'])
+
+    for bars, widths in ((f['male'], -pop[MALE]), (f['female'], pop[FEMALE])):
+        verts = f['verts'].copy()
+        verts[:, 1:3, 0] = widths[:, None]
+        bars.set_verts(verts)
+        f['ax'].draw_artist(bars)
+
+    by_age = pop.sum(axis=0)
+    total = by_age.sum()
+    f['year_text'].set_text(f"{f['years'][i]}年")
+    f['info_text'].set_text(
+        f'総人口 {total:,.0f}万人\n'
+        f'0-14歳 {by_age[:15].sum() / total * 100:.1f}%\n'
+        f'15-64歳 {by_age[15:65].sum() / total * 100:.1f}%\n'
+        f'65歳以上 {by_age[65:].sum() / total * 100:.1f}%'
+    )
+    for artist in (f['legend'], f['year_text'], f['info_text']):
+        f['ax'].draw_artist(artist)
+
+    return Image.fromarray(np.asarray(canvas.buffer_rgba())).convert('RGB')
+
+
+def _render_chunk(indices: list[int]) -> list[Path]:
+    paths = []
+    for i in indices:
+        path = _FRAME['frame_dir'] / f"pyramid_{_FRAME['years'][i]}.png"
+        _render(i).save(path, compress_level=1)
+        paths.append(path)
+    return paths
+
+
+# =========================
+# 出力
+# =========================
+def render_pyramid_animation(years: np.ndarray, population: np.ndarray, colors: dict,
+                             outdir: Path, fps: int = 10,
+                             n_workers: int | None = None) -> dict[str, Path]:
+    """
+    人口ピラミッドのアニメーションを出力する
+
+    Returns:
+        {'gif': ..., 'apng': ..., 'frames': ...} の各パス
+    """
+    frame_dir = outdir / 'pyramid_frames'
+    frame_dir.mkdir(exist_ok=True, parents=True)
+    rc = {k: matplotlib.rcParams[k] for k in ('font.family', 'axes.unicode_minus',
+                                       'figure.facecolor', 'axes.facecolor')}
+    init_args = (years, population, colors, rc, frame_dir)
+
+    if n_workers is None:
+        n_workers = os.cpu_count() or 1
+    n_workers = max(1, min(n_workers, len(years)))
+    chunks = [list(c) for c in np.array_split(np.arange(len(years)), n_workers)]
+    if n_workers == 1:
+        _init_renderer(*init_args)
+        frame_paths = _render_chunk(chunks[0])
+    else:
+        with ProcessPoolExecutor(max_workers=n_workers, initializer=_init_renderer,
+                                 initargs=init_args) as pool:
+            frame_paths = [p for paths in pool.map(_render_chunk, chunks) for p in paths]
+
+    frames = [Image.open(p) for p in frame_paths]
+    duration = int(1000 / fps)
+    gif_path = outdir / '11_population_pyramid_animation.gif'
+    apng_path = outdir / '11_population_pyramid_animation.png'
+    # GIF は共通パレット（中間年のフレームから作成）で量子化して色のちらつきを防ぐ
+    palette = frames[len(frames) // 2].quantize(colors=128, method=Image.Quantize.MEDIANCUT)
+    gif_frames = [im.quantize(palette=palette, dither=Image.Dither.NONE) for im in frames]
+    gif_frames[0].save(gif_path, save_all=True, append_images=gif_frames[1:],
+                       duration=duration, loop=0, optimize=False)
+    frames[0].save(apng_path, save_all=True, append_images=frames[1:],
+                   duration=duration, loop=0, compress_level=1)
+    for im in frames:
+        im.close()
+
+    print(f"[SAVED] {gif_path}")
+    print(f"[SAVED] {apng_path}")
+    print(f"[SAVED] {frame_dir}/ ({len(frame_paths)} frames)")
+    return {'gif': gif_path, 'apng': apng_path, 'frames': frame_dir}
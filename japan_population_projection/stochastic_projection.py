@@ -0,0 +1,181 @@
+# stochastic_projection.py
+# 確率的人口推計（モンテカルロ）: Lee–Carter型死亡率 × 確率的TFR × 確率的純移動
+# Date: 2026-10-17
+#
+# ============================================================
+# モデル
+# ============================================================
+# - 死亡: log m(x,t) = a(x) − g·t + b(x)·k(t)
+#     a(x) = 基準年の死亡率（cohort_projection.siler_mortality）
+#     g    = 中位仮定の年率改善（決定論的推計 mortality_rates と同じ全年齢一律の改善）
+#     b(x) = 年齢別の乖離の感応度（平均1に正規化）
+#     k(t) = ドリフトなしのランダムウォーク（中位の推移からの乖離）
+# - 出生: TFR(t) = 中位仮定の推移 + AR(1) の乖離
+# - 国際人口移動: 純移動総数 = 中位仮定 + AR(1) の乖離（年齢分布は固定）
+#
+# ============================================================
+# 実装
+# ============================================================
+# - パスはブロック単位（既定 2,000本）でベクトル化して同時に推計
+# - ブロックはプロセスプールに分散し、乱数は SeedSequence.spawn() で
+#   ブロックごとに独立・再現可能なストリームを割り当てる
+#   （ワーカー数を変えても同じ seed なら同じ結果）
+# - 3つの要因とも「中位仮定の推移 + 平均0の乖離」なので、分位点の中央値は
+#   既定仮定による決定論的推計（run_default_projection）の近くに来る
+#   （check_deterministic_coverage() で決定論的推計が幅に収まることを確認する）
+# - 出力は各年の分位点（plot_* の bands 引数に渡す形式）
+# ============================================================
+
+from __future__ import annotations
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+import os
+import numpy as np
+import pandas as pd
+
+from cohort_projection import (
+    AGES, BASE_YEAR, band_coverage, run_default_projection, FEMALE, MALE, MORTALITY_IMPROVEMENT, NET_MIGRATION, N_AGES,
+    SEXES, SEX_RATIO_AT_BIRTH, base_population, fertility_schedule, leslie_fertility_row,
+    leslie_step, migration_profile, siler_mortality, survival_from_mortality, tfr_path,
+)
+
+# 出力する指標
+METRICS = ('TotalPopulation', 'Elderly_Ratio', 'PSR')
+
+
+@dataclass(frozen=True)
+class StochasticAssumptions:
+    """確率モデルのパラメータ"""
+    end_year: int = 2100
+    # Lee–Carter（中位の改善率 + 乖離の標準偏差）
+    mortality_improvement: float = MORTALITY_IMPROVEMENT
+    mortality_sigma: float = 0.006
+    # TFR（中位推移からの AR(1) 乖離）
+    tfr_phi: float = 0.95
+    tfr_sigma: float = 0.04
+    tfr_bounds: tuple[float, float] = (0.8, 2.2)
+    # 純移動総数（万人/年、中位からの AR(1) 乖離）
+    migration_mean: float = NET_MIGRATION
+    migration_phi: float = 0.6
+    migration_sigma: float = 5.0
+
+
+def lee_carter_sensitivity() -> np.ndarray:
+    """b(x): 若年ほど乖離が大きく高齢ほど小さい年齢プロファイル（平均1）、shape = (N_AGES,)"""
+    b = np.interp(AGES, [0, 20, 60, 80, 105], [1.5, 1.2, 1.0, 0.7, 0.3])
+    return b / b.mean()
+
+
+def simulate_block(n_paths: int, seed: np.random.SeedSequence,
+                   params: StochasticAssumptions = StochasticAssumptions()) -> np.ndarray:
+    """
+    1ブロック分のパスを同時に推計する
+
+    Returns:
+        (len(METRICS), n_paths, T+1) の配列
+    """
+    rng = np.random.default_rng(seed)
+    n_steps = params.end_year - BASE_YEAR
+    step_years = np.arange(BASE_YEAR, params.end_year)
+
+    log_a = np.log(np.stack([siler_mortality(s) for s in SEXES]))      # (2, A)
+    b = lee_carter_sensitivity()
+    tfr_median = tfr_path(step_years)
+    mig_shape = migration_profile(1.0)                                   # (2, A)
+    male_share = SEX_RATIO_AT_BIRTH / (1 + SEX_RATIO_AT_BIRTH)
+
+    # ショックは一括生成（時間 × パス）
+    eps_k = rng.standard_normal((n_steps, n_paths))
+    eps_tfr = rng.standard_normal((n_steps, n_paths))
+    eps_mig = rng.standard_normal((n_steps, n_paths))
+
+    pop = np.broadcast_to(base_population(), (n_paths, 2, N_AGES)).copy()
+    out = np.empty((len(METRICS), n_paths, n_steps + 1))
+    _record(out, 0, pop)
+
+    k = np.zeros(n_paths)
+    u_tfr = np.zeros(n_paths)
+    u_mig = np.zeros(n_paths)
+    lo, hi = params.tfr_bounds
+    for t in range(n_steps):
+        mx = np.exp(log_a - params.mortality_improvement * t + b * k[:, None, None])   # (P, 2, A)
+        survival, birth_survival = survival_from_mortality(mx)
+
+        tfr = np.clip(tfr_median[t] + u_tfr, lo, hi)
+        k_row = leslie_fertility_row(fertility_schedule(tfr), survival[:, FEMALE, :])
+        migration = (params.migration_mean + u_mig)[:, None, None] * mig_shape
+
+        pop, _ = leslie_step(pop, k_row, survival, birth_survival, migration, male_share)
+        _record(out, t + 1, pop)
+
+        k = k + params.mortality_sigma * eps_k[t]
+        u_tfr = params.tfr_phi * u_tfr + params.tfr_sigma * eps_tfr[t]
+        u_mig = params.migration_phi * u_mig + params.migration_sigma * eps_mig[t]
+
+    return out
+
+
+def _record(out: np.ndarray, t: int, pop: np.ndarray) -> None:
+    by_age = pop.sum(axis=1)
+    total = by_age.sum(axis=-1)
+    working = by_age[:, 15:65].sum(axis=-1)
+    elderly = by_age[:, 65:].sum(axis=-1)
+    out[0, :, t] = total
+    out[1, :, t] = elderly / total * 100
+    out[2, :, t] = working / elderly
+
+
+def _simulate_block_task(args):
+    return simulate_block(*args)
+
+
+def simulate_paths(n_paths: int = 20000, seed: int = 2026, block_size: int = 2000,
+                   n_workers: int | None = None,
+                   params: StochasticAssumptions = StochasticAssumptions()) -> np.ndarray:
+    """
+    モンテカルロ推計（ブロック単位でプロセスプールに分散）
+
+    Returns:
+        (len(METRICS), n_paths, T+1) の配列
+    """
+    sizes = [block_size] * (n_paths // block_size)
+    if n_paths % block_size:
+        sizes.append(n_paths % block_size)
+    seeds = np.random.SeedSequence(seed).spawn(len(sizes))
+    tasks = [(size, s, params) for size, s in zip(sizes, seeds)]
+
+    if n_workers is None:
+        n_workers = min(len(tasks), os.cpu_count() or 1)
+    if n_workers <= 1:
+        blocks = [_simulate_block_task(task) for task in tasks]
+    else:
+        with ProcessPoolExecutor(max_workers=n_workers) as pool:
+            blocks = list(pool.map(_simulate_block_task, tasks))
+
+    return np.concatenate(blocks, axis=1)
+
+
+def stochastic_bands(paths: np.ndarray, end_year: int = 2100,
+                     percentiles: tuple[float, float, float] = (5, 50, 95)) -> pd.DataFrame:
+    """
+    各年の分位点
+
+    Returns:
+        Year, {metric}_lo, {metric}_mid, {metric}_hi（plot_* の bands 引数に渡す形式）
+    """
+    q = np.percentile(paths, percentiles, axis=1)                       # (3, M, T+1)
+    bands = pd.DataFrame({'Year': np.arange(BASE_YEAR, end_year + 1)})
+    for m, metric in enumerate(METRICS):
+        for i, suffix in enumerate(('lo', 'mid', 'hi')):
+            bands[f'{metric}_{suffix}'] = q[i, m]
+    lo, _, hi = percentiles
+    bands.attrs['label'] = f'確率推計 {hi - lo:.0f}%区間（{paths.shape[1]:,}パス）'
+    return bands
+
+
+def check_deterministic_coverage(bands: pd.DataFrame, end_year: int = 2100) -> pd.DataFrame:
+    """
+    既定仮定による決定論的推計が分位点の幅 [lo, hi] の外に出る年（空なら全年で幅の内側）
+    """
+    deterministic = run_default_projection(end_year).to_frame()
+    return band_coverage(bands, deterministic, list(METRICS))